@@ -0,0 +1,130 @@
+"""
+Checks read-preference routing against a local replica set.
+
+Runs the FastAPI app in-process (via httpx's ASGI transport), records which replica set
+member served each MongoDB `find`, and verifies that anonymous public GETs are served by a
+secondary while the same GETs sent with admin credentials are served by the primary.
+
+Usage (from the backend directory):
+    pip install -r benchmarks/requirements.txt
+    docker compose -f benchmarks/replica-set/docker-compose.yml up -d --wait
+    python benchmarks/read_routing_check.py
+    python benchmarks/read_routing_check.py --mongo-url "mongodb://host1,host2,host3/?replicaSet=rs0"
+"""
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from pymongo import monitoring
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+DEFAULT_MONGO_URL = "mongodb://localhost:27117,localhost:27118,localhost:27119/?replicaSet=rs0"
+
+PUBLIC_PATHS = [
+    "/api/brands",
+    "/api/catalogs",
+    "/api/blogs",
+    "/api/blogs/read-routing-check",
+    "/api/careers",
+    "/api/company-info",
+    "/api/link-pages",
+    "/api/upi-payment-info",
+    "/api/social-media-info",
+]
+
+
+class FindRecorder(monitoring.CommandListener):
+    """Remembers the server address of every `find` sent to the checked database"""
+
+    def __init__(self, db_name: str):
+        self.db_name = db_name
+        self.addresses = []
+
+    def started(self, event):
+        if event.command_name == "find" and event.database_name == self.db_name:
+            host, port = event.connection_id
+            self.addresses.append(f"{host}:{port}")
+
+    def succeeded(self, event):
+        pass
+
+    def failed(self, event):
+        pass
+
+
+def describe(addresses) -> str:
+    return ",".join(sorted(addresses)) or "(no query)"
+
+
+async def wait_for_replication(client, path: str, timeout: float = 30.0):
+    """Poll anonymously until the seeded blog is visible through the public read path"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if (await client.get(path)).status_code == 200:
+            return
+        await asyncio.sleep(0.5)
+    sys.exit(f"{path} did not become readable within {timeout:.0f}s; is the replica set healthy?")
+
+
+async def main(args):
+    os.environ["DATA_DIR"] = tempfile.mkdtemp(prefix="miswa_routing_")
+    os.environ["DB_NAME"] = args.db_name
+    os.environ["MONGO_URL"] = args.mongo_url
+    os.environ.setdefault("MONGO_PUBLIC_READ_PREFERENCE", "secondaryPreferred")
+    recorder = FindRecorder(args.db_name)
+    # Global listeners apply to clients created afterwards, i.e. the one server.py creates on import
+    monitoring.register(recorder)
+    sys.path.insert(0, str(BACKEND_DIR))
+    import server
+    import httpx
+
+    hello = await server.client.admin.command("hello")
+    if "setName" not in hello:
+        sys.exit("MONGO_URL does not point at a replica set")
+    primary = hello["primary"]
+    secondaries = [host for host in hello.get("hosts", []) if host != primary]
+    print(f"Replica set {hello['setName']}: primary {primary}, secondaries {', '.join(secondaries) or '-'}")
+    await server.client.drop_database(args.db_name)
+
+    failures = 0
+    async with server.app.router.lifespan_context(server.app):
+        transport = httpx.ASGITransport(app=server.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://check") as client:
+            token = (await client.post("/api/admin/login", json={"username": "admin", "password": "admin123"})).json()
+            auth_headers = {"Authorization": f"Bearer {token['access_token']}"}
+            blog = {"title": "Read routing", "slug": "read-routing-check", "excerpt": "Check", "content": "Check"}
+            (await client.post("/api/blogs", json=blog, headers=auth_headers)).raise_for_status()
+            await wait_for_replication(client, "/api/blogs/read-routing-check")
+
+            print(f"\n{'path':<34} {'anonymous':<22} {'admin':<22}")
+            for path in PUBLIC_PATHS:
+                served = []
+                for headers in ({}, auth_headers):
+                    recorder.addresses.clear()
+                    response = await client.get(path, headers=headers)
+                    response.raise_for_status()
+                    served.append(set(recorder.addresses))
+                anonymous, admin = served
+                ok = bool(anonymous) and primary not in anonymous and admin == {primary}
+                failures += not ok
+                print(f"{path:<34} {describe(anonymous):<22} {describe(admin):<22} {'ok' if ok else 'FAIL'}")
+
+    await server.client.drop_database(args.db_name)
+    if failures:
+        sys.exit(f"\n{failures} route(s) not routed as expected")
+    print("\nAnonymous reads went to secondaries and admin reads to the primary")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Verify public/admin read routing against a replica set")
+    parser.add_argument("--mongo-url", default=DEFAULT_MONGO_URL, help="Replica set connection string")
+    parser.add_argument("--db-name", default="miswa_read_routing_check")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(parse_args()))
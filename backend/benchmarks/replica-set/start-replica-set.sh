@@ -0,0 +1,29 @@
+#!/bin/bash
+# Starts three mongod processes and initiates them as replica set rs0 (27117 preferred as primary)
+set -euo pipefail
+
+PORTS=(27117 27118 27119)
+
+for port in "${PORTS[@]}"; do
+  mkdir -p "/data/rs-$port"
+  mongod --replSet rs0 --port "$port" --bind_ip_all --dbpath "/data/rs-$port" \
+    --fork --logpath "/data/rs-$port.log"
+done
+
+mongosh --port 27117 --quiet --eval '
+try {
+  rs.status();
+} catch (e) {
+  rs.initiate({
+    _id: "rs0",
+    members: [
+      { _id: 0, host: "localhost:27117", priority: 2 },
+      { _id: 1, host: "localhost:27118", priority: 1 },
+      { _id: 2, host: "localhost:27119", priority: 1 },
+    ],
+  });
+}
+'
+
+# Keep the container in the foreground
+tail -F /data/rs-27117.log
@@ -0,0 +1,327 @@
+"""
+Benchmark harness for the API's hot paths.
+
+Runs the FastAPI app in-process (via httpx's ASGI transport) against either a local
+mongod or an in-memory Motor-compatible stand-in (mongomock-motor), seeds realistic
+data volumes and measures throughput and latency percentiles per scenario.
+
+Usage (from the backend directory):
+    pip install -r benchmarks/requirements.txt
+    python benchmarks/run_benchmarks.py                                  # in-memory database
+    python benchmarks/run_benchmarks.py --mongo-url mongodb://localhost:27017
+    python benchmarks/run_benchmarks.py --compare benchmarks/results/baseline.json
+
+Results are written as JSON to benchmarks/results/ so runs can be compared over time.
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime, timezone, timedelta
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+
+WORDS = (
+    "wooden toys learning kids play montessori puzzle craft premium organic cotton "
+    "growth creativity family safe gift colour shape stack sort build story"
+).split()
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words)).capitalize() + "."
+
+
+def _paragraphs(rng: random.Random, count: int) -> str:
+    return "\n\n".join(" ".join(_sentence(rng, rng.randint(8, 20)) for _ in range(5)) for _ in range(count))
+
+
+def build_seed_data(args, rng: random.Random) -> dict:
+    now = datetime.now(timezone.utc)
+    blogs = []
+    for i in range(args.blogs):
+        created = (now - timedelta(hours=i)).isoformat()
+        blogs.append({
+            "id": str(uuid.UUID(int=rng.getrandbits(128))),
+            "title": _sentence(rng, 6),
+            "slug": f"bench-post-{i}",
+            "excerpt": _sentence(rng, 25),
+            "content": _paragraphs(rng, rng.randint(4, 12)),
+            "image_url": None,
+            "author": "Miswa International",
+            "published": i % 5 != 0,
+            "created_at": created,
+            "updated_at": created,
+        })
+    inquiries = []
+    for i in range(args.inquiries):
+        inquiries.append({
+            "id": str(uuid.UUID(int=rng.getrandbits(128))),
+            "name": f"Visitor {i}",
+            "email": f"visitor{i}@example.com",
+            "phone": None,
+            "company": None,
+            "message": _sentence(rng, rng.randint(10, 60)),
+            "inquiry_type": rng.choice(["general", "wholesale", "career"]),
+            "cv_filename": None,
+            "created_at": (now - timedelta(minutes=i)).isoformat(),
+        })
+    catalogs = [{
+        "id": str(uuid.UUID(int=rng.getrandbits(128))),
+        "title": _sentence(rng, 4),
+        "description": _sentence(rng, 30),
+        "category": rng.choice(["Toys", "Clothing", "Accessories"]),
+        "pdf_url": None,
+        "image_url": None,
+        "created_at": now.isoformat(),
+    } for _ in range(args.catalogs)]
+    careers = [{
+        "id": str(uuid.UUID(int=rng.getrandbits(128))),
+        "title": _sentence(rng, 3),
+        "department": rng.choice(["Design", "Sales", "Operations"]),
+        "location": "New Delhi",
+        "type": "Full-time",
+        "description": _paragraphs(rng, 2),
+        "requirements": "\n".join(_sentence(rng, 8) for _ in range(5)),
+        "active": True,
+        "created_at": now.isoformat(),
+    } for _ in range(args.careers)]
+    return {"blogs": blogs, "inquiries": inquiries, "catalogs": catalogs, "careers": careers}
+
+
+def seed_files(server, count: int, rng: random.Random):
+    targets = [server.ASSETS_DIR, server.UPI_UPLOADS_DIR, server.UPLOADS_DIR]
+    for i in range(count):
+        directory = targets[i % len(targets)]
+        path = server.upload_path(directory, f"bench_{i}_{uuid.UUID(int=rng.getrandbits(128))}.pdf", create=True)
+        path.write_bytes(b"%PDF-1.4\n" + os.urandom(rng.randint(512, 4096)))
+
+
+async def seed_database(db, data: dict, batch_size: int = 5000):
+    for collection, docs in data.items():
+        await db[collection].delete_many({})
+        for start in range(0, len(docs), batch_size):
+            # insert copies so the in-memory backend's _id mutation does not leak back
+            await db[collection].insert_many([dict(d) for d in docs[start:start + batch_size]])
+
+
+def percentile(sorted_values, pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+async def run_scenario(client, name: str, make_request, requests: int, concurrency: int, warmup: int) -> dict:
+    for _ in range(warmup):
+        await make_request(client)
+
+    latencies = []
+    errors = 0
+    remaining = iter(range(requests))
+
+    async def worker():
+        nonlocal errors
+        for _ in remaining:
+            start = time.perf_counter()
+            response = await make_request(client)
+            latencies.append((time.perf_counter() - start) * 1000)
+            if response.status_code >= 400:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    result = {
+        "requests": len(latencies),
+        "concurrency": concurrency,
+        "errors": errors,
+        "throughput_rps": round(len(latencies) / elapsed, 2) if elapsed else 0.0,
+        "mean_ms": round(statistics.fmean(latencies), 3) if latencies else 0.0,
+        "p50_ms": round(percentile(latencies, 50), 3),
+        "p90_ms": round(percentile(latencies, 90), 3),
+        "p99_ms": round(percentile(latencies, 99), 3),
+        "max_ms": round(latencies[-1], 3) if latencies else 0.0,
+    }
+    print(f"  {name:<28} {result['throughput_rps']:>9.1f} req/s  p50 {result['p50_ms']:>8.2f}ms  "
+          f"p99 {result['p99_ms']:>8.2f}ms  errors {errors}")
+    return result
+
+
+def build_scenarios(auth_headers: dict, blog_slugs: list, rng: random.Random) -> dict:
+    cv_bytes = b"%PDF-1.4\n" + b"0" * 20_000
+
+    def get(path, headers=None):
+        async def request(client):
+            return await client.get(path, headers=headers)
+        return request
+
+    async def blog_by_slug(client):
+        return await client.get(f"/api/blogs/{rng.choice(blog_slugs)}")
+
+    async def login(client):
+        return await client.post("/api/admin/login", json={"username": "admin", "password": "admin123"})
+
+    async def submit_inquiry(client):
+        return await client.post(
+            "/api/inquiries",
+            data={
+                "name": "Bench Visitor",
+                "email": f"bench{uuid.uuid4().hex[:8]}@example.com",
+                "message": "Interested in the wholesale catalogue for the coming season.",
+                "inquiry_type": "career",
+            },
+            files={"cv_file": ("cv.pdf", cv_bytes, "application/pdf")},
+        )
+
+    return {
+        "public:brands": (get("/api/brands"), "public"),
+        "public:blogs": (get("/api/blogs?published_only=true"), "public"),
+        "public:blog_by_slug": (blog_by_slug, "public"),
+        "public:catalogs": (get("/api/catalogs"), "public"),
+        "public:careers": (get("/api/careers?active_only=true"), "public"),
+        "public:link_page": (get("/api/link-pages/mylittletales"), "public"),
+        "public:company_info": (get("/api/company-info"), "public"),
+        "auth:login": (login, "login"),
+        "write:inquiry_with_cv": (submit_inquiry, "write"),
+        "admin:inquiries_export": (get("/api/inquiries/export", auth_headers), "heavy"),
+        "admin:files": (get("/api/files", auth_headers), "heavy"),
+    }
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], cwd=BACKEND_DIR, text=True).strip()
+    except Exception:
+        return "unknown"
+
+
+def print_comparison(baseline: dict, current: dict):
+    print(f"\nComparison against {baseline.get('commit', '?')} ({baseline.get('timestamp', '?')}):")
+    for name, result in current["scenarios"].items():
+        before = baseline.get("scenarios", {}).get(name)
+        if not before:
+            continue
+        for key in ("throughput_rps", "p50_ms", "p99_ms"):
+            old, new = before[key], result[key]
+            change = ((new - old) / old * 100) if old else 0.0
+            print(f"  {name:<28} {key:<15} {old:>10.2f} -> {new:>10.2f} ({change:+.1f}%)")
+
+
+async def main(args):
+    rng = random.Random(args.seed)
+
+    # The server reads its configuration at import time, so point it at a scratch data directory first
+    data_dir = Path(args.data_dir or tempfile.mkdtemp(prefix="miswa_bench_"))
+    os.environ["DATA_DIR"] = str(data_dir)
+    os.environ["DB_NAME"] = args.db_name
+    os.environ.setdefault("CORS_ORIGINS", "*")
+    # Every benchmark request comes from one client; measure the write path, not the flood limits
+    os.environ.setdefault("INQUIRY_ADMISSION_ENABLED", "false")
+    if args.mongo_url:
+        os.environ["MONGO_URL"] = args.mongo_url
+    sys.path.insert(0, str(BACKEND_DIR))
+    import server
+    import httpx
+
+    if not args.mongo_url:
+        try:
+            from mongomock_motor import AsyncMongoMockClient
+        except ImportError:
+            sys.exit("In-memory mode needs mongomock-motor: pip install -r benchmarks/requirements.txt")
+        server.client = AsyncMongoMockClient()
+        server.db = server.client[args.db_name]
+        server.public_db = server.db
+    else:
+        await server.client.drop_database(args.db_name)
+
+    print(f"Seeding {args.blogs} blogs, {args.inquiries} inquiries, {args.catalogs} catalogs, "
+          f"{args.careers} careers and {args.files} files ({'mongod' if args.mongo_url else 'in-memory'})...")
+    data = build_seed_data(args, rng)
+    await seed_database(server.db, data)
+    seed_files(server, args.files, rng)
+    blog_slugs = [b["slug"] for b in data["blogs"] if b["published"]] or ["missing"]
+
+    budgets = {
+        "public": args.requests,
+        "login": max(1, args.requests // 20),
+        "write": max(1, args.requests // 5),
+        "heavy": max(1, args.requests // 50),
+    }
+    only = set(args.only.split(",")) if args.only else None
+
+    results = {}
+    async with server.app.router.lifespan_context(server.app):
+        transport = httpx.ASGITransport(app=server.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            token = (await client.post("/api/admin/login", json={"username": "admin", "password": "admin123"})).json()
+            auth_headers = {"Authorization": f"Bearer {token['access_token']}"}
+            print("Running scenarios:")
+            for name, (make_request, budget) in build_scenarios(auth_headers, blog_slugs, rng).items():
+                if only and not any(name.startswith(prefix) for prefix in only):
+                    continue
+                requests = budgets[budget]
+                results[name] = await run_scenario(
+                    client, name, make_request, requests,
+                    concurrency=min(args.concurrency, requests), warmup=min(args.warmup, requests),
+                )
+
+    if args.mongo_url:
+        await server.client.drop_database(args.db_name)
+
+    report = {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "backend": "mongod" if args.mongo_url else "in-memory",
+        "seed": args.seed,
+        "dataset": {
+            "blogs": args.blogs, "inquiries": args.inquiries, "catalogs": args.catalogs,
+            "careers": args.careers, "files": args.files,
+        },
+        "concurrency": args.concurrency,
+        "scenarios": results,
+    }
+    output = Path(args.output) if args.output else RESULTS_DIR / f"{datetime.now():%Y%m%d-%H%M%S}-{report['commit']}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2))
+    print(f"\nResults written to {output}")
+
+    if args.compare:
+        print_comparison(json.loads(Path(args.compare).read_text()), report)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark the Miswa API hot paths")
+    parser.add_argument("--mongo-url", help="Run against this mongod instead of the in-memory stand-in")
+    parser.add_argument("--db-name", default="miswa_bench", help="Database to seed (dropped before and after the run)")
+    parser.add_argument("--data-dir", help="DATA_DIR for uploads/assets (defaults to a temporary directory)")
+    parser.add_argument("--blogs", type=int, default=3000)
+    parser.add_argument("--inquiries", type=int, default=100_000)
+    parser.add_argument("--catalogs", type=int, default=200)
+    parser.add_argument("--careers", type=int, default=100)
+    parser.add_argument("--files", type=int, default=5000)
+    parser.add_argument("--requests", type=int, default=500, help="Requests per public scenario; other classes scale from this")
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--warmup", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--only", help="Comma-separated scenario prefixes to run, e.g. public,admin:files")
+    parser.add_argument("--output", help="Path of the JSON results file")
+    parser.add_argument("--compare", help="Previous results JSON to compare against")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(parse_args()))
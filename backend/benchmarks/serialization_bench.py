@@ -0,0 +1,99 @@
+"""
+Microbenchmark for the read-path serialization of trusted Mongo documents.
+
+Compares the per-request CPU of the previous path (convert timestamps, validate against
+response_model, serialize and encode with the json module, as FastAPI does) with the
+trusted_response() path (project onto model fields, encode once with orjson), and checks
+that both produce the same JSON.
+
+Usage (from the backend directory):
+    python benchmarks/serialization_bench.py [--docs 100] [--iterations 500]
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+
+def main(args):
+    os.environ.setdefault("DATA_DIR", tempfile.mkdtemp(prefix="miswa_bench_"))
+    sys.path.insert(0, str(BACKEND_DIR))
+    sys.path.insert(0, str(Path(__file__).resolve().parent))
+    import server
+    from fastapi.responses import JSONResponse
+    from run_benchmarks import build_seed_data
+
+    rng = random.Random(args.seed)
+    seed_args = argparse.Namespace(blogs=args.docs, inquiries=0, catalogs=args.docs, careers=args.docs)
+    data = build_seed_data(seed_args, rng)
+    link_pages = []
+    for i in range(args.docs):
+        page = server.LinkPage(
+            brand_slug=f"brand-{i}", brand_name=f"Brand {i}", tagline="Tagline", description="Description",
+            logo_url="/assets/logo.png",
+            qr_codes=[server.QRCode(title=f"QR {n}", url=f"https://example.com/{i}/{n}") for n in range(6)],
+        ).model_dump()
+        page["created_at"] = page["created_at"].isoformat()
+        page["updated_at"] = page["updated_at"].isoformat()
+        link_pages.append(page)
+
+    routes = {route.path: route for route in server.app.routes if "GET" in getattr(route, "methods", ())}
+    cases = [
+        ("/api/blogs", server.Blog, data["blogs"]),
+        ("/api/catalogs", server.Catalog, data["catalogs"]),
+        ("/api/careers", server.Career, data["careers"]),
+        ("/api/link-pages", server.LinkPage, link_pages),
+    ]
+
+    def previous_path(route, docs):
+        docs = [dict(d) for d in docs]
+        for doc in docs:
+            for key in ("created_at", "updated_at"):
+                if isinstance(doc.get(key), str):
+                    doc[key] = server.datetime.fromisoformat(doc[key])
+        # Same steps as fastapi.routing.serialize_response for a pydantic v2 response_model
+        value, errors = route.response_field.validate(docs, {}, loc=("response",))
+        if errors:
+            raise ValueError(errors)
+        return JSONResponse(route.response_field.serialize(value, by_alias=True)).body
+
+    def trusted_path(model_cls, docs):
+        return server.trusted_response(model_cls, docs).body
+
+    print(f"{'route':<20} {'before (ms/req)':>16} {'after (ms/req)':>15} {'speedup':>8}")
+    for path, model_cls, docs in cases:
+        route = routes[path]
+        before_body = previous_path(route, docs)
+        after_body = trusted_path(model_cls, docs)
+        if json.loads(before_body) != json.loads(after_body):
+            sys.exit(f"Output mismatch for {path}")
+
+        start = time.process_time()
+        for _ in range(args.iterations):
+            previous_path(route, docs)
+        before = (time.process_time() - start) / args.iterations * 1000
+
+        start = time.process_time()
+        for _ in range(args.iterations):
+            trusted_path(model_cls, docs)
+        after = (time.process_time() - start) / args.iterations * 1000
+
+        print(f"{path:<20} {before:>16.3f} {after:>15.3f} {before / after:>7.1f}x")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Compare read-path serialization CPU cost")
+    parser.add_argument("--docs", type=int, default=100, help="Documents per response (handlers cap lists at 100)")
+    parser.add_argument("--iterations", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=42)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    main(parse_args())
@@ -1,25 +1,75 @@
-from fastapi import FastAPI, APIRouter, HTTPException, UploadFile, File, Form, Depends, status
-from fastapi.responses import StreamingResponse, FileResponse
+from fastapi import FastAPI, APIRouter, HTTPException, UploadFile, File, Form, Depends, Header, Request, BackgroundTasks, status
+from fastapi.responses import StreamingResponse, FileResponse, PlainTextResponse, ORJSONResponse, Response
 from fastapi.staticfiles import StaticFiles
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.exceptions import HTTPException as StarletteHTTPException
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import monitoring, DeleteOne, ReturnDocument, UpdateOne, ReplaceOne
+from pymongo.read_preferences import Nearest, Primary, PrimaryPreferred, Secondary, SecondaryPreferred
+from pymongo.errors import BulkWriteError, DuplicateKeyError
+import bson
 import os
 import logging
 from pathlib import Path
-from pydantic import BaseModel, Field, ConfigDict, EmailStr
-from typing import List, Optional, Union
+from pydantic import BaseModel, Field, ConfigDict, EmailStr, ValidationError
+from typing import Deque, Dict, List, Optional, Tuple, Union
+from collections import OrderedDict, defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
+from contextvars import ContextVar
+import bisect
+import codecs
+import copy
+import math
+import re
+import threading
+import time
 import uuid
 from datetime import datetime, timezone, timedelta
+from email.utils import format_datetime, parsedate_to_datetime
+from urllib.parse import quote, urlparse
+import asyncio
 import aiohttp
 from bs4 import BeautifulSoup
 import io
 import csv
 import shutil
+import tarfile
+import queue
+import socket
 from jose import JWTError, jwt
 import bcrypt
 import pyotp
+import nh3
+import qrcode
+import png
+import json
+import random
+import orjson
+import gzip
+import hashlib
+import heapq
+import html
+import zlib
+
+try:
+    from pyinstrument import Profiler
+    from pyinstrument.session import Session as ProfilerSession
+    from pyinstrument.renderers import SpeedscopeRenderer, HTMLRenderer, ConsoleRenderer
+except ImportError:  # profiling is optional
+    Profiler = None
+
+try:
+    import brotli
+except ImportError:  # fall back to gzip-only compression
+    brotli = None
+
+try:
+    import pypdfium2 as pdfium
+except ImportError:  # catalog PDF previews are optional
+    pdfium = None
 
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
@@ -43,19 +93,293 @@ UPLOADS_DIR.mkdir(parents=True, exist_ok=True)
 UPI_UPLOADS_DIR = UPLOADS_BASE / "upi"
 UPI_UPLOADS_DIR.mkdir(parents=True, exist_ok=True)
 
+# Uploaded files are stored in hash-prefix subdirectories (assets/3f/asset_<uuid>.pdf with the default depth
+# of 1, i.e. 256 shards) so no directory grows without bound. URLs stay flat (/assets/<name>) and are mapped
+# to the shard on lookup; files from the old flat layout are moved by the migrate_upload_layout startup job
+# and are still found in the meantime. UPLOAD_SHARD_DEPTH=0 keeps (or migrates back to) the flat layout.
+UPLOAD_SHARD_DEPTH = max(0, min(int(os.environ.get('UPLOAD_SHARD_DEPTH', '1')), 4))
+SHARDED_UPLOAD_DIRS = (ASSETS_DIR, UPI_UPLOADS_DIR, UPLOADS_DIR)
+
+def upload_shard(filename: str) -> Tuple[str, ...]:
+    digest = hashlib.sha256(filename.encode("utf-8")).hexdigest()
+    return tuple(digest[2 * level:2 * level + 2] for level in range(UPLOAD_SHARD_DEPTH))
+
+def upload_path(directory: Path, filename: str, create: bool = False) -> Path:
+    """Where an uploaded file named filename lives under directory in the sharded layout"""
+    if not filename or Path(filename).name != filename or filename.startswith("."):
+        raise ValueError(f"Invalid upload filename: {filename!r}")
+    path = directory.joinpath(*upload_shard(filename), filename)
+    if create:
+        path.parent.mkdir(parents=True, exist_ok=True)
+    return path
+
+def find_upload(directory: Path, filename: str) -> Path:
+    """Stored location of an uploaded file, falling back to the flat layout for files not migrated yet"""
+    path = upload_path(directory, filename)
+    if UPLOAD_SHARD_DEPTH and not path.exists():
+        legacy = directory / filename
+        if legacy.exists():
+            return legacy
+    return path
+
+_UPLOAD_SHARD_DIR_RE = re.compile(r"[0-9a-f]{2}")
+
+def is_upload_shard_dir(directory: Path, path: Path) -> bool:
+    """Whether path is directory itself or a hash-prefix shard directory (up to the maximum depth) below it"""
+    parts = path.relative_to(directory).parts
+    return len(parts) <= 4 and all(_UPLOAD_SHARD_DIR_RE.fullmatch(part) for part in parts)
+
+def iter_upload_files(directory: Path):
+    """Every stored upload under directory, whichever shard (or the flat top level) it is in.
+
+    Other subdirectories are not part of the upload layout and are left alone.
+    """
+    for root, dirs, files in os.walk(directory):
+        root_path = Path(root)
+        dirs[:] = [name for name in dirs if is_upload_shard_dir(directory, root_path / name)]
+        for name in files:
+            if not name.startswith("."):
+                yield root_path / name
+
+# Pre-rendered snapshots of public pages, regenerated by the admin write handlers
+SNAPSHOTS_DIR = Path(os.environ.get("SNAPSHOTS_DIR", str(DATA_DIR / "snapshots")))
+LINK_PAGE_SNAPSHOTS_DIR = SNAPSHOTS_DIR / "link-pages"
+LINK_PAGE_SNAPSHOTS_DIR.mkdir(parents=True, exist_ok=True)
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 logger = logging.getLogger(__name__)
 
+# ==================== METRICS ====================
+
+# Per-route request metrics exposed on /metrics in Prometheus text format.
+# Metrics are kept in-process, so each uvicorn worker reports its own numbers.
+METRICS_ENABLED = os.environ.get('METRICS_ENABLED', 'true').lower() == 'true'
+# The /assets, /uploads and /snapshots mounts are excluded by default to keep the route list focused on the API
+METRICS_EXCLUDE_STATIC = os.environ.get('METRICS_EXCLUDE_STATIC', 'true').lower() == 'true'
+# Optional bearer token required to scrape /metrics
+METRICS_TOKEN = os.environ.get('METRICS_TOKEN')
+# Add a Server-Timing header with per-request DB time (visible in browser devtools)
+SERVER_TIMING_ENABLED = os.environ.get('SERVER_TIMING_ENABLED', 'false').lower() == 'true'
+
+STATIC_MOUNT_PREFIXES = ("/assets", "/uploads", "/snapshots", "/catalog-previews")
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+RESPONSE_SIZE_BUCKETS = (100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+
+class Histogram:
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # last slot is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+class MetricsRegistry:
+    """Minimal in-process counter/gauge/histogram store with a Prometheus text renderer"""
+
+    def __init__(self):
+        self._meta: Dict[str, Tuple[str, str]] = {}
+        self._values: Dict[str, dict] = defaultdict(dict)
+
+    def describe(self, name: str, metric_type: str, help_text: str):
+        self._meta[name] = (metric_type, help_text)
+
+    def inc(self, name: str, amount: float = 1, **labels):
+        key = tuple(labels.items())
+        series = self._values[name]
+        series[key] = series.get(key, 0) + amount
+
+    def set(self, name: str, value: float, **labels):
+        self._values[name][tuple(labels.items())] = value
+
+    def observe(self, name: str, value: float, buckets: Tuple[float, ...], **labels):
+        key = tuple(labels.items())
+        series = self._values[name]
+        histogram = series.get(key)
+        if histogram is None:
+            histogram = series[key] = Histogram(buckets)
+        histogram.observe(value)
+
+    @staticmethod
+    def _format_labels(labels) -> str:
+        if not labels:
+            return ""
+        parts = []
+        for key, value in labels:
+            value = str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+            parts.append(f'{key}="{value}"')
+        return "{" + ",".join(parts) + "}"
+
+    def render(self) -> str:
+        lines = []
+        for name, (metric_type, help_text) in self._meta.items():
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {metric_type}")
+            for labels, value in self._values.get(name, {}).items():
+                if isinstance(value, Histogram):
+                    cumulative = 0
+                    for bound, count in zip(value.buckets + (float("inf"),), value.counts):
+                        cumulative += count
+                        le = "+Inf" if bound == float("inf") else repr(bound)
+                        lines.append(f"{name}_bucket{self._format_labels(labels + (('le', le),))} {cumulative}")
+                    lines.append(f"{name}_sum{self._format_labels(labels)} {value.sum}")
+                    lines.append(f"{name}_count{self._format_labels(labels)} {value.count}")
+                else:
+                    lines.append(f"{name}{self._format_labels(labels)} {value}")
+        return "\n".join(lines) + "\n"
+
+metrics = MetricsRegistry()
+metrics.describe("http_requests_total", "counter", "Total HTTP requests by method, route and status code")
+metrics.describe("http_requests_in_progress", "gauge", "HTTP requests currently being served")
+metrics.describe("http_request_duration_seconds", "histogram", "HTTP request latency in seconds")
+metrics.describe("http_response_size_bytes", "histogram", "HTTP response body size in bytes")
+metrics.describe("http_request_db_calls", "histogram", "MongoDB commands issued per HTTP request")
+metrics.describe("http_request_db_time_seconds", "histogram", "Time spent in MongoDB commands per HTTP request")
+
+class RequestStats:
+    """Per-request accounting shared between the metrics middleware and the Mongo command listener"""
+    __slots__ = ("scope", "db_calls", "db_time_ms")
+
+    def __init__(self, scope):
+        self.scope = scope
+        self.db_calls = 0
+        self.db_time_ms = 0.0
+
+    @property
+    def route(self) -> str:
+        route = self.scope.get("route")
+        return route.path if route is not None and hasattr(route, "path") else "<unmatched>"
+
+# Set by MetricsMiddleware for the duration of each request. Motor copies the context into its
+# executor threads, so the command listener sees the stats object of the request that issued the command.
+request_stats_var: ContextVar[Optional[RequestStats]] = ContextVar("request_stats", default=None)
+
+# ==================== MONGO COMMAND MONITORING ====================
+
+# Commands slower than this are logged together with the shape of their filter
+MONGO_SLOW_QUERY_MS = float(os.environ.get('MONGO_SLOW_QUERY_MS', '100'))
+DB_CALL_BUCKETS = (0, 1, 2, 3, 5, 10, 25, 50, 100)
+MONGO_IGNORED_COMMANDS = {"hello", "ismaster", "isMaster", "ping", "saslStart", "saslContinue", "endSessions", "buildInfo"}
+
+metrics.describe("mongo_commands_total", "counter", "MongoDB commands by command name, collection, route and outcome")
+metrics.describe("mongo_command_duration_seconds", "histogram", "MongoDB command latency in seconds")
+metrics.describe("mongo_slow_commands_total", "counter", "MongoDB commands slower than MONGO_SLOW_QUERY_MS")
+
+def query_shape(value):
+    """Replace literal values in a filter with type placeholders so it can be logged safely"""
+    if isinstance(value, dict):
+        return {k: query_shape(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [query_shape(value[0])] if value else []
+    return f"<{type(value).__name__}>"
+
+def _command_filter(command_name: str, command: dict):
+    if command_name in ("find", "count", "distinct"):
+        return command.get("filter", command.get("query"))
+    if command_name == "findAndModify":
+        return command.get("query")
+    if command_name in ("update", "delete"):
+        ops = command.get("updates" if command_name == "update" else "deletes") or []
+        return ops[0].get("q") if ops else None
+    if command_name == "aggregate":
+        return [stage for stage in command.get("pipeline", []) if "$match" in stage]
+    return None
+
+class MongoCommandMonitor(monitoring.CommandListener):
+    """Counts and times every MongoDB command, attributing it to the request route that issued it"""
+
+    def __init__(self, registry: MetricsRegistry, slow_query_ms: float):
+        self.registry = registry
+        self.slow_query_ms = slow_query_ms
+        self._pending: Dict[Tuple[int, object], Tuple[str, dict]] = {}
+        # Listener callbacks run on Motor's executor threads
+        self._lock = threading.Lock()
+
+    def started(self, event):
+        if event.command_name in MONGO_IGNORED_COMMANDS:
+            return
+        collection = event.command.get(event.command_name)
+        if not isinstance(collection, str):
+            collection = event.command.get("collection", "")
+        self._pending[(event.request_id, event.connection_id)] = (collection, event.command)
+
+    def succeeded(self, event):
+        self._finish(event, "success")
+
+    def failed(self, event):
+        self._finish(event, "failure")
+
+    def _finish(self, event, outcome: str):
+        pending = self._pending.pop((event.request_id, event.connection_id), None)
+        if pending is None:
+            return
+        collection, command = pending
+        duration_ms = event.duration_micros / 1000
+        stats = request_stats_var.get()
+        route = stats.route if stats is not None else "<background>"
+        with self._lock:
+            if stats is not None:
+                stats.db_calls += 1
+                stats.db_time_ms += duration_ms
+            self.registry.inc("mongo_commands_total", command=event.command_name, collection=collection, route=route, outcome=outcome)
+            self.registry.observe("mongo_command_duration_seconds", duration_ms / 1000, LATENCY_BUCKETS,
+                                  command=event.command_name, collection=collection)
+            if duration_ms >= self.slow_query_ms:
+                self.registry.inc("mongo_slow_commands_total", command=event.command_name, collection=collection)
+        if duration_ms >= self.slow_query_ms:
+            logger.warning(
+                f"Slow MongoDB command: {event.command_name} on {collection} took {duration_ms:.1f}ms "
+                f"(route={route}, filter={query_shape(_command_filter(event.command_name, command))})"
+            )
+
+mongo_monitor = MongoCommandMonitor(metrics, MONGO_SLOW_QUERY_MS)
+
 # MongoDB connection
 mongo_url = os.environ.get('MONGO_URL', 'mongodb://localhost:27017')
 db_name = os.environ.get('DB_NAME', 'miswa')
 logger.info(f"Connecting to MongoDB: {mongo_url.replace(mongo_url.split('@')[-1] if '@' in mongo_url else mongo_url, '***') if '@' in mongo_url else mongo_url} | Database: {db_name}")
-client = AsyncIOMotorClient(mongo_url)
+client = AsyncIOMotorClient(mongo_url, event_listeners=[mongo_monitor])
 db = client[db_name]
 
+# Read routing: anonymous public GETs of site content may be served by secondaries, bounded by a max
+# staleness; admin requests, all writes and anything that fills a cache after a write use `db` (primary).
+MONGO_PUBLIC_READ_PREFERENCE = os.environ.get('MONGO_PUBLIC_READ_PREFERENCE', 'secondaryPreferred')
+MONGO_PUBLIC_MAX_STALENESS_SECONDS = int(os.environ.get('MONGO_PUBLIC_MAX_STALENESS_SECONDS', '90'))
+READ_PREFERENCE_MODES = {
+    "primary": Primary, "primaryPreferred": PrimaryPreferred, "secondary": Secondary,
+    "secondaryPreferred": SecondaryPreferred, "nearest": Nearest,
+}
+
+def public_read_preference():
+    mode = READ_PREFERENCE_MODES.get(MONGO_PUBLIC_READ_PREFERENCE)
+    if mode is None:
+        logger.warning(f"Unknown MONGO_PUBLIC_READ_PREFERENCE {MONGO_PUBLIC_READ_PREFERENCE!r}; public reads use the primary")
+        return Primary()
+    if mode is Primary:
+        return Primary()
+    max_staleness = MONGO_PUBLIC_MAX_STALENESS_SECONDS
+    if 0 < max_staleness < 90:
+        # The server rejects smaller bounds (heartbeat frequency plus idle write period)
+        logger.warning(f"MONGO_PUBLIC_MAX_STALENESS_SECONDS={max_staleness} is below MongoDB's minimum of 90; using 90")
+        max_staleness = 90
+    return mode(max_staleness=max_staleness if max_staleness > 0 else -1)
+
+public_db = client.get_database(db_name, read_preference=public_read_preference())
+
+def content_reads(request: Request):
+    """Database handle for a content GET: `public_db` for anonymous callers, the primary for admins.
+
+    Admin pages call the same GET endpoints right after saving, so any request carrying credentials
+    reads its own writes. This only routes reads; it does not authenticate.
+    """
+    return db if "authorization" in request.headers else public_db
+
 # JWT Configuration
 SECRET_KEY = os.environ.get('SECRET_KEY', 'your-secret-key-change-this-in-production')
 ALGORITHM = "HS256"
@@ -82,6 +406,7 @@ class Brand(BaseModel):
     logo_url: str
     image_url: Optional[str] = None
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    version: int = 0
 
 class BrandCreate(BaseModel):
     name: str
@@ -99,7 +424,12 @@ class Catalog(BaseModel):
     category: str
     pdf_url: Optional[str] = None
     image_url: Optional[str] = None
+    # Filled in by the catalog PDF pipeline; the extracted text is stored but only used for search
+    pdf_status: Optional[str] = None  # pending | ready | failed
+    pdf_preview_url: Optional[str] = None
+    pdf_page_count: Optional[int] = None
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    version: int = 0
 
 class CatalogCreate(BaseModel):
     title: str
@@ -108,6 +438,11 @@ class CatalogCreate(BaseModel):
     pdf_url: Optional[str] = None
     image_url: Optional[str] = None
 
+class BlogTocEntry(BaseModel):
+    id: str
+    text: str
+    level: int
+
 class Blog(BaseModel):
     model_config = ConfigDict(extra="ignore")
     id: str = Field(default_factory=lambda: str(uuid.uuid4()))
@@ -118,8 +453,15 @@ class Blog(BaseModel):
     image_url: Optional[str] = None
     author: str = "Miswa International"
     published: bool = True
+    # Derived from content on write (see render_blog_content)
+    content_html: Optional[str] = None
+    toc: List[BlogTocEntry] = Field(default_factory=list)
+    word_count: int = 0
+    reading_time_minutes: int = 0
+    content_render_version: int = 0
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    version: int = 0
 
 class BlogCreate(BaseModel):
     title: str
@@ -141,6 +483,7 @@ class Career(BaseModel):
     requirements: str
     active: bool = True
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    version: int = 0
 
 class CareerCreate(BaseModel):
     title: str
@@ -181,6 +524,7 @@ class CompanyInfo(BaseModel):
     email: str
     address: str
     updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    version: int = 0
 
 class CompanyInfoUpdate(BaseModel):
     about: Optional[str] = None
@@ -221,6 +565,7 @@ class LinkPage(BaseModel):
     background_image_url: Optional[str] = None
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    version: int = 0
 
 class LinkPageCreate(BaseModel):
     brand_slug: str
@@ -279,6 +624,7 @@ class UPIPaymentInfo(BaseModel):
     qr_code_url: str
     logo_url: Optional[str] = None
     updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    version: int = 0
 
 class UPIPaymentInfoUpdate(BaseModel):
     company_name: Optional[str] = None
@@ -298,10 +644,91 @@ class SocialMediaInfo(BaseModel):
     id: str = "social_media_info"
     links: List[SocialMediaLink] = Field(default_factory=list)
     updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    version: int = 0
 
 class SocialMediaInfoUpdate(BaseModel):
     links: Optional[List[SocialMediaLink]] = None
 
+# ==================== RESPONSE SERIALIZATION ====================
+
+# Public read handlers return documents straight from Mongo. Those documents were written from our own
+# models, so instead of letting FastAPI validate them against response_model and encode them with the
+# standard json module, they are projected onto the model's fields and encoded once with orjson.
+# response_model stays on the routes, so the OpenAPI schema is unchanged.
+
+def orjson_dumps(content) -> bytes:
+    # OPT_UTC_Z matches pydantic's "Z" suffix for UTC datetimes
+    return orjson.dumps(content, option=orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS)
+
+class TrustedJSONResponse(ORJSONResponse):
+    def render(self, content) -> bytes:
+        return orjson_dumps(content)
+
+_document_shapes: Dict[type, list] = {}
+
+def _document_shape(model_cls) -> list:
+    shape = _document_shapes.get(model_cls)
+    if shape is None:
+        shape = []
+        for name, field in model_cls.model_fields.items():
+            # Resolve each optional field's default once; mutable defaults get a per-document copy via a factory
+            factory, default = None, None
+            if field.default_factory is not None:
+                factory = field.default_factory
+            elif isinstance(field.default, (list, dict, set)):
+                factory = lambda value=field.default: copy.deepcopy(value)
+            else:
+                default = field.default
+            shape.append((name, field.annotation is datetime, field.is_required(), factory, default))
+        _document_shapes[model_cls] = shape
+    return shape
+
+def dump_trusted(model_cls, doc: dict) -> dict:
+    """Project a stored document onto model_cls's fields (filling defaults) without validation"""
+    out = {}
+    for name, is_datetime, required, factory, default in _document_shape(model_cls):
+        if name in doc:
+            value = doc[name]
+            # Timestamps are stored as UTC isoformat strings; emit them the way pydantic serializes datetimes
+            if is_datetime and isinstance(value, str) and value.endswith("+00:00"):
+                value = value[:-6] + "Z"
+            out[name] = value
+        elif not required:
+            out[name] = factory() if factory is not None else default
+    return out
+
+def trusted_response(model_cls, docs: Union[dict, List[dict]]) -> TrustedJSONResponse:
+    """Build a response for trusted DB document(s) matching what response_model=model_cls would produce"""
+    if isinstance(docs, list):
+        return TrustedJSONResponse([dump_trusted(model_cls, doc) for doc in docs])
+    return TrustedJSONResponse(dump_trusted(model_cls, docs))
+
+class BytesLRUCache:
+    """LRU of byte strings bounded by their total size"""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._entries: "OrderedDict[object, bytes]" = OrderedDict()
+
+    def get(self, key):
+        value = self._entries.get(key)
+        if value is not None:
+            self._entries.move_to_end(key)
+        return value
+
+    def put(self, key, value: bytes):
+        if len(value) > self.max_bytes:
+            return
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self.size -= len(old)
+        self._entries[key] = value
+        self.size += len(value)
+        while self.size > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self.size -= len(evicted)
+
 # ==================== AUTHENTICATION MODELS ====================
 
 class AdminUser(BaseModel):
@@ -520,15 +947,370 @@ async def change_admin_password(payload: AdminChangePassword, current_admin: dic
         raise HTTPException(status_code=404, detail="Admin not found")
     return {"message": "Password updated successfully"}
 
+# ==================== OPTIMISTIC CONCURRENCY ====================
+
+# Editable documents carry a version that every update increments. Admin PUTs may send it back in
+# If-Match; the update then only applies if nobody else has written in between, otherwise 409.
+
+def parse_if_match(if_match: Optional[str]) -> Optional[int]:
+    """Expected version from an If-Match header ('3', '"3"' or 'W/"3"'); None when absent or '*'"""
+    if if_match is None or if_match.strip() == "*":
+        return None
+    value = if_match.strip()
+    if value.startswith("W/"):
+        value = value[2:]
+    try:
+        return int(value.strip('"'))
+    except ValueError:
+        raise HTTPException(status_code=400, detail="If-Match must be a document version")
+
+async def versioned_update(collection, query: dict, update_set: dict, if_match: Optional[str], not_found: str, upsert: bool = False) -> dict:
+    """Apply $set and bump version in one find_one_and_update, honouring If-Match; returns the updated document"""
+    expected = parse_if_match(if_match)
+    update_filter = dict(query)
+    if expected is not None:
+        # Documents written before versioning have no field and count as version 0
+        update_filter["version"] = {"$in": [0, None]} if expected == 0 else expected
+    try:
+        updated = await collection.find_one_and_update(
+            update_filter,
+            {"$set": update_set, "$inc": {"version": 1}},
+            projection={"_id": 0},
+            return_document=ReturnDocument.AFTER,
+            upsert=upsert and not expected,
+        )
+    except DuplicateKeyError:
+        # Upsert lost a race with a concurrent write of the same singleton document
+        updated = None
+    if updated is None:
+        current = await collection.find_one(query, {"_id": 0, "version": 1})
+        if current is not None:
+            raise HTTPException(
+                status_code=409,
+                detail="This item was changed by someone else; reload it and try again",
+                headers={"ETag": f'"{current.get("version", 0)}"'}
+            )
+        raise HTTPException(status_code=404, detail=not_found)
+    return updated
+
+def versioned_response(model_cls, doc: dict) -> TrustedJSONResponse:
+    response = trusted_response(model_cls, doc)
+    response.headers["ETag"] = f'"{doc.get("version", 0)}"'
+    return response
+
+@app.on_event("startup")
+async def ensure_singleton_indexes():
+    # Lets concurrent upserts of the settings documents fail instead of inserting duplicates
+    for collection in (db.company_info, db.upi_payment_info, db.social_media_info):
+        try:
+            await collection.create_index("id", unique=True)
+        except Exception as e:
+            logger.error(f"Could not create unique index on {collection.name}.id: {e}")
+
+# ==================== JOB SCHEDULER ====================
+
+# Maintenance jobs run in-process on every instance, but each due run is claimed through a lease document
+# in `job_leases` (next due time plus lease expiry), so only one instance runs it. Runs are recorded in
+# `job_runs`. Sections register their jobs with scheduler.add(); the scheduler starts at startup.
+SCHEDULER_ENABLED = os.environ.get('SCHEDULER_ENABLED', 'true').lower() == 'true'
+JOB_HISTORY_LIMIT = int(os.environ.get('JOB_HISTORY_LIMIT', '50'))
+JOB_LEASE_MARGIN_SECONDS = 60  # lease outlives the job timeout by this much before another instance may take over
+JOB_RETRY_SECONDS = 30  # wait after a failed claim or a lease-store error before checking again
+JOB_DURATION_BUCKETS = (0.1, 0.5, 1.0, 5.0, 15.0, 60.0, 300.0, 900.0, 3600.0)
+INSTANCE_ID = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+
+metrics.describe("job_runs_total", "counter", "Scheduled job runs by job and outcome")
+metrics.describe("job_duration_seconds", "histogram", "Scheduled job run duration in seconds")
+
+_INTERVAL_RE = re.compile(r"^every\s+(\d+(?:\.\d+)?)\s*([smhd])$")
+_INTERVAL_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+
+class IntervalSchedule:
+    def __init__(self, seconds: float):
+        self.seconds = seconds
+
+    def next_after(self, moment: datetime) -> datetime:
+        return moment + timedelta(seconds=self.seconds)
+
+class CronSchedule:
+    """Five-field cron expression (minute hour day-of-month month day-of-week), evaluated in UTC"""
+
+    FIELDS = ((0, 59), (0, 23), (1, 31), (1, 12), (0, 7))
+
+    def __init__(self, spec: str):
+        fields = spec.split()
+        if len(fields) != 5:
+            raise ValueError(f"Cron expression needs 5 fields: {spec!r}")
+        self.spec = spec
+        self.minutes, self.hours, self.days, self.months, weekdays = (
+            self._parse(field, low, high) for field, (low, high) in zip(fields, self.FIELDS)
+        )
+        self.weekdays = {0 if day == 7 else day for day in weekdays}  # 0 and 7 are both Sunday
+        self.any_day, self.any_weekday = fields[2] == "*", fields[4] == "*"
+
+    @staticmethod
+    def _parse(field: str, low: int, high: int) -> set:
+        values = set()
+        for part in field.split(","):
+            span, _, step = part.partition("/")
+            if span == "*":
+                start, end = low, high
+            elif "-" in span:
+                start, end = (int(v) for v in span.split("-", 1))
+            else:
+                start = int(span)
+                end = high if step else start
+            step = int(step) if step else 1
+            if not low <= start <= end <= high or step < 1:
+                raise ValueError(f"Invalid cron field {field!r}")
+            values.update(range(start, end + 1, step))
+        return values
+
+    def _day_matches(self, moment: datetime) -> bool:
+        # Standard cron: when both day fields are restricted, either one matching is enough
+        in_month = moment.day in self.days
+        in_week = (moment.weekday() + 1) % 7 in self.weekdays
+        if self.any_day or self.any_weekday:
+            return in_month and in_week
+        return in_month or in_week
+
+    def next_after(self, moment: datetime) -> datetime:
+        t = moment.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = t + timedelta(days=366 * 5)
+        while t < limit:
+            if t.month not in self.months:
+                t = (t.replace(day=1, hour=0, minute=0) + timedelta(days=32)).replace(day=1)
+            elif not self._day_matches(t):
+                t = t.replace(hour=0, minute=0) + timedelta(days=1)
+            elif t.hour not in self.hours:
+                t = t.replace(minute=0) + timedelta(hours=1)
+            elif t.minute not in self.minutes:
+                t += timedelta(minutes=1)
+            else:
+                return t
+        raise ValueError(f"Cron expression never matches: {self.spec!r}")
+
+def parse_schedule(spec: Optional[str]) -> Optional[Union[IntervalSchedule, CronSchedule]]:
+    """'every 30s|15m|6h|1d', a 5-field cron expression, or empty for a job that only runs at startup"""
+    if not spec:
+        return None
+    match = _INTERVAL_RE.match(spec.strip().lower())
+    if match:
+        return IntervalSchedule(float(match.group(1)) * _INTERVAL_UNITS[match.group(2)])
+    return CronSchedule(spec)
+
+class ScheduledJob:
+    def __init__(self, name: str, func, schedule: Optional[str], timeout_seconds: float, jitter_seconds: float,
+                 before_serving: bool, description: str):
+        self.name = name
+        self.func = func
+        self.spec = schedule or "startup"
+        self.schedule = parse_schedule(schedule)
+        self.timeout_seconds = timeout_seconds
+        self.jitter_seconds = jitter_seconds
+        self.before_serving = before_serving
+        self.description = description
+
+class JobRun(BaseModel):
+    id: str
+    job: str
+    instance: str
+    started_at: datetime
+    finished_at: datetime
+    duration_seconds: float
+    status: str  # ok | failed | timeout
+    error: Optional[str] = None
+    result: Optional[dict] = None
+
+class JobStatus(BaseModel):
+    name: str
+    description: str
+    schedule: str
+    timeout_seconds: float
+    jitter_seconds: float
+    next_run_at: Optional[datetime] = None
+    running_on: Optional[str] = None
+    last_run: Optional[JobRun] = None
+    failures: int = 0  # within the returned history
+    avg_duration_seconds: Optional[float] = None
+    max_duration_seconds: Optional[float] = None
+    recent_runs: List[JobRun] = []
+
+class JobScheduler:
+    def __init__(self):
+        self.jobs: Dict[str, ScheduledJob] = {}
+        self._tasks: List[asyncio.Task] = []
+
+    def add(self, name: str, func, schedule: Optional[str] = None, timeout_seconds: float = 300,
+            jitter_seconds: float = 0, before_serving: bool = False, description: str = ""):
+        """Register an async job; jobs without a schedule run once per process start"""
+        self.jobs[name] = ScheduledJob(name, func, schedule, timeout_seconds, jitter_seconds, before_serving, description)
+
+    async def start(self):
+        await db.job_runs.create_index([("job", 1), ("started_at", -1)])
+        for job in self.jobs.values():
+            if job.schedule is None and job.before_serving:
+                await self.run(job, force=True)
+            elif job.schedule is None:
+                self._tasks.append(asyncio.create_task(self.run(job, force=True)))
+            elif SCHEDULER_ENABLED:
+                self._tasks.append(asyncio.create_task(self._loop(job)))
+
+    async def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def _loop(self, job: ScheduledJob):
+        while True:
+            try:
+                state = await db.job_leases.find_one({"_id": job.name}) or {}
+                now = datetime.now(timezone.utc)
+                due = _as_utc(state.get("next_run_at"))
+                if due is None:
+                    # Never run anywhere: interval jobs are due now, cron jobs at their next slot
+                    due = now if isinstance(job.schedule, IntervalSchedule) else job.schedule.next_after(now)
+                delay = max(0.0, (due - now).total_seconds()) + random.uniform(0, job.jitter_seconds)
+                await asyncio.sleep(delay)
+                if not await self.run(job):
+                    await asyncio.sleep(JOB_RETRY_SECONDS)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Scheduler loop for {job.name} failed: {e}")
+                await asyncio.sleep(JOB_RETRY_SECONDS)
+
+    async def claim(self, job: ScheduledJob, force: bool = False) -> bool:
+        """Take the job's lease if no other instance holds it (and, unless forced, the job is due)"""
+        now = datetime.now(timezone.utc)
+        lease_free = {"$or": [{"lease_expires_at": {"$lte": now}}, {"lease_expires_at": None}]}
+        claim = {
+            "owner": INSTANCE_ID,
+            "lease_expires_at": now + timedelta(seconds=job.timeout_seconds + JOB_LEASE_MARGIN_SECONDS),
+        }
+        if force:
+            query = {"_id": job.name, **lease_free}
+        else:
+            query = {"_id": job.name, "$and": [lease_free, {"$or": [{"next_run_at": {"$lte": now}}, {"next_run_at": None}]}]}
+            # Moving next_run_at on claim keeps the other instances asleep while this one runs
+            claim["next_run_at"] = job.schedule.next_after(now)
+        try:
+            await db.job_leases.update_one(query, {"$set": claim}, upsert=True)
+        except DuplicateKeyError:
+            # The lease document exists but did not match: held elsewhere or not due
+            return False
+        return True
+
+    def execute_in_background(self, job: ScheduledJob) -> asyncio.Task:
+        """Execute a claimed job without waiting for it; stop() cancels it like the scheduled runs"""
+        task = asyncio.create_task(self.execute(job))
+        self._tasks.append(task)
+        task.add_done_callback(lambda done: done in self._tasks and self._tasks.remove(done))
+        return task
+
+    async def run(self, job: ScheduledJob, force: bool = False) -> bool:
+        if not await self.claim(job, force):
+            return False
+        await self.execute(job)
+        return True
+
+    async def execute(self, job: ScheduledJob) -> JobRun:
+        """Run a claimed job with its timeout, record the run and release the lease"""
+        started = datetime.now(timezone.utc)
+        start = time.perf_counter()
+        status, error, result = "ok", None, None
+        try:
+            result = await asyncio.wait_for(job.func(), timeout=job.timeout_seconds)
+        except asyncio.TimeoutError:
+            status, error = "timeout", f"Timed out after {job.timeout_seconds:g}s"
+        except Exception as e:
+            status, error = "failed", str(e) or type(e).__name__
+        except asyncio.CancelledError:
+            # Shutting down mid-run: hand the lease back so another instance need not wait for it to expire
+            try:
+                await db.job_leases.update_one(
+                    {"_id": job.name, "owner": INSTANCE_ID},
+                    {"$set": {"lease_expires_at": datetime.now(timezone.utc)}}
+                )
+            except Exception as e:
+                logger.error(f"Could not release lease of cancelled job {job.name}: {e}")
+            raise
+        duration = time.perf_counter() - start
+        run = JobRun(
+            id=str(uuid.uuid4()), job=job.name, instance=INSTANCE_ID, started_at=started,
+            finished_at=datetime.now(timezone.utc), duration_seconds=round(duration, 3), status=status,
+            error=error, result=result if isinstance(result, dict) else None,
+        )
+        metrics.inc("job_runs_total", job=job.name, status=status)
+        metrics.observe("job_duration_seconds", duration, JOB_DURATION_BUCKETS, job=job.name)
+        if status == "ok":
+            logger.info(f"Job {job.name} finished in {duration:.2f}s")
+        else:
+            logger.error(f"Job {job.name} {status} after {duration:.2f}s: {error}")
+        try:
+            run_doc = run.model_dump()
+            await db.job_runs.insert_one(dict(run_doc))
+            await db.job_leases.update_one(
+                {"_id": job.name, "owner": INSTANCE_ID},
+                {"$set": {"lease_expires_at": run.finished_at, "last_run": run_doc}}
+            )
+            stale = await db.job_runs.find({"job": job.name}, {"_id": 1}).sort("started_at", -1).skip(JOB_HISTORY_LIMIT).to_list(None)
+            if stale:
+                await db.job_runs.delete_many({"_id": {"$in": [doc["_id"] for doc in stale]}})
+        except Exception as e:
+            logger.error(f"Could not record run of job {job.name}: {e}")
+        return run
+
+    async def status(self, history: int) -> List[JobStatus]:
+        leases = {doc["_id"]: doc for doc in await db.job_leases.find({"_id": {"$in": list(self.jobs)}}).to_list(None)}
+        now = datetime.now(timezone.utc)
+        statuses = []
+        for job in self.jobs.values():
+            lease = leases.get(job.name, {})
+            runs = [
+                JobRun(**doc) for doc in
+                await db.job_runs.find({"job": job.name}, {"_id": 0}).sort("started_at", -1).to_list(history)
+            ]
+            durations = [run.duration_seconds for run in runs]
+            lease_expires = _as_utc(lease.get("lease_expires_at"))
+            statuses.append(JobStatus(
+                name=job.name, description=job.description, schedule=job.spec,
+                timeout_seconds=job.timeout_seconds, jitter_seconds=job.jitter_seconds,
+                next_run_at=_as_utc(lease.get("next_run_at")) if job.schedule else None,
+                running_on=lease.get("owner") if lease_expires and lease_expires > now else None,
+                last_run=runs[0] if runs else None,
+                failures=sum(run.status != "ok" for run in runs),
+                avg_duration_seconds=round(sum(durations) / len(durations), 3) if durations else None,
+                max_duration_seconds=max(durations, default=None),
+                recent_runs=runs,
+            ))
+        return statuses
+
+scheduler = JobScheduler()
+
+@api_router.get("/admin/jobs", response_model=List[JobStatus])
+async def get_job_status(history: int = 10, current_admin: dict = Depends(get_current_admin)):
+    """Schedule, lease holder, last run and recent run durations for every registered job"""
+    return await scheduler.status(max(1, min(history, JOB_HISTORY_LIMIT)))
+
+@api_router.post("/admin/jobs/{name}/run", status_code=202)
+async def run_job_now(name: str, current_admin: dict = Depends(get_current_admin)):
+    """Run a job now on this instance, unless another instance is running it"""
+    job = scheduler.jobs.get(name)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    if not await scheduler.claim(job, force=True):
+        raise HTTPException(status_code=409, detail="Job is already running")
+    scheduler.execute_in_background(job)
+    return {"message": f"Job {name} started"}
+
 # ==================== BRANDS ====================
 
 @api_router.get("/brands", response_model=List[Brand])
-async def get_brands():
-    brands = await db.brands.find({}, {"_id": 0}).to_list(100)
-    for brand in brands:
-        if isinstance(brand.get('created_at'), str):
-            brand['created_at'] = datetime.fromisoformat(brand['created_at'])
-    return brands
+async def get_brands(reads=Depends(content_reads)):
+    brands = await reads.brands.find({}, {"_id": 0}).to_list(100)
+    return trusted_response(Brand, brands)
 
 @api_router.post("/brands", response_model=Brand)
 async def create_brand(input: BrandCreate, current_admin: dict = Depends(get_current_admin)):
@@ -536,127 +1318,218 @@ async def create_brand(input: BrandCreate, current_admin: dict = Depends(get_cur
     doc = brand.model_dump()
     doc['created_at'] = doc['created_at'].isoformat()
     await db.brands.insert_one(doc)
+    invalidate_site_bootstrap()
     return brand
 
 @api_router.put("/brands/{brand_id}", response_model=Brand)
-async def update_brand(brand_id: str, input: BrandCreate, current_admin: dict = Depends(get_current_admin)):
+async def update_brand(brand_id: str, input: BrandCreate, if_match: Optional[str] = Header(None), current_admin: dict = Depends(get_current_admin)):
     brand_dict = input.model_dump()
     brand_dict['updated_at'] = datetime.now(timezone.utc).isoformat()
-    result = await db.brands.update_one({"id": brand_id}, {"$set": brand_dict})
-    if result.matched_count == 0:
-        raise HTTPException(status_code=404, detail="Brand not found")
-    updated = await db.brands.find_one({"id": brand_id}, {"_id": 0})
-    if isinstance(updated.get('created_at'), str):
-        updated['created_at'] = datetime.fromisoformat(updated['created_at'])
-    return Brand(**updated)
+    updated = await versioned_update(db.brands, {"id": brand_id}, brand_dict, if_match, "Brand not found")
+    invalidate_site_bootstrap()
+    return versioned_response(Brand, updated)
 
 @api_router.delete("/brands/{brand_id}")
 async def delete_brand(brand_id: str, current_admin: dict = Depends(get_current_admin)):
     result = await db.brands.delete_one({"id": brand_id})
     if result.deleted_count == 0:
         raise HTTPException(status_code=404, detail="Brand not found")
+    invalidate_site_bootstrap()
     return {"message": "Brand deleted successfully"}
 
 # ==================== CATALOGS ====================
 
 @api_router.get("/catalogs", response_model=List[Catalog])
-async def get_catalogs():
-    catalogs = await db.catalogs.find({}, {"_id": 0}).to_list(100)
-    for catalog in catalogs:
-        if isinstance(catalog.get('created_at'), str):
-            catalog['created_at'] = datetime.fromisoformat(catalog['created_at'])
-    return catalogs
+async def get_catalogs(reads=Depends(content_reads)):
+    catalogs = await reads.catalogs.find({}, {"_id": 0, "pdf_text": 0}).to_list(100)
+    return trusted_response(Catalog, catalogs)
 
 @api_router.post("/catalogs", response_model=Catalog)
 async def create_catalog(input: CatalogCreate, current_admin: dict = Depends(get_current_admin)):
-    catalog = Catalog(**input.model_dump())
+    catalog = Catalog(**input.model_dump(), pdf_status="pending" if input.pdf_url else None)
     doc = catalog.model_dump()
     doc['created_at'] = doc['created_at'].isoformat()
     await db.catalogs.insert_one(doc)
+    search_index.upsert("catalogs", doc)
+    invalidate_site_feeds("catalogs")
+    process_catalog_pdfs_soon()
     return catalog
 
 @api_router.put("/catalogs/{catalog_id}", response_model=Catalog)
-async def update_catalog(catalog_id: str, input: CatalogCreate, current_admin: dict = Depends(get_current_admin)):
+async def update_catalog(catalog_id: str, input: CatalogCreate, if_match: Optional[str] = Header(None), current_admin: dict = Depends(get_current_admin)):
     catalog_dict = input.model_dump()
-    result = await db.catalogs.update_one({"id": catalog_id}, {"$set": catalog_dict})
-    if result.matched_count == 0:
-        raise HTTPException(status_code=404, detail="Catalog not found")
-    updated = await db.catalogs.find_one({"id": catalog_id}, {"_id": 0})
-    if isinstance(updated.get('created_at'), str):
-        updated['created_at'] = datetime.fromisoformat(updated['created_at'])
-    return Catalog(**updated)
+    updated = await versioned_update(db.catalogs, {"id": catalog_id}, catalog_dict, if_match, "Catalog not found")
+    if catalog_pdf_outdated(updated):
+        # Don't keep showing the previous PDF's preview while the new one is processed
+        reset = catalog_pdf_reset_fields(updated.get("pdf_url"))
+        await db.catalogs.update_one({"id": catalog_id, "pdf_url": updated.get("pdf_url")}, {"$set": reset})
+        updated.update(reset)
+        process_catalog_pdfs_soon()
+    search_index.upsert("catalogs", updated)
+    invalidate_site_feeds("catalogs")
+    return versioned_response(Catalog, updated)
 
 @api_router.delete("/catalogs/{catalog_id}")
 async def delete_catalog(catalog_id: str, current_admin: dict = Depends(get_current_admin)):
     result = await db.catalogs.delete_one({"id": catalog_id})
     if result.deleted_count == 0:
         raise HTTPException(status_code=404, detail="Catalog not found")
+    search_index.remove("catalogs", catalog_id)
+    invalidate_site_feeds("catalogs")
     return {"message": "Catalog deleted successfully"}
 
 # ==================== BLOGS ====================
 
+# Blog content is authored as HTML (or plain text) and rendered once on write: sanitized to an allowlist,
+# headings given anchor ids for the table of contents, and word count / reading time computed. Bump
+# BLOG_RENDERER_VERSION when the rendering changes so the startup backfill re-renders stored posts.
+BLOG_RENDERER_VERSION = 1
+BLOG_WORDS_PER_MINUTE = 200
+BLOG_TOC_LEVELS = ("h2", "h3", "h4")
+BLOG_ALLOWED_TAGS = {
+    "a", "abbr", "b", "blockquote", "br", "code", "em", "figcaption", "figure", "h1", "h2", "h3", "h4",
+    "h5", "h6", "hr", "i", "img", "li", "ol", "p", "pre", "s", "small", "span", "strong", "sub", "sup",
+    "table", "tbody", "td", "th", "thead", "tr", "u", "ul",
+}
+BLOG_ALLOWED_ATTRIBUTES = {
+    "a": {"href", "title", "target"},
+    "img": {"src", "alt", "title", "width", "height"},
+    "td": {"colspan", "rowspan"},
+    "th": {"colspan", "rowspan"},
+}
+# Content without any block-level markup is treated as plain text
+_BLOG_BLOCK_TAG_RE = re.compile(r"</?(?:p|br|div|h[1-6]|ul|ol|li|blockquote|pre|table|figure|img|hr)\b", re.IGNORECASE)
+BLOG_RENDERED_FIELDS = ("content_html", "toc", "word_count", "reading_time_minutes", "content_render_version")
+
+def _heading_anchor(text: str, used: set) -> str:
+    base = re.sub(r"[^\w]+", "-", text.lower()).strip("-") or "section"
+    anchor, n = base, 2
+    while anchor in used:
+        anchor, n = f"{base}-{n}", n + 1
+    used.add(anchor)
+    return anchor
+
+def render_blog_content(content: str) -> dict:
+    """Sanitized HTML plus table of contents, word count and reading time for a blog body"""
+    if not _BLOG_BLOCK_TAG_RE.search(content):
+        # Plain text: blank lines separate paragraphs
+        paragraphs = [p.strip() for p in re.split(r"\n\s*\n", content) if p.strip()]
+        content = "".join(f"<p>{html.escape(p).replace(chr(10), '<br>')}</p>" for p in paragraphs)
+    cleaned = nh3.clean(
+        content,
+        tags=BLOG_ALLOWED_TAGS,
+        attributes=BLOG_ALLOWED_ATTRIBUTES,
+        url_schemes={"http", "https", "mailto"},
+        link_rel="noopener noreferrer",
+    )
+    soup = BeautifulSoup(cleaned, "html.parser")
+    toc, used = [], set()
+    for heading in soup.find_all(BLOG_TOC_LEVELS):
+        text = " ".join(heading.get_text(" ").split())
+        if not text:
+            continue
+        heading["id"] = _heading_anchor(text, used)
+        toc.append({"id": heading["id"], "text": text, "level": int(heading.name[1])})
+    for image in soup.find_all("img"):
+        image["loading"] = "lazy"
+    word_count = len(_SEARCH_TOKEN_RE.findall(soup.get_text(" ")))
+    return {
+        "content_html": str(soup),
+        "toc": toc,
+        "word_count": word_count,
+        "reading_time_minutes": max(1, math.ceil(word_count / BLOG_WORDS_PER_MINUTE)) if word_count else 0,
+        "content_render_version": BLOG_RENDERER_VERSION,
+    }
+
+async def backfill_blog_rendering(batch_size: int = 100) -> int:
+    """Render stored posts whose derived fields are missing or from an older renderer; returns the count"""
+    rendered = 0
+    cursor = db.blogs.find(
+        {"content_render_version": {"$ne": BLOG_RENDERER_VERSION}}, {"_id": 0, "id": 1, "content": 1}
+    )
+    batch = []
+    async for doc in cursor:
+        batch.append(doc)
+        if len(batch) >= batch_size:
+            rendered += await _backfill_blog_batch(batch)
+            batch = []
+    if batch:
+        rendered += await _backfill_blog_batch(batch)
+    return rendered
+
+async def _backfill_blog_batch(docs: List[dict]) -> int:
+    results = await asyncio.to_thread(lambda: [render_blog_content(doc.get("content") or "") for doc in docs])
+    # Matching on content skips posts edited since they were read; the edit rendered them already
+    await db.blogs.bulk_write(
+        [UpdateOne({"id": doc["id"], "content": doc.get("content")}, {"$set": result}) for doc, result in zip(docs, results)],
+        ordered=False
+    )
+    return len(docs)
+
+async def run_blog_backfill_job() -> dict:
+    return {"rendered": await backfill_blog_rendering()}
+
+scheduler.add(
+    "blog_render_backfill", run_blog_backfill_job, timeout_seconds=1800,
+    description="Render blog posts written before the current renderer version",
+)
+
+@api_router.post("/admin/blogs/render-backfill")
+async def run_blog_render_backfill(current_admin: dict = Depends(get_current_admin)):
+    """Re-render any posts not rendered by the current renderer"""
+    return {"rendered": await backfill_blog_rendering()}
+
 @api_router.get("/blogs", response_model=List[Blog])
-async def get_blogs(published_only: bool = False):
+async def get_blogs(published_only: bool = False, reads=Depends(content_reads)):
     query = {"published": True} if published_only else {}
-    blogs = await db.blogs.find(query, {"_id": 0}).sort("created_at", -1).to_list(100)
-    for blog in blogs:
-        if isinstance(blog.get('created_at'), str):
-            blog['created_at'] = datetime.fromisoformat(blog['created_at'])
-        if isinstance(blog.get('updated_at'), str):
-            blog['updated_at'] = datetime.fromisoformat(blog['updated_at'])
-    return blogs
+    blogs = await reads.blogs.find(query, {"_id": 0}).sort("created_at", -1).to_list(100)
+    return trusted_response(Blog, blogs)
 
 @api_router.get("/blogs/{slug}", response_model=Blog)
-async def get_blog_by_slug(slug: str):
-    blog = await db.blogs.find_one({"slug": slug}, {"_id": 0})
+async def get_blog_by_slug(slug: str, reads=Depends(content_reads)):
+    blog = await reads.blogs.find_one({"slug": slug}, {"_id": 0})
     if not blog:
         raise HTTPException(status_code=404, detail="Blog not found")
-    if isinstance(blog.get('created_at'), str):
-        blog['created_at'] = datetime.fromisoformat(blog['created_at'])
-    if isinstance(blog.get('updated_at'), str):
-        blog['updated_at'] = datetime.fromisoformat(blog['updated_at'])
-    return Blog(**blog)
+    return trusted_response(Blog, blog)
 
 @api_router.post("/blogs", response_model=Blog)
 async def create_blog(input: BlogCreate, current_admin: dict = Depends(get_current_admin)):
-    blog = Blog(**input.model_dump())
+    rendered = await asyncio.to_thread(render_blog_content, input.content)
+    blog = Blog(**input.model_dump(), **rendered)
     doc = blog.model_dump()
     doc['created_at'] = doc['created_at'].isoformat()
     doc['updated_at'] = doc['updated_at'].isoformat()
     await db.blogs.insert_one(doc)
+    search_index.upsert("blogs", doc)
+    invalidate_site_feeds("blogs")
     return blog
 
 @api_router.put("/blogs/{blog_id}", response_model=Blog)
-async def update_blog(blog_id: str, input: BlogCreate, current_admin: dict = Depends(get_current_admin)):
+async def update_blog(blog_id: str, input: BlogCreate, if_match: Optional[str] = Header(None), current_admin: dict = Depends(get_current_admin)):
     blog_dict = input.model_dump()
+    blog_dict.update(await asyncio.to_thread(render_blog_content, input.content))
     blog_dict['updated_at'] = datetime.now(timezone.utc).isoformat()
-    result = await db.blogs.update_one({"id": blog_id}, {"$set": blog_dict})
-    if result.matched_count == 0:
-        raise HTTPException(status_code=404, detail="Blog not found")
-    updated = await db.blogs.find_one({"id": blog_id}, {"_id": 0})
-    if isinstance(updated.get('created_at'), str):
-        updated['created_at'] = datetime.fromisoformat(updated['created_at'])
-    if isinstance(updated.get('updated_at'), str):
-        updated['updated_at'] = datetime.fromisoformat(updated['updated_at'])
-    return Blog(**updated)
+    updated = await versioned_update(db.blogs, {"id": blog_id}, blog_dict, if_match, "Blog not found")
+    search_index.upsert("blogs", updated)
+    invalidate_site_feeds("blogs")
+    return versioned_response(Blog, updated)
 
 @api_router.delete("/blogs/{blog_id}")
 async def delete_blog(blog_id: str, current_admin: dict = Depends(get_current_admin)):
     result = await db.blogs.delete_one({"id": blog_id})
     if result.deleted_count == 0:
         raise HTTPException(status_code=404, detail="Blog not found")
+    search_index.remove("blogs", blog_id)
+    invalidate_site_feeds("blogs")
     return {"message": "Blog deleted successfully"}
 
 # ==================== CAREERS ====================
 
 @api_router.get("/careers", response_model=List[Career])
-async def get_careers(active_only: bool = False):
+async def get_careers(active_only: bool = False, reads=Depends(content_reads)):
     query = {"active": True} if active_only else {}
-    careers = await db.careers.find(query, {"_id": 0}).to_list(100)
-    for career in careers:
-        if isinstance(career.get('created_at'), str):
-            career['created_at'] = datetime.fromisoformat(career['created_at'])
-    return careers
+    careers = await reads.careers.find(query, {"_id": 0}).to_list(100)
+    return trusted_response(Career, careers)
 
 @api_router.post("/careers", response_model=Career)
 async def create_career(input: CareerCreate, current_admin: dict = Depends(get_current_admin)):
@@ -668,33 +1541,339 @@ async def create_career(input: CareerCreate, current_admin: dict = Depends(get_c
     doc = career.model_dump()
     doc['created_at'] = doc['created_at'].isoformat()
     await db.careers.insert_one(doc)
+    search_index.upsert("careers", doc)
+    invalidate_site_feeds("careers")
     return career
 
 @api_router.put("/careers/{career_id}", response_model=Career)
-async def update_career(career_id: str, input: CareerCreate, current_admin: dict = Depends(get_current_admin)):
+async def update_career(career_id: str, input: CareerCreate, if_match: Optional[str] = Header(None), current_admin: dict = Depends(get_current_admin)):
     career_dict = input.model_dump()
     # Convert requirements array to string if needed
     if isinstance(career_dict.get('requirements'), list):
         career_dict['requirements'] = '\n'.join(career_dict['requirements'])
-    result = await db.careers.update_one({"id": career_id}, {"$set": career_dict})
-    if result.matched_count == 0:
-        raise HTTPException(status_code=404, detail="Career not found")
-    updated = await db.careers.find_one({"id": career_id}, {"_id": 0})
-    if isinstance(updated.get('created_at'), str):
-        updated['created_at'] = datetime.fromisoformat(updated['created_at'])
-    return Career(**updated)
+    updated = await versioned_update(db.careers, {"id": career_id}, career_dict, if_match, "Career not found")
+    search_index.upsert("careers", updated)
+    invalidate_site_feeds("careers")
+    return versioned_response(Career, updated)
 
 @api_router.delete("/careers/{career_id}")
 async def delete_career(career_id: str, current_admin: dict = Depends(get_current_admin)):
     result = await db.careers.delete_one({"id": career_id})
     if result.deleted_count == 0:
         raise HTTPException(status_code=404, detail="Career not found")
+    search_index.remove("careers", career_id)
+    invalidate_site_feeds("careers")
     return {"message": "Career deleted successfully"}
 
 # ==================== INQUIRIES ====================
 
+# With INQUIRY_INGESTION_MODE=queued, validated inquiries are appended (fsync'd) to a local journal and
+# put on a bounded queue; the request is acknowledged at that point. A background writer batches the
+# queue into insert_many calls. On startup any journal left by a crash is replayed with idempotent
+# upserts. The journal is truncated whenever everything appended to it has been written, and under steady
+# traffic the already-written prefix is dropped once it outweighs the entries still pending.
+INQUIRY_INGESTION_MODE = os.environ.get('INQUIRY_INGESTION_MODE', 'direct').lower()
+INQUIRY_QUEUE_SIZE = int(os.environ.get('INQUIRY_QUEUE_SIZE', '1000'))
+INQUIRY_BATCH_SIZE = int(os.environ.get('INQUIRY_BATCH_SIZE', '100'))
+INQUIRY_BATCH_LINGER_MS = float(os.environ.get('INQUIRY_BATCH_LINGER_MS', '50'))
+JOURNAL_DIR = Path(os.environ.get("JOURNAL_DIR", str(DATA_DIR / "journal")))
+INQUIRY_BATCH_BUCKETS = (1, 5, 10, 25, 50, 100, 250, 500, 1000)
+INQUIRY_JOURNAL_COMPACT_BYTES = 1024 * 1024  # don't rewrite the journal for less written data than this
+
+metrics.describe("inquiry_queue_depth", "gauge", "Inquiries acknowledged but not yet written to MongoDB")
+metrics.describe("inquiry_submissions_total", "counter", "Queued inquiry submissions by result")
+metrics.describe("inquiry_flush_seconds", "histogram", "Duration of batched inquiry writes")
+metrics.describe("inquiry_flush_batch_size", "histogram", "Inquiries per batched write")
+
+class InquiryIngestionQueue:
+    """Bounded write-behind queue for inquiries backed by an append-only journal file"""
+
+    def __init__(self, journal_path: Path, max_size: int, batch_size: int, linger_seconds: float):
+        self.journal_path = journal_path
+        self.batch_size = batch_size
+        self.linger_seconds = linger_seconds
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max_size)
+        self.accepting = False
+        self._journal_file = None
+        # Serializes journal appends/truncation with queue puts so the journal never loses queued entries
+        self._journal_lock = asyncio.Lock()
+        self._in_flight = 0
+        self._writer: Optional[asyncio.Task] = None
+        # Journal lines are in queue order, so written inquiries are always a prefix of the file
+        self._line_sizes: Deque[int] = deque()
+        self._pending_bytes = 0
+        self._written_bytes = 0
+        self._journal_task: Optional[asyncio.Task] = None
+
+    def is_full(self) -> bool:
+        return self.queue.full()
+
+    async def submit(self, doc: dict):
+        """Journal and enqueue an inquiry document; raises asyncio.QueueFull when at capacity"""
+        if not self.accepting or self.queue.full():
+            metrics.inc("inquiry_submissions_total", result="rejected")
+            raise asyncio.QueueFull
+        line = orjson.dumps(doc) + b"\n"
+        async with self._journal_lock:
+            if self.queue.full():
+                metrics.inc("inquiry_submissions_total", result="rejected")
+                raise asyncio.QueueFull
+            await asyncio.to_thread(self._append, line)
+            self.queue.put_nowait(doc)
+            self._line_sizes.append(len(line))
+            self._pending_bytes += len(line)
+        metrics.inc("inquiry_submissions_total", result="queued")
+        metrics.set("inquiry_queue_depth", self.queue.qsize() + self._in_flight)
+
+    def _append(self, line: bytes):
+        self._journal_file.write(line)
+        self._journal_file.flush()
+        os.fsync(self._journal_file.fileno())
+
+    def _truncate(self):
+        self._journal_file.truncate(0)
+        self._journal_file.flush()
+        os.fsync(self._journal_file.fileno())
+
+    def _compact(self, written: int):
+        """Drop the first `written` bytes (inquiries already in MongoDB) from the journal"""
+        tmp_path = self.journal_path.with_name(self.journal_path.name + ".tmp")
+        with open(self.journal_path, "rb") as src, open(tmp_path, "wb") as dst:
+            src.seek(written)
+            shutil.copyfileobj(src, dst)
+            dst.flush()
+            os.fsync(dst.fileno())
+        self._journal_file.close()
+        os.replace(tmp_path, self.journal_path)
+        self._journal_file = open(self.journal_path, "ab")
+
+    async def _release_journal(self, count: int):
+        # Runs as its own task so cancelling the writer cannot interrupt a truncation or compaction
+        async with self._journal_lock:
+            for _ in range(count):
+                size = self._line_sizes.popleft()
+                self._pending_bytes -= size
+                self._written_bytes += size
+            if self.queue.empty():
+                await asyncio.to_thread(self._truncate)
+                self._written_bytes = 0
+            elif self._written_bytes >= max(self._pending_bytes, INQUIRY_JOURNAL_COMPACT_BYTES):
+                await asyncio.to_thread(self._compact, self._written_bytes)
+                self._written_bytes = 0
+
+    @staticmethod
+    async def _upsert(docs: List[dict]):
+        # Idempotent write used for retries and journal replay, where some documents may already exist
+        await db.inquiries.bulk_write(
+            [ReplaceOne({"id": doc["id"]}, dict(doc), upsert=True) for doc in docs], ordered=False
+        )
+
+    async def _write_batch(self, batch: List[dict]):
+        attempt = 0
+        while True:
+            start = time.perf_counter()
+            try:
+                if attempt == 0:
+                    # insert_many adds _id to the documents it is given, so pass copies
+                    await db.inquiries.insert_many([dict(doc) for doc in batch], ordered=False)
+                else:
+                    await self._upsert(batch)
+                metrics.observe("inquiry_flush_seconds", time.perf_counter() - start, LATENCY_BUCKETS)
+                metrics.observe("inquiry_flush_batch_size", len(batch), INQUIRY_BATCH_BUCKETS)
+                return
+            except Exception as e:
+                attempt += 1
+                delay = min(30, 2 ** attempt)
+                logger.error(f"Failed to write {len(batch)} queued inquiries (attempt {attempt}), retrying in {delay}s: {e}")
+                await asyncio.sleep(delay)
+
+    async def _run(self):
+        while True:
+            batch = [await self.queue.get()]
+            if self.queue.qsize() < self.batch_size - 1:
+                # Give a burst a moment to accumulate into one insert_many
+                await asyncio.sleep(self.linger_seconds)
+            while len(batch) < self.batch_size and not self.queue.empty():
+                batch.append(self.queue.get_nowait())
+            self._in_flight = len(batch)
+            await self._write_batch(batch)
+            self._in_flight = 0
+            metrics.set("inquiry_queue_depth", self.queue.qsize())
+            self._journal_task = asyncio.create_task(self._release_journal(len(batch)))
+            await asyncio.shield(self._journal_task)
+
+    async def replay(self):
+        """Write any inquiries left in the journal by a previous process"""
+        if not self.journal_path.exists():
+            return
+        docs = []
+        with open(self.journal_path, "rb") as f:
+            for line in f:
+                try:
+                    docs.append(orjson.loads(line))
+                except orjson.JSONDecodeError:
+                    logger.warning("Skipping torn line in inquiry journal")
+        for start in range(0, len(docs), self.batch_size):
+            await self._upsert(docs[start:start + self.batch_size])
+        self.journal_path.write_bytes(b"")
+        if docs:
+            logger.info(f"Replayed {len(docs)} inquiries from journal")
+
+    async def start(self):
+        self.journal_path.parent.mkdir(parents=True, exist_ok=True)
+        await self.replay()
+        self._journal_file = open(self.journal_path, "ab")
+        self._writer = asyncio.create_task(self._run())
+        self.accepting = True
+
+    async def stop(self, timeout: float = 10.0):
+        """Stop accepting, give the writer time to drain, and keep the journal if it could not"""
+        self.accepting = False
+        deadline = time.monotonic() + timeout
+        while (not self.queue.empty() or self._in_flight) and time.monotonic() < deadline:
+            await asyncio.sleep(0.05)
+        if self._writer is not None:
+            self._writer.cancel()
+            try:
+                await self._writer
+            except asyncio.CancelledError:
+                pass
+            self._writer = None
+        if self._journal_task is not None:
+            # Let a truncation or compaction the writer started finish before touching the file
+            try:
+                await self._journal_task
+            except Exception as e:
+                logger.error(f"Inquiry journal maintenance failed during shutdown: {e}")
+            self._journal_task = None
+        if self._journal_file is not None:
+            if self.queue.empty() and not self._in_flight:
+                self._truncate()
+            else:
+                logger.warning(f"{self.queue.qsize() + self._in_flight} queued inquiries left in journal for replay")
+            self._journal_file.close()
+            self._journal_file = None
+
+inquiry_ingestion = InquiryIngestionQueue(
+    JOURNAL_DIR / "inquiries.ndjson", INQUIRY_QUEUE_SIZE, INQUIRY_BATCH_SIZE, INQUIRY_BATCH_LINGER_MS / 1000
+)
+
+if INQUIRY_INGESTION_MODE == "queued":
+    @app.on_event("startup")
+    async def start_inquiry_ingestion():
+        await inquiry_ingestion.start()
+
+    @app.on_event("shutdown")
+    async def stop_inquiry_ingestion():
+        await inquiry_ingestion.stop()
+
+# Cheap in-memory admission checks for the public inquiry form, applied before anything touches disk
+# or MongoDB: token buckets per client IP and per email, and a sliding window of recent (email, message)
+# fingerprints that turns away exact replays. State is per process.
+INQUIRY_ADMISSION_ENABLED = os.environ.get('INQUIRY_ADMISSION_ENABLED', 'true').lower() == 'true'
+INQUIRY_IP_BURST = int(os.environ.get('INQUIRY_IP_BURST', '5'))
+INQUIRY_IP_PER_HOUR = float(os.environ.get('INQUIRY_IP_PER_HOUR', '20'))
+INQUIRY_EMAIL_BURST = int(os.environ.get('INQUIRY_EMAIL_BURST', '3'))
+INQUIRY_EMAIL_PER_HOUR = float(os.environ.get('INQUIRY_EMAIL_PER_HOUR', '10'))
+INQUIRY_DUPLICATE_WINDOW_SECONDS = float(os.environ.get('INQUIRY_DUPLICATE_WINDOW_SECONDS', '86400'))
+INQUIRY_ADMISSION_MAX_KEYS = int(os.environ.get('INQUIRY_ADMISSION_MAX_KEYS', '50000'))
+
+metrics.describe("inquiry_admission_rejected_total", "counter", "Inquiry submissions turned away by the admission checks")
+
+if INQUIRY_ADMISSION_ENABLED and not os.environ.get('FORWARDED_ALLOW_IPS'):
+    logger.warning("⚠️  FORWARDED_ALLOW_IPS is not set: behind a reverse proxy all visitors share one per-IP inquiry limit")
+    logger.warning("⚠️  Set it to the proxy's address range so uvicorn resolves client IPs from X-Forwarded-For")
+
+class TokenBuckets:
+    """Token buckets keyed by an arbitrary string; least recently used keys are evicted past max_keys"""
+
+    def __init__(self, burst: int, per_hour: float, max_keys: int):
+        self.burst = burst
+        self.rate = per_hour / 3600
+        self.max_keys = max_keys
+        self._buckets: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+
+    def take(self, key: str) -> float:
+        """Consume a token for key; returns 0 if allowed, otherwise seconds until one is available"""
+        now = time.monotonic()
+        tokens, last = self._buckets.pop(key, (self.burst, now))
+        tokens = min(self.burst, tokens + (now - last) * self.rate)
+        if tokens >= 1:
+            tokens -= 1
+            wait = 0.0
+        else:
+            wait = (1 - tokens) / self.rate if self.rate > 0 else 3600.0
+        self._buckets[key] = (tokens, now)
+        while len(self._buckets) > self.max_keys:
+            self._buckets.popitem(last=False)
+        return wait
+
+class RecentFingerprints:
+    """Set of fingerprints seen within a sliding time window"""
+
+    def __init__(self, window_seconds: float, max_keys: int):
+        self.window = window_seconds
+        self.max_keys = max_keys
+        # Insertion order is expiry order because the window is fixed
+        self._seen: "OrderedDict[str, float]" = OrderedDict()
+
+    def _prune(self, now: float):
+        while self._seen:
+            fingerprint, expires = next(iter(self._seen.items()))
+            if expires > now and len(self._seen) <= self.max_keys:
+                break
+            self._seen.popitem(last=False)
+
+    def add(self, fingerprint: str) -> bool:
+        """Record fingerprint; returns False if it was already seen within the window"""
+        now = time.monotonic()
+        self._prune(now)
+        if fingerprint in self._seen:
+            return False
+        self._seen[fingerprint] = now + self.window
+        return True
+
+    def discard(self, fingerprint: str):
+        self._seen.pop(fingerprint, None)
+
+class InquiryAdmission:
+    def __init__(self):
+        self.by_ip = TokenBuckets(INQUIRY_IP_BURST, INQUIRY_IP_PER_HOUR, INQUIRY_ADMISSION_MAX_KEYS)
+        self.by_email = TokenBuckets(INQUIRY_EMAIL_BURST, INQUIRY_EMAIL_PER_HOUR, INQUIRY_ADMISSION_MAX_KEYS)
+        self.recent = RecentFingerprints(INQUIRY_DUPLICATE_WINDOW_SECONDS, INQUIRY_ADMISSION_MAX_KEYS)
+
+    @staticmethod
+    def fingerprint(email: str, message: str) -> str:
+        normalized = " ".join(message.lower().split())
+        return hashlib.blake2b(f"{email.strip().lower()}\0{normalized}".encode(), digest_size=16).hexdigest()
+
+    def _reject(self, reason: str, status_code: int, detail: str, retry_after: Optional[float] = None):
+        metrics.inc("inquiry_admission_rejected_total", reason=reason)
+        headers = {"Retry-After": str(max(1, int(retry_after)))} if retry_after else None
+        raise HTTPException(status_code=status_code, detail=detail, headers=headers)
+
+    def admit(self, client_ip: str, email: str, message: str) -> str:
+        """Raise 429/409 if the submission should be turned away; returns its fingerprint otherwise"""
+        wait = self.by_ip.take(client_ip)
+        if wait:
+            self._reject("ip", 429, "Too many submissions, please try again later", wait)
+        wait = self.by_email.take(email.strip().lower())
+        if wait:
+            self._reject("email", 429, "Too many submissions, please try again later", wait)
+        fingerprint = self.fingerprint(email, message)
+        if not self.recent.add(fingerprint):
+            self._reject("duplicate", 409, "This inquiry has already been submitted")
+        return fingerprint
+
+inquiry_admission = InquiryAdmission()
+
+def _save_upload(upload: UploadFile, file_path: Path):
+    with open(file_path, "wb") as buffer:
+        shutil.copyfileobj(upload.file, buffer)
+
 @api_router.post("/inquiries", response_model=Inquiry)
 async def create_inquiry(
+    request: Request,
     name: str = Form(...),
     email: EmailStr = Form(...),
     phone: Optional[str] = Form(None),
@@ -704,10 +1883,8 @@ async def create_inquiry(
     cv_file: Optional[UploadFile] = File(None)
 ):
     """Create an inquiry with optional CV file upload"""
-    cv_filename = None
-    
-    # Handle CV file upload if provided
-    if cv_file and cv_file.filename:
+    has_cv = bool(cv_file and cv_file.filename)
+    if has_cv:
         # Validate file extension
         file_ext = Path(cv_file.filename).suffix.lower()
         allowed_extensions = ['.pdf', '.doc', '.docx']
@@ -717,15 +1894,49 @@ async def create_inquiry(
                 status_code=400, 
                 detail=f"Invalid file type. Allowed types: {', '.join(allowed_extensions)}"
             )
-        
+
+    fingerprint = None
+    if INQUIRY_ADMISSION_ENABLED:
+        fingerprint = inquiry_admission.admit(request.client.host if request.client else "unknown", email, message)
+
+    try:
+        return await _store_inquiry(name, email, phone, company, message, inquiry_type, cv_file if has_cv else None)
+    except BaseException:
+        # Let a legitimate retry through if this attempt was not stored
+        if fingerprint:
+            inquiry_admission.recent.discard(fingerprint)
+        raise
+
+async def _store_inquiry(
+    name: str,
+    email: str,
+    phone: Optional[str],
+    company: Optional[str],
+    message: str,
+    inquiry_type: str,
+    cv_file: Optional[UploadFile]
+) -> Inquiry:
+    queued = inquiry_ingestion.accepting
+    if queued and inquiry_ingestion.is_full():
+        raise HTTPException(
+            status_code=503,
+            detail="Too many submissions right now, please try again shortly",
+            headers={"Retry-After": "5"}
+        )
+
+    cv_filename = None
+    file_path = None
+    
+    # Handle CV file upload if provided
+    if cv_file is not None:
+        file_ext = Path(cv_file.filename).suffix.lower()
         # Generate unique filename
         file_id = str(uuid.uuid4())
         cv_filename = f"{file_id}{file_ext}"
-        file_path = UPLOADS_DIR / cv_filename
+        file_path = upload_path(UPLOADS_DIR, cv_filename, create=True)
         
-        # Save file
-        with open(file_path, "wb") as buffer:
-            shutil.copyfileobj(cv_file.file, buffer)
+        # Save file off the event loop
+        await asyncio.to_thread(_save_upload, cv_file, file_path)
         
         logger.info(f"CV file saved: {cv_filename}")
     
@@ -742,7 +1953,19 @@ async def create_inquiry(
     inquiry = Inquiry(**inquiry_data)
     doc = inquiry.model_dump()
     doc['created_at'] = doc['created_at'].isoformat()
-    await db.inquiries.insert_one(doc)
+    if queued:
+        try:
+            await inquiry_ingestion.submit(doc)
+        except asyncio.QueueFull:
+            if file_path is not None:
+                file_path.unlink(missing_ok=True)
+            raise HTTPException(
+                status_code=503,
+                detail="Too many submissions right now, please try again shortly",
+                headers={"Retry-After": "5"}
+            )
+    else:
+        await db.inquiries.insert_one(doc)
     return inquiry
 
 @api_router.get("/inquiries", response_model=List[Inquiry])
@@ -790,7 +2013,7 @@ async def delete_inquiry(inquiry_id: str, current_admin: dict = Depends(get_curr
     
     # Delete CV file if exists
     if inquiry.get('cv_filename'):
-        cv_file_path = UPLOADS_DIR / inquiry['cv_filename']
+        cv_file_path = find_upload(UPLOADS_DIR, inquiry['cv_filename'])
         if cv_file_path.exists():
             cv_file_path.unlink()
             logger.info(f"Deleted CV file: {inquiry['cv_filename']}")
@@ -811,7 +2034,7 @@ async def download_cv(inquiry_id: str, current_admin: dict = Depends(get_current
     if not cv_filename:
         raise HTTPException(status_code=404, detail="CV file not found for this inquiry")
     
-    file_path = UPLOADS_DIR / cv_filename
+    file_path = find_upload(UPLOADS_DIR, cv_filename)
     if not file_path.exists():
         raise HTTPException(status_code=404, detail="CV file not found on server")
     
@@ -833,111 +2056,759 @@ async def download_cv(inquiry_id: str, current_admin: dict = Depends(get_current
 
 # ==================== COMPANY INFO ====================
 
+def default_company_info() -> CompanyInfo:
+    return CompanyInfo(
+        about="Miswa International is a leading manufacturer and exporter of premium kids' products, specializing in educational toys and children's wear.",
+        mission="To create high-quality, safe, and engaging products that nurture children's growth and development while bringing joy to families worldwide.",
+        vision="To become the most trusted global brand in children's products, known for innovation, quality, and commitment to child development.",
+        phone="+1-800-MISWA-INT",
+        email="info@miswainternational.com",
+        address="123 Manufacturing District, Industrial Park, New Delhi, India"
+    )
+
 @api_router.get("/company-info", response_model=CompanyInfo)
-async def get_company_info():
-    info = await db.company_info.find_one({"id": "company_info"}, {"_id": 0})
+async def get_company_info(reads=Depends(content_reads)):
+    info = await reads.company_info.find_one({"id": "company_info"}, {"_id": 0})
     if not info:
-        # Return default
-        default_info = CompanyInfo(
-            about="Miswa International is a leading manufacturer and exporter of premium kids' products, specializing in educational toys and children's wear.",
-            mission="To create high-quality, safe, and engaging products that nurture children's growth and development while bringing joy to families worldwide.",
-            vision="To become the most trusted global brand in children's products, known for innovation, quality, and commitment to child development.",
-            phone="+1-800-MISWA-INT",
-            email="info@miswainternational.com",
-            address="123 Manufacturing District, Industrial Park, New Delhi, India"
-        )
-        return default_info
-    if isinstance(info.get('updated_at'), str):
-        info['updated_at'] = datetime.fromisoformat(info['updated_at'])
-    return CompanyInfo(**info)
+        return default_company_info()
+    return trusted_response(CompanyInfo, info)
 
 @api_router.put("/company-info", response_model=CompanyInfo)
-async def update_company_info(input: CompanyInfoUpdate, current_admin: dict = Depends(get_current_admin)):
+async def update_company_info(input: CompanyInfoUpdate, if_match: Optional[str] = Header(None), current_admin: dict = Depends(get_current_admin)):
     update_data = {k: v for k, v in input.model_dump().items() if v is not None}
     update_data['updated_at'] = datetime.now(timezone.utc).isoformat()
     
-    await db.company_info.update_one(
-        {"id": "company_info"},
-        {"$set": update_data},
-        upsert=True
+    info = await versioned_update(
+        db.company_info, {"id": "company_info"}, update_data, if_match, "Company info not found", upsert=True
     )
-    
-    info = await db.company_info.find_one({"id": "company_info"}, {"_id": 0})
-    if isinstance(info.get('updated_at'), str):
-        info['updated_at'] = datetime.fromisoformat(info['updated_at'])
-    return CompanyInfo(**info)
+    invalidate_site_bootstrap()
+    return versioned_response(CompanyInfo, info)
 
 # ==================== LINK PAGES ====================
 
+# /api/link-pages/{brand_slug} is what every QR code and bio link hits. Each page is published as a
+# JSON snapshot (and optionally a static HTML page) whenever it changes, and the public route serves
+# that file through StaticFiles (ETag/Last-Modified, 304s) without touching Mongo. Snapshots are local
+# to each instance, so a snapshot this process has not confirmed against Mongo for
+# LINK_PAGE_SNAPSHOT_MAX_AGE_SECONDS is re-read once (and rewritten only if the page changed elsewhere).
+LINK_PAGE_SNAPSHOT_HTML = os.environ.get('LINK_PAGE_SNAPSHOT_HTML', 'false').lower() == 'true'
+LINK_PAGE_SNAPSHOT_MAX_AGE_SECONDS = float(os.environ.get('LINK_PAGE_SNAPSHOT_MAX_AGE_SECONDS', '300'))
+link_page_snapshot_files = StaticFiles(directory=str(LINK_PAGE_SNAPSHOTS_DIR))
+# When this process last published or confirmed each page's snapshot (monotonic time)
+_link_page_snapshot_checked: Dict[str, float] = {}
+
+metrics.describe("link_page_snapshot_requests_total", "counter", "Link page requests by snapshot result")
+
+def _write_atomic(path: Path, data: bytes):
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
+def render_link_page_html(page: dict) -> str:
+    """Minimal static HTML version of a link page for crawlers and no-JS visitors"""
+    esc = lambda value: html.escape(str(value or ""), quote=True)
+    links = [
+        (page.get(f"{key}_text") or label, page.get(f"{key}_url"))
+        for key, label in (("website", "Website"), ("instagram", "Instagram"), ("facebook", "Facebook"),
+                           ("whatsapp", "WhatsApp"), ("google_review", "Google Review"))
+    ]
+    items = "".join(
+        f'<li><a href="{esc(url)}" rel="noopener">{esc(label)}</a></li>' for label, url in links if url
+    )
+    items += "".join(
+        f'<li><a href="{esc(qr.get("url"))}" rel="noopener">{esc(qr.get("title"))}</a></li>'
+        for qr in page.get("qr_codes") or []
+    )
+    return (
+        "<!DOCTYPE html><html lang=\"en\"><head><meta charset=\"utf-8\">"
+        "<meta name=\"viewport\" content=\"width=device-width, initial-scale=1\">"
+        f"<title>{esc(page.get('brand_name'))}</title>"
+        f"<meta name=\"description\" content=\"{esc(page.get('description'))}\">"
+        f"<meta property=\"og:title\" content=\"{esc(page.get('brand_name'))}\">"
+        f"<meta property=\"og:description\" content=\"{esc(page.get('tagline'))}\">"
+        f"<meta property=\"og:image\" content=\"{esc(page.get('logo_url'))}\">"
+        "</head><body>"
+        f"<img src=\"{esc(page.get('logo_url'))}\" alt=\"{esc(page.get('brand_name'))}\">"
+        f"<h1>{esc(page.get('brand_name'))}</h1><p>{esc(page.get('tagline'))}</p>"
+        f"<p>{esc(page.get('description'))}</p><ul>{items}</ul>"
+        "</body></html>"
+    )
+
+def _link_page_snapshot_path(brand_slug: str, ext: str) -> Path:
+    path = LINK_PAGE_SNAPSHOTS_DIR / f"{brand_slug}.{ext}"
+    if path.parent != LINK_PAGE_SNAPSHOTS_DIR:
+        raise ValueError(f"Invalid brand slug for snapshot: {brand_slug}")
+    return path
+
+def _link_page_snapshot_is_current(brand_slug: str) -> bool:
+    if LINK_PAGE_SNAPSHOT_MAX_AGE_SECONDS <= 0:
+        return True
+    checked = _link_page_snapshot_checked.get(brand_slug)
+    return checked is not None and time.monotonic() - checked <= LINK_PAGE_SNAPSHOT_MAX_AGE_SECONDS
+
+def _write_if_changed(path: Path, data: bytes):
+    # Unchanged snapshots keep their mtime, and with it the ETag clients revalidate against
+    if _read_file_if_exists(path) != data:
+        _write_atomic(path, data)
+
+async def publish_link_page_snapshot(doc: dict):
+    """Write the pre-rendered snapshot(s) for a link page document"""
+    page = dump_trusted(LinkPage, doc)
+
+    def _write():
+        _write_if_changed(_link_page_snapshot_path(page["brand_slug"], "json"), orjson_dumps(page))
+        if LINK_PAGE_SNAPSHOT_HTML:
+            _write_if_changed(_link_page_snapshot_path(page["brand_slug"], "html"), render_link_page_html(page).encode("utf-8"))
+
+    try:
+        await asyncio.to_thread(_write)
+        _link_page_snapshot_checked[page["brand_slug"]] = time.monotonic()
+    except Exception as e:
+        logger.error(f"Failed to publish link page snapshot for {doc.get('brand_slug')}: {e}")
+
+async def remove_link_page_snapshot(brand_slug: str):
+    _link_page_snapshot_checked.pop(brand_slug, None)
+
+    def _remove():
+        for ext in ("json", "html"):
+            _link_page_snapshot_path(brand_slug, ext).unlink(missing_ok=True)
+    try:
+        await asyncio.to_thread(_remove)
+    except Exception as e:
+        logger.error(f"Failed to remove link page snapshot for {brand_slug}: {e}")
+
 @api_router.get("/link-pages", response_model=List[LinkPage])
-async def get_link_pages():
-    link_pages = await db.link_pages.find({}, {"_id": 0}).to_list(100)
-    for page in link_pages:
-        if isinstance(page.get('created_at'), str):
-            page['created_at'] = datetime.fromisoformat(page['created_at'])
-        if isinstance(page.get('updated_at'), str):
-            page['updated_at'] = datetime.fromisoformat(page['updated_at'])
-    return link_pages
+async def get_link_pages(reads=Depends(content_reads)):
+    link_pages = await reads.link_pages.find({}, {"_id": 0}).to_list(100)
+    return trusted_response(LinkPage, link_pages)
+
+async def _serve_link_page_snapshot(brand_slug: str, request: Request) -> Optional[Response]:
+    try:
+        response = await link_page_snapshot_files.get_response(f"{brand_slug}.json", request.scope)
+    except StarletteHTTPException:
+        return None
+    response.headers["Cache-Control"] = "public, no-cache"
+    return response
 
 @api_router.get("/link-pages/{brand_slug}", response_model=LinkPage)
-async def get_link_page_by_slug(brand_slug: str):
+async def get_link_page_by_slug(brand_slug: str, request: Request):
+    if _link_page_snapshot_is_current(brand_slug):
+        response = await _serve_link_page_snapshot(brand_slug, request)
+        if response is not None:
+            metrics.inc("link_page_snapshot_requests_total", result="hit")
+            return response
+        metrics.inc("link_page_snapshot_requests_total", result="miss")
+    else:
+        metrics.inc("link_page_snapshot_requests_total", result="stale" if brand_slug in _link_page_snapshot_checked else "miss")
+    # Primary read: the snapshot written from it is served until the next admin write or max-age check
     link_page = await db.link_pages.find_one({"brand_slug": brand_slug}, {"_id": 0})
     if not link_page:
+        # Deleted through another instance: drop this instance's copy too
+        await remove_link_page_snapshot(brand_slug)
         raise HTTPException(status_code=404, detail="Link page not found")
-    if isinstance(link_page.get('created_at'), str):
-        link_page['created_at'] = datetime.fromisoformat(link_page['created_at'])
-    if isinstance(link_page.get('updated_at'), str):
-        link_page['updated_at'] = datetime.fromisoformat(link_page['updated_at'])
-    return LinkPage(**link_page)
+    await publish_link_page_snapshot(link_page)
+    # Serve the (re)published file when possible so revalidation against an unchanged ETag still gets a 304
+    response = await _serve_link_page_snapshot(brand_slug, request)
+    return response if response is not None else trusted_response(LinkPage, link_page)
 
 @api_router.post("/link-pages", response_model=LinkPage)
-async def create_link_page(input: LinkPageCreate, current_admin: dict = Depends(get_current_admin)):
+async def create_link_page(input: LinkPageCreate, background_tasks: BackgroundTasks, current_admin: dict = Depends(get_current_admin)):
     link_page = LinkPage(**input.model_dump())
     doc = link_page.model_dump()
     doc['created_at'] = doc['created_at'].isoformat()
     doc['updated_at'] = doc['updated_at'].isoformat()
     await db.link_pages.insert_one(doc)
+    invalidate_site_bootstrap()
+    invalidate_site_feeds("link_pages")
+    await publish_link_page_snapshot(doc)
+    background_tasks.add_task(warm_link_page_qr_codes, doc.get('qr_codes') or [])
     return link_page
 
 @api_router.put("/link-pages/{brand_slug}", response_model=LinkPage)
-async def update_link_page(brand_slug: str, input: LinkPageUpdate, current_admin: dict = Depends(get_current_admin)):
+async def update_link_page(brand_slug: str, input: LinkPageUpdate, background_tasks: BackgroundTasks, if_match: Optional[str] = Header(None), current_admin: dict = Depends(get_current_admin)):
     update_dict = {k: v for k, v in input.model_dump().items() if v is not None}
     update_dict['updated_at'] = datetime.now(timezone.utc).isoformat()
-    result = await db.link_pages.update_one({"brand_slug": brand_slug}, {"$set": update_dict})
-    if result.matched_count == 0:
-        raise HTTPException(status_code=404, detail="Link page not found")
-    updated = await db.link_pages.find_one({"brand_slug": brand_slug}, {"_id": 0})
-    if isinstance(updated.get('created_at'), str):
-        updated['created_at'] = datetime.fromisoformat(updated['created_at'])
-    if isinstance(updated.get('updated_at'), str):
-        updated['updated_at'] = datetime.fromisoformat(updated['updated_at'])
-    return LinkPage(**updated)
+    updated = await versioned_update(db.link_pages, {"brand_slug": brand_slug}, update_dict, if_match, "Link page not found")
+    invalidate_site_bootstrap()
+    invalidate_site_feeds("link_pages")
+    await publish_link_page_snapshot(updated)
+    if input.qr_codes is not None:
+        background_tasks.add_task(warm_link_page_qr_codes, updated.get('qr_codes') or [])
+    return versioned_response(LinkPage, updated)
 
 @api_router.delete("/link-pages/{brand_slug}")
 async def delete_link_page(brand_slug: str, current_admin: dict = Depends(get_current_admin)):
     result = await db.link_pages.delete_one({"brand_slug": brand_slug})
     if result.deleted_count == 0:
         raise HTTPException(status_code=404, detail="Link page not found")
+    invalidate_site_bootstrap()
+    invalidate_site_feeds("link_pages")
+    await remove_link_page_snapshot(brand_slug)
     return {"message": "Link page deleted successfully"}
 
+# ==================== LINK PAGE QR CODES ====================
+
+# QR images for LinkPage.qr_codes are rendered server-side in a process pool and cached on disk and
+# in memory, keyed by (url, size, format). Edits to a page's QR list warm the cache in the background.
+CPU_POOL_WORKERS = int(os.environ.get('CPU_POOL_WORKERS', '2'))
+QR_CACHE_DIR = Path(os.environ.get("QR_CACHE_DIR", str(DATA_DIR / "cache" / "qr")))
+QR_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+QR_MEMORY_CACHE_MB = int(os.environ.get('QR_MEMORY_CACHE_MB', '16'))
+QR_SIZES = (128, 256, 512, 1024)
+QR_WARM_SIZES = (256,)
+QR_FORMATS = {"png": "image/png", "svg": "image/svg+xml"}
+
+metrics.describe("qr_code_requests_total", "counter", "QR code lookups by cache tier that served them")
+
+_process_pool: Optional[ProcessPoolExecutor] = None
+
+def get_process_pool() -> ProcessPoolExecutor:
+    """Shared process pool for CPU-heavy work that should not block the event loop"""
+    global _process_pool
+    if _process_pool is None:
+        _process_pool = ProcessPoolExecutor(max_workers=CPU_POOL_WORKERS)
+    return _process_pool
+
+def render_qr_code(url: str, size: int, fmt: str) -> bytes:
+    """Render a QR code as an exactly size x size PNG or SVG (runs in a worker process)"""
+    qr = qrcode.QRCode(error_correction=qrcode.constants.ERROR_CORRECT_M, border=0)
+    qr.add_data(url)
+    qr.make(fit=True)
+    matrix = qr.get_matrix()
+    modules = len(matrix)
+    if fmt == "svg":
+        path = "".join(f"M{x},{y}h1v1h-1z" for y, row in enumerate(matrix) for x, dark in enumerate(row) if dark)
+        return (
+            f'<svg xmlns="http://www.w3.org/2000/svg" width="{size}" height="{size}" '
+            f'viewBox="0 0 {modules} {modules}" shape-rendering="crispEdges">'
+            f'<rect width="{modules}" height="{modules}" fill="#FFFFFF"/><path d="{path}" fill="#000000"/></svg>'
+        ).encode("utf-8")
+    # Scale modules by a whole number of pixels and centre the code on a white canvas
+    scale = max(1, size // modules)
+    size = max(size, modules * scale)
+    offset = (size - modules * scale) // 2
+    blank_row = [1] * size
+    rows = [blank_row] * offset
+    for row in matrix:
+        pixels = [1] * offset
+        for dark in row:
+            pixels.extend([0 if dark else 1] * scale)
+        pixels.extend([1] * (size - len(pixels)))
+        rows.extend([pixels] * scale)
+    rows.extend([blank_row] * (size - len(rows)))
+    buffer = io.BytesIO()
+    png.Writer(size, size, greyscale=True, bitdepth=1).write(buffer, rows)
+    return buffer.getvalue()
+
+qr_memory_cache = BytesLRUCache(QR_MEMORY_CACHE_MB * 1024 * 1024)
+_qr_inflight: Dict[str, asyncio.Task] = {}
+
+def qr_cache_key(url: str, size: int, fmt: str) -> str:
+    return hashlib.sha256(f"{url}|{size}|{fmt}".encode("utf-8")).hexdigest()
+
+def _read_file_if_exists(path: Path) -> Optional[bytes]:
+    try:
+        return path.read_bytes()
+    except FileNotFoundError:
+        return None
+
+async def get_qr_code(url: str, size: int, fmt: str) -> Tuple[str, bytes]:
+    """Return (cache key, image bytes), rendering at most once per key across concurrent callers"""
+    key = qr_cache_key(url, size, fmt)
+    data = qr_memory_cache.get(key)
+    if data is not None:
+        metrics.inc("qr_code_requests_total", tier="memory")
+        return key, data
+    task = _qr_inflight.get(key)
+    if task is None:
+        # The load runs in its own task so a cancelled caller (client disconnect, shed, shutdown) cannot
+        # abandon the other callers waiting on the same key
+        task = asyncio.create_task(_load_qr_code(url, size, fmt, key))
+        _qr_inflight[key] = task
+        task.add_done_callback(lambda done: _qr_load_done(key, done))
+    return key, await asyncio.shield(task)
+
+async def _load_qr_code(url: str, size: int, fmt: str, key: str) -> bytes:
+    path = QR_CACHE_DIR / f"{key}.{fmt}"
+    data = await asyncio.to_thread(_read_file_if_exists, path)
+    if data is None:
+        metrics.inc("qr_code_requests_total", tier="render")
+        data = await asyncio.get_running_loop().run_in_executor(get_process_pool(), render_qr_code, url, size, fmt)
+        await asyncio.to_thread(_write_atomic, path, data)
+    else:
+        metrics.inc("qr_code_requests_total", tier="disk")
+    qr_memory_cache.put(key, data)
+    return data
+
+def _qr_load_done(key: str, task: asyncio.Task):
+    if _qr_inflight.get(key) is task:
+        del _qr_inflight[key]
+    if not task.cancelled():
+        task.exception()  # mark retrieved when every caller has gone away
+
+async def warm_link_page_qr_codes(qr_codes: list):
+    """Pre-render the default QR sizes for a link page's entries"""
+    for entry in qr_codes:
+        url = entry.get("url") if isinstance(entry, dict) else getattr(entry, "url", None)
+        if not url:
+            continue
+        for size in QR_WARM_SIZES:
+            for fmt in QR_FORMATS:
+                try:
+                    await get_qr_code(url, size, fmt)
+                except Exception as e:
+                    logger.error(f"Failed to pre-render QR code for {url}: {e}")
+
+async def _load_link_page_qr_codes(brand_slug: str) -> Optional[list]:
+    # Prefer the published snapshot so QR views do not touch Mongo either
+    try:
+        path = _link_page_snapshot_path(brand_slug, "json")
+    except ValueError:
+        return None
+    raw = await asyncio.to_thread(_read_file_if_exists, path) if _link_page_snapshot_is_current(brand_slug) else None
+    if raw is not None:
+        return orjson.loads(raw).get("qr_codes") or []
+    page = await db.link_pages.find_one({"brand_slug": brand_slug}, {"_id": 0, "qr_codes": 1})
+    return None if page is None else page.get("qr_codes") or []
+
+@api_router.get("/link-pages/{brand_slug}/qr/{index}")
+async def get_link_page_qr_code(brand_slug: str, index: int, request: Request, size: int = 256, format: str = "png"):
+    """Render the QR code for entry `index` of a link page's qr_codes as PNG or SVG"""
+    if size not in QR_SIZES:
+        raise HTTPException(status_code=400, detail=f"Invalid size. Allowed sizes: {', '.join(map(str, QR_SIZES))}")
+    if format not in QR_FORMATS:
+        raise HTTPException(status_code=400, detail=f"Invalid format. Allowed formats: {', '.join(QR_FORMATS)}")
+    qr_codes = await _load_link_page_qr_codes(brand_slug)
+    if qr_codes is None:
+        raise HTTPException(status_code=404, detail="Link page not found")
+    if index < 0 or index >= len(qr_codes):
+        raise HTTPException(status_code=404, detail="QR code not found")
+
+    key, data = await get_qr_code(qr_codes[index]["url"], size, format)
+    etag = f'"{key[:32]}"'
+    headers = {"ETag": etag, "Cache-Control": "public, max-age=300"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=data, media_type=QR_FORMATS[format], headers=headers)
+
+# ==================== CATALOG PDF PREVIEWS ====================
+
+# When a catalog's pdf_url is set or changed, the PDF is opened in the shared process pool to render a
+# first-page PNG preview, count pages and extract plain text. Results are stored on the catalog (the text
+# only feeds search) and cached on disk by the PDF's content hash, so listing catalogs never touches PDFs
+# and re-linking the same file is free. Writes queue processing in this process; the scheduled job picks
+# up anything missed (other workers, restarts) and retries failures.
+CATALOG_PDF_PREVIEWS_ENABLED = os.environ.get('CATALOG_PDF_PREVIEWS_ENABLED', 'true').lower() == 'true' and pdfium is not None
+CATALOG_PREVIEW_DIR = Path(os.environ.get("CATALOG_PREVIEW_DIR", str(DATA_DIR / "cache" / "catalog-previews")))
+CATALOG_PREVIEW_DIR.mkdir(parents=True, exist_ok=True)
+CATALOG_PREVIEW_WIDTH = int(os.environ.get('CATALOG_PREVIEW_WIDTH', '480'))
+CATALOG_PDF_TEXT_MAX_CHARS = int(os.environ.get('CATALOG_PDF_TEXT_MAX_CHARS', '100000'))
+CATALOG_PDF_MAX_MB = int(os.environ.get('CATALOG_PDF_MAX_MB', '50'))
+CATALOG_PDF_SCHEDULE = os.environ.get('CATALOG_PDF_SCHEDULE', 'every 1h')
+CATALOG_PDF_RETRY_HOURS = float(os.environ.get('CATALOG_PDF_RETRY_HOURS', '24'))
+# Bump when extraction changes so stored results are regenerated
+CATALOG_PDF_PROCESSOR_VERSION = 1
+
+metrics.describe("catalog_pdfs_processed_total", "counter", "Catalog PDFs processed by result")
+
+def catalog_pdf_reset_fields(pdf_url: Optional[str]) -> dict:
+    """Fields marking a catalog's PDF as not yet processed (or cleared when it has none)"""
+    return {
+        "pdf_status": "pending" if pdf_url else None, "pdf_preview_url": None, "pdf_page_count": None,
+        "pdf_text": None, "pdf_source": None, "pdf_sha256": None, "pdf_error": None,
+    }
+
+def catalog_pdf_outdated(doc: dict) -> bool:
+    """Whether the stored preview fields don't describe the catalog's current pdf_url"""
+    pdf_url = doc.get("pdf_url") or None
+    if pdf_url is None:
+        return doc.get("pdf_source") is not None or doc.get("pdf_status") is not None
+    if doc.get("pdf_source") != pdf_url or doc.get("pdf_processor_version") != CATALOG_PDF_PROCESSOR_VERSION:
+        return True
+    if doc.get("pdf_status") == "failed":
+        processed_at = _as_utc(doc.get("pdf_processed_at"))
+        return processed_at is None or datetime.now(timezone.utc) - processed_at > timedelta(hours=CATALOG_PDF_RETRY_HOURS)
+    return False
+
+def extract_catalog_pdf(pdf_path: str, preview_width: int, max_chars: int) -> dict:
+    """Page count, plain text and a first-page PNG preview of a PDF (runs in a worker process)"""
+    pdf = pdfium.PdfDocument(pdf_path)
+    try:
+        page_count = len(pdf)
+        if page_count == 0:
+            raise ValueError("PDF has no pages")
+        page = pdf[0]
+        bitmap = page.render(scale=preview_width / page.get_width(), rev_byteorder=True)
+        width, height, stride, channels = bitmap.width, bitmap.height, bitmap.stride, bitmap.n_channels
+        buffer = memoryview(bitmap.buffer).cast("B")
+        rows = (buffer[y * stride:y * stride + width * channels] for y in range(height))
+        preview = io.BytesIO()
+        png.Writer(width, height, greyscale=False, alpha=channels == 4).write(preview, rows)
+        texts, length = [], 0
+        for index in range(page_count):
+            if length >= max_chars:
+                break
+            textpage = pdf[index].get_textpage()
+            text = " ".join(textpage.get_text_range().split())
+            textpage.close()
+            texts.append(text)
+            length += len(text) + 1
+        return {"page_count": page_count, "text": "\n".join(texts)[:max_chars], "preview": preview.getvalue()}
+    finally:
+        pdf.close()
+
+def _local_asset_path(pdf_url: str) -> Optional[Path]:
+    """The file behind an /assets/... URL (absolute or relative), if it is one of ours"""
+    path = urlparse(pdf_url).path
+    if not path.startswith("/assets/"):
+        return None
+    try:
+        candidate = find_upload(ASSETS_DIR, path[len("/assets/"):])
+    except ValueError:
+        return None
+    return candidate if candidate.is_file() else None
+
+async def _fetch_catalog_pdf(pdf_url: str) -> bytes:
+    limit = CATALOG_PDF_MAX_MB * 1024 * 1024
+    async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=60)) as session:
+        async with session.get(pdf_url) as response:
+            if response.status != 200:
+                raise RuntimeError(f"Download returned {response.status}")
+            chunks, size = [], 0
+            async for chunk in response.content.iter_chunked(64 * 1024):
+                size += len(chunk)
+                if size > limit:
+                    raise RuntimeError(f"PDF is larger than {CATALOG_PDF_MAX_MB} MB")
+                chunks.append(chunk)
+    return b"".join(chunks)
+
+def _hash_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+async def _extract_cached(pdf_path: Path, sha256: str) -> dict:
+    """Extraction results for a PDF, from the content-hash cache or the process pool"""
+    meta_path = CATALOG_PREVIEW_DIR / f"{sha256}.json"
+    raw = await asyncio.to_thread(_read_file_if_exists, meta_path)
+    if raw is not None and (CATALOG_PREVIEW_DIR / f"{sha256}.png").exists():
+        meta = orjson.loads(raw)
+        if meta.get("processor_version") == CATALOG_PDF_PROCESSOR_VERSION:
+            return meta
+    loop = asyncio.get_running_loop()
+    result = await loop.run_in_executor(
+        get_process_pool(), extract_catalog_pdf, str(pdf_path), CATALOG_PREVIEW_WIDTH, CATALOG_PDF_TEXT_MAX_CHARS
+    )
+    meta = {"processor_version": CATALOG_PDF_PROCESSOR_VERSION, "page_count": result["page_count"], "text": result["text"]}
+    await asyncio.to_thread(_write_atomic, CATALOG_PREVIEW_DIR / f"{sha256}.png", result["preview"])
+    await asyncio.to_thread(_write_atomic, meta_path, orjson.dumps(meta))
+    return meta
+
+async def process_catalog_pdf(catalog_id: str, pdf_url: str) -> bool:
+    """Extract and store preview, page count and text for one catalog; False if the PDF could not be read"""
+    processed = {"pdf_source": pdf_url, "pdf_processor_version": CATALOG_PDF_PROCESSOR_VERSION,
+                 "pdf_processed_at": datetime.now(timezone.utc).isoformat()}
+    download_path = None
+    try:
+        pdf_path = _local_asset_path(pdf_url)
+        if pdf_path is None:
+            if not pdf_url.startswith(("http://", "https://")):
+                raise RuntimeError("pdf_url is not an existing uploaded asset or an http(s) URL")
+            data = await _fetch_catalog_pdf(pdf_url)
+            download_path = CATALOG_PREVIEW_DIR / f".download-{uuid.uuid4().hex}.pdf"
+            await asyncio.to_thread(download_path.write_bytes, data)
+            pdf_path = download_path
+        sha256 = await asyncio.to_thread(_hash_file, pdf_path)
+        meta = await _extract_cached(pdf_path, sha256)
+        fields = {
+            **processed, "pdf_status": "ready", "pdf_preview_url": f"/catalog-previews/{sha256}.png",
+            "pdf_sha256": sha256, "pdf_page_count": meta["page_count"], "pdf_text": meta["text"], "pdf_error": None,
+        }
+    except Exception as e:
+        logger.error(f"Catalog {catalog_id}: could not process PDF {pdf_url}: {e}")
+        fields = {**catalog_pdf_reset_fields(pdf_url), **processed, "pdf_status": "failed", "pdf_error": str(e) or type(e).__name__}
+    finally:
+        if download_path is not None:
+            download_path.unlink(missing_ok=True)
+    # Matching on pdf_url drops the result if the catalog was pointed at another PDF meanwhile
+    updated = await db.catalogs.find_one_and_update(
+        {"id": catalog_id, "pdf_url": pdf_url}, {"$set": fields},
+        projection={"_id": 0}, return_document=ReturnDocument.AFTER,
+    )
+    if updated is not None:
+        search_index.upsert("catalogs", updated)
+    metrics.inc("catalog_pdfs_processed_total", result=fields["pdf_status"])
+    return fields["pdf_status"] == "ready"
+
+async def process_pending_catalog_pdfs() -> dict:
+    """Process every catalog whose preview fields are missing, stale or due for a retry"""
+    projection = {"_id": 0, "id": 1, "pdf_url": 1, "pdf_source": 1, "pdf_status": 1,
+                  "pdf_processor_version": 1, "pdf_processed_at": 1}
+    docs = await db.catalogs.find({}, projection).to_list(None)
+    processed = failed = cleared = 0
+    for doc in docs:
+        if not catalog_pdf_outdated(doc):
+            continue
+        if not doc.get("pdf_url"):
+            reset = catalog_pdf_reset_fields(None)
+            await db.catalogs.update_one({"id": doc["id"], "pdf_url": doc.get("pdf_url")}, {"$set": reset})
+            cleared += 1
+        elif await process_catalog_pdf(doc["id"], doc["pdf_url"]):
+            processed += 1
+        else:
+            failed += 1
+    return {"processed": processed, "failed": failed, "cleared": cleared}
+
+def _prune_catalog_previews(referenced: set, cutoff: float) -> int:
+    removed = 0
+    for entry in CATALOG_PREVIEW_DIR.iterdir():
+        sha256 = entry.name.lstrip(".").split(".")[0]
+        if sha256 and sha256 not in referenced and entry.stat().st_mtime < cutoff:
+            entry.unlink(missing_ok=True)
+            removed += 1
+    return removed
+
+async def catalog_pdf_job() -> dict:
+    """Scheduled pass: process outstanding catalog PDFs and drop cached previews no catalog uses"""
+    result = await process_pending_catalog_pdfs()
+    referenced = {doc["pdf_sha256"] for doc in await db.catalogs.find({"pdf_sha256": {"$ne": None}}, {"_id": 0, "pdf_sha256": 1}).to_list(None)}
+    result["pruned_files"] = await asyncio.to_thread(_prune_catalog_previews, referenced, time.time() - CATALOG_PDF_RETRY_HOURS * 3600)
+    return result
+
+_catalog_pdf_task: Optional[asyncio.Task] = None
+_catalog_pdf_rerun = False
+
+def process_catalog_pdfs_soon():
+    """Queue a processing pass in this process after a catalog write (coalesces bursts of writes)"""
+    global _catalog_pdf_task, _catalog_pdf_rerun
+    if not CATALOG_PDF_PREVIEWS_ENABLED:
+        return
+    if _catalog_pdf_task is not None and not _catalog_pdf_task.done():
+        _catalog_pdf_rerun = True
+        return
+    _catalog_pdf_task = asyncio.create_task(_process_catalog_pdfs_until_idle())
+
+async def _process_catalog_pdfs_until_idle():
+    global _catalog_pdf_rerun
+    while True:
+        _catalog_pdf_rerun = False
+        try:
+            await process_pending_catalog_pdfs()
+        except Exception as e:
+            logger.error(f"Catalog PDF processing failed: {e}")
+        if not _catalog_pdf_rerun:
+            return
+
+if CATALOG_PDF_PREVIEWS_ENABLED and CATALOG_PDF_SCHEDULE:
+    scheduler.add(
+        "catalog_pdf_previews", catalog_pdf_job, CATALOG_PDF_SCHEDULE, timeout_seconds=1800,
+        jitter_seconds=60, description="Render catalog PDF previews and extract their text",
+    )
+
+# ==================== LINK PAGE ANALYTICS ====================
+
+# Clicks and visits are counted in memory per (brand_slug, link, minute) and flushed periodically as
+# batched $inc upserts, so campaign spikes cost one bulk_write per interval instead of a write per click.
+ANALYTICS_FLUSH_SECONDS = float(os.environ.get('ANALYTICS_FLUSH_SECONDS', '10'))
+ANALYTICS_MAX_PENDING = int(os.environ.get('ANALYTICS_MAX_PENDING', '10000'))
+LINK_PAGE_TRACKABLE_LINKS = {"visit", "website", "instagram", "facebook", "whatsapp", "google_review"}
+MAX_TRACKED_QR_CODES = 50
+
+metrics.describe("link_analytics_events_total", "counter", "Link page analytics events by result")
+metrics.describe("link_analytics_pending_buckets", "gauge", "Aggregated analytics buckets waiting to be flushed")
+metrics.describe("link_analytics_flush_seconds", "histogram", "Duration of analytics flushes to MongoDB")
+
+def is_trackable_link(link: str) -> bool:
+    if link in LINK_PAGE_TRACKABLE_LINKS:
+        return True
+    prefix, _, index = link.partition(":")
+    return prefix == "qr" and index.isdigit() and int(index) < MAX_TRACKED_QR_CODES
+
+class LinkAnalyticsBuffer:
+    """In-memory per-minute counters with bounded size, flushed to Mongo in the background"""
+
+    def __init__(self, max_pending: int, flush_interval: float):
+        self.max_pending = max_pending
+        self.flush_interval = flush_interval
+        self.counts: Dict[Tuple[str, str, str], int] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._early_flush: Optional[asyncio.Task] = None
+        self._flush_lock = asyncio.Lock()
+
+    def record(self, brand_slug: str, link: str) -> bool:
+        bucket = datetime.now(timezone.utc).replace(second=0, microsecond=0).isoformat()
+        key = (brand_slug, link, bucket)
+        if key not in self.counts and len(self.counts) >= self.max_pending:
+            # Buffer is full: flush early and drop this event rather than grow without bound
+            if self._early_flush is None or self._early_flush.done():
+                self._early_flush = asyncio.create_task(self.flush())
+            metrics.inc("link_analytics_events_total", result="dropped")
+            return False
+        self.counts[key] = self.counts.get(key, 0) + 1
+        metrics.inc("link_analytics_events_total", result="accepted")
+        metrics.set("link_analytics_pending_buckets", len(self.counts))
+        return True
+
+    async def flush(self):
+        async with self._flush_lock:
+            if not self.counts:
+                return
+            pending, self.counts = self.counts, {}
+            operations = [
+                UpdateOne(
+                    {"brand_slug": brand_slug, "link": link, "bucket": bucket},
+                    {"$inc": {"count": count}},
+                    upsert=True,
+                )
+                for (brand_slug, link, bucket), count in pending.items()
+            ]
+            start = time.perf_counter()
+            try:
+                await db.link_page_analytics.bulk_write(operations, ordered=False)
+            except Exception as e:
+                logger.error(f"Failed to flush {len(operations)} link analytics buckets: {e}")
+                self._restore(pending)
+            except BaseException:
+                # Cancelled mid-write (e.g. on shutdown): keep the counts for the final flush
+                self._restore(pending)
+                raise
+            metrics.observe("link_analytics_flush_seconds", time.perf_counter() - start, LATENCY_BUCKETS)
+            metrics.set("link_analytics_pending_buckets", len(self.counts))
+
+    def _restore(self, pending: Dict[Tuple[str, str, str], int]):
+        # Put the counts back so the next flush retries them, within the memory bound
+        for key, count in pending.items():
+            if key in self.counts or len(self.counts) < self.max_pending:
+                self.counts[key] = self.counts.get(key, 0) + count
+            else:
+                metrics.inc("link_analytics_events_total", count, result="dropped")
+        metrics.set("link_analytics_pending_buckets", len(self.counts))
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"Link analytics flush loop error: {e}")
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        # Wait for in-flight flushes to unwind (a cancelled write restores its counts) before the final flush
+        for task in (self._task, self._early_flush):
+            if task is not None and not task.done():
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+                except Exception as e:
+                    logger.error(f"Link analytics flush failed during shutdown: {e}")
+        self._task = self._early_flush = None
+        await self.flush()
+
+link_analytics = LinkAnalyticsBuffer(ANALYTICS_MAX_PENDING, ANALYTICS_FLUSH_SECONDS)
+
+@app.on_event("startup")
+async def start_link_analytics():
+    await db.link_page_analytics.create_index(
+        [("brand_slug", 1), ("bucket", 1), ("link", 1)], unique=True
+    )
+    link_analytics.start()
+
+@app.on_event("shutdown")
+async def stop_link_analytics():
+    await link_analytics.stop()
+
+@api_router.post("/link-pages/{brand_slug}/track", status_code=204)
+async def track_link_page_event(brand_slug: str, link: str = "visit"):
+    """Record a visit or link click (link=website|instagram|facebook|whatsapp|google_review|qr:<index>)"""
+    if not is_trackable_link(link):
+        raise HTTPException(status_code=400, detail="Invalid link")
+    # Only count pages that exist; a current snapshot avoids a database read per click
+    try:
+        exists = _link_page_snapshot_is_current(brand_slug) and _link_page_snapshot_path(brand_slug, "json").exists()
+    except ValueError:
+        raise HTTPException(status_code=404, detail="Link page not found")
+    if not exists:
+        # No current snapshot on this instance: check Mongo like the read path, and publish one for the next click
+        link_page = await db.link_pages.find_one({"brand_slug": brand_slug}, {"_id": 0})
+        if not link_page:
+            raise HTTPException(status_code=404, detail="Link page not found")
+        await publish_link_page_snapshot(link_page)
+    link_analytics.record(brand_slug, link)
+    return Response(status_code=204)
+
+class LinkAnalyticsPoint(BaseModel):
+    bucket: str
+    link: str
+    count: int
+
+class LinkAnalyticsSeries(BaseModel):
+    brand_slug: str
+    granularity: str
+    totals: Dict[str, int]
+    points: List[LinkAnalyticsPoint]
+
+@api_router.get("/link-pages/{brand_slug}/analytics", response_model=LinkAnalyticsSeries)
+async def get_link_page_analytics(
+    brand_slug: str,
+    days: int = 7,
+    granularity: str = "hour",
+    current_admin: dict = Depends(get_current_admin)
+):
+    """Aggregated visit and click counts for a link page, including events not yet flushed"""
+    prefix_lengths = {"minute": 16, "hour": 13, "day": 10}
+    if granularity not in prefix_lengths:
+        raise HTTPException(status_code=400, detail="Invalid granularity. Allowed: minute, hour, day")
+    days = max(1, min(days, 366))
+    since = (datetime.now(timezone.utc) - timedelta(days=days)).isoformat()
+    length = prefix_lengths[granularity]
+
+    pipeline = [
+        {"$match": {"brand_slug": brand_slug, "bucket": {"$gte": since}}},
+        {"$group": {
+            "_id": {"bucket": {"$substrBytes": ["$bucket", 0, length]}, "link": "$link"},
+            "count": {"$sum": "$count"},
+        }},
+    ]
+    series: Dict[Tuple[str, str], int] = {}
+    async for row in db.link_page_analytics.aggregate(pipeline):
+        series[(row["_id"]["bucket"], row["_id"]["link"])] = row["count"]
+    for (slug, link, bucket), count in link_analytics.counts.items():
+        if slug == brand_slug and bucket >= since:
+            key = (bucket[:length], link)
+            series[key] = series.get(key, 0) + count
+
+    totals: Dict[str, int] = defaultdict(int)
+    points = []
+    for (bucket, link), count in sorted(series.items()):
+        totals[link] += count
+        points.append({"bucket": bucket, "link": link, "count": count})
+    return {"brand_slug": brand_slug, "granularity": granularity, "totals": dict(totals), "points": points}
+
 # ==================== UPI PAYMENT INFO ====================
 
+def default_upi_payment_info() -> UPIPaymentInfo:
+    return UPIPaymentInfo(
+        company_name="Miswa International",
+        brand_name="Miswa International",
+        gst_number="",
+        upi_id="",
+        qr_code_url=""
+    )
+
 @api_router.get("/upi-payment-info", response_model=UPIPaymentInfo)
-async def get_upi_payment_info():
-    info = await db.upi_payment_info.find_one({"id": "upi_payment_info"}, {"_id": 0})
+async def get_upi_payment_info(reads=Depends(content_reads)):
+    info = await reads.upi_payment_info.find_one({"id": "upi_payment_info"}, {"_id": 0})
     if not info:
-        # Return default
-        default_info = UPIPaymentInfo(
-            company_name="Miswa International",
-            brand_name="Miswa International",
-            gst_number="",
-            upi_id="",
-            qr_code_url=""
-        )
-        return default_info
-    if isinstance(info.get('updated_at'), str):
-        info['updated_at'] = datetime.fromisoformat(info['updated_at'])
-    return UPIPaymentInfo(**info)
+        return default_upi_payment_info()
+    return trusted_response(UPIPaymentInfo, info)
 
 @api_router.post("/upi-payment-info/upload-logo")
 async def upload_upi_logo(file: UploadFile = File(...), current_admin: dict = Depends(get_current_admin)):
@@ -955,7 +2826,7 @@ async def upload_upi_logo(file: UploadFile = File(...), current_admin: dict = De
     # Generate unique filename
     file_id = str(uuid.uuid4())
     filename = f"logo_{file_id}{file_ext}"
-    file_path = UPI_UPLOADS_DIR / filename
+    file_path = upload_path(UPI_UPLOADS_DIR, filename, create=True)
     
     # Save file
     with open(file_path, "wb") as buffer:
@@ -985,7 +2856,7 @@ async def upload_upi_qr_code(file: UploadFile = File(...), current_admin: dict =
     # Generate unique filename
     file_id = str(uuid.uuid4())
     filename = f"qr_{file_id}{file_ext}"
-    file_path = UPI_UPLOADS_DIR / filename
+    file_path = upload_path(UPI_UPLOADS_DIR, filename, create=True)
     
     # Save file
     with open(file_path, "wb") as buffer:
@@ -1000,79 +2871,396 @@ async def upload_upi_qr_code(file: UploadFile = File(...), current_admin: dict =
     return {"url": file_url, "filename": filename}
 
 @api_router.put("/upi-payment-info", response_model=UPIPaymentInfo)
-async def update_upi_payment_info(input: UPIPaymentInfoUpdate, current_admin: dict = Depends(get_current_admin)):
+async def update_upi_payment_info(input: UPIPaymentInfoUpdate, if_match: Optional[str] = Header(None), current_admin: dict = Depends(get_current_admin)):
     update_data = {k: v for k, v in input.model_dump().items() if v is not None}
     update_data['updated_at'] = datetime.now(timezone.utc).isoformat()
     
-    await db.upi_payment_info.update_one(
-        {"id": "upi_payment_info"},
-        {"$set": update_data},
-        upsert=True
+    info = await versioned_update(
+        db.upi_payment_info, {"id": "upi_payment_info"}, update_data, if_match, "UPI payment info not found", upsert=True
     )
-    
-    info = await db.upi_payment_info.find_one({"id": "upi_payment_info"}, {"_id": 0})
-    if isinstance(info.get('updated_at'), str):
-        info['updated_at'] = datetime.fromisoformat(info['updated_at'])
-    return UPIPaymentInfo(**info)
+    invalidate_site_bootstrap()
+    return versioned_response(UPIPaymentInfo, info)
 
 # ==================== SOCIAL MEDIA INFO ====================
 
 @api_router.get("/social-media-info", response_model=SocialMediaInfo)
-async def get_social_media_info():
-    info = await db.social_media_info.find_one({"id": "social_media_info"}, {"_id": 0})
+async def get_social_media_info(reads=Depends(content_reads)):
+    info = await reads.social_media_info.find_one({"id": "social_media_info"}, {"_id": 0})
     if not info:
         # Return default with empty links
-        default_info = SocialMediaInfo(links=[])
-        return default_info
-    if isinstance(info.get('updated_at'), str):
-        info['updated_at'] = datetime.fromisoformat(info['updated_at'])
-    return SocialMediaInfo(**info)
+        return SocialMediaInfo(links=[])
+    return trusted_response(SocialMediaInfo, info)
 
 @api_router.put("/social-media-info", response_model=SocialMediaInfo)
-async def update_social_media_info(input: SocialMediaInfoUpdate, current_admin: dict = Depends(get_current_admin)):
+async def update_social_media_info(input: SocialMediaInfoUpdate, if_match: Optional[str] = Header(None), current_admin: dict = Depends(get_current_admin)):
     update_data = {k: v for k, v in input.model_dump().items() if v is not None}
     update_data['updated_at'] = datetime.now(timezone.utc).isoformat()
     
-    await db.social_media_info.update_one(
-        {"id": "social_media_info"},
-        {"$set": update_data},
-        upsert=True
+    info = await versioned_update(
+        db.social_media_info, {"id": "social_media_info"}, update_data, if_match, "Social media info not found", upsert=True
     )
-    
-    info = await db.social_media_info.find_one({"id": "social_media_info"}, {"_id": 0})
-    if isinstance(info.get('updated_at'), str):
-        info['updated_at'] = datetime.fromisoformat(info['updated_at'])
-    return SocialMediaInfo(**info)
+    invalidate_site_bootstrap()
+    return versioned_response(SocialMediaInfo, info)
+
+# ==================== SITE BOOTSTRAP ====================
+
+# Everything the public site needs on first load, fetched concurrently and served from one cached body.
+# Admin writes to any of the underlying collections invalidate it; the TTL bounds staleness when several
+# worker processes each hold their own copy.
+SITE_BOOTSTRAP_CACHE_SECONDS = float(os.environ.get('SITE_BOOTSTRAP_CACHE_SECONDS', '60'))
+
+metrics.describe("site_bootstrap_requests_total", "counter", "Site bootstrap requests by cache result")
+
+class SiteBootstrap(BaseModel):
+    brands: List[Brand]
+    company_info: CompanyInfo
+    social_media_info: SocialMediaInfo
+    upi_payment_info: UPIPaymentInfo
+    link_pages: List[LinkPage]
+
+class SiteBootstrapCache:
+    def __init__(self, ttl_seconds: float):
+        self.ttl_seconds = ttl_seconds
+        self.body: Optional[bytes] = None
+        self.etag: Optional[str] = None
+        self.expires = 0.0
+        # Bumped on invalidation so a build that raced with an admin write is not cached
+        self.generation = 0
+        self._lock = asyncio.Lock()
+
+    def invalidate(self):
+        self.generation += 1
+        self.body = None
+
+    def fresh(self) -> bool:
+        return self.body is not None and time.monotonic() < self.expires
+
+    async def get(self) -> Tuple[bytes, str, bool]:
+        """Return (body, etag, served_from_cache), building the payload at most once per miss"""
+        if self.fresh():
+            return self.body, self.etag, True
+        async with self._lock:
+            if self.fresh():
+                return self.body, self.etag, True
+            generation = self.generation
+            body = orjson_dumps(await build_site_bootstrap())
+            etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+            if generation == self.generation:
+                self.body, self.etag = body, etag
+                self.expires = time.monotonic() + self.ttl_seconds
+            return body, etag, False
+
+site_bootstrap_cache = SiteBootstrapCache(SITE_BOOTSTRAP_CACHE_SECONDS)
+
+def invalidate_site_bootstrap():
+    site_bootstrap_cache.invalidate()
+
+async def build_site_bootstrap() -> dict:
+    brands, company_info, social_media_info, upi_payment_info, link_pages = await asyncio.gather(
+        db.brands.find({}, {"_id": 0}).to_list(100),
+        db.company_info.find_one({"id": "company_info"}, {"_id": 0}),
+        db.social_media_info.find_one({"id": "social_media_info"}, {"_id": 0}),
+        db.upi_payment_info.find_one({"id": "upi_payment_info"}, {"_id": 0}),
+        db.link_pages.find({}, {"_id": 0}).to_list(100),
+    )
+    return {
+        "brands": [dump_trusted(Brand, doc) for doc in brands],
+        "company_info": dump_trusted(CompanyInfo, company_info or default_company_info().model_dump()),
+        "social_media_info": dump_trusted(SocialMediaInfo, social_media_info or SocialMediaInfo(links=[]).model_dump()),
+        "upi_payment_info": dump_trusted(UPIPaymentInfo, upi_payment_info or default_upi_payment_info().model_dump()),
+        "link_pages": [dump_trusted(LinkPage, doc) for doc in link_pages],
+    }
+
+@api_router.get("/site-bootstrap", response_model=SiteBootstrap)
+async def get_site_bootstrap(request: Request):
+    """Brands, company info, social media, UPI info and link pages in one response"""
+    body, etag, cached = await site_bootstrap_cache.get()
+    metrics.inc("site_bootstrap_requests_total", result="hit" if cached else "miss")
+    headers = {"ETag": etag, "Cache-Control": "public, no-cache"}
+    if etag in request.headers.get("if-none-match", ""):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+# ==================== SITEMAP AND FEEDS ====================
+
+SITE_URL = os.environ.get('SITE_URL', 'https://miswainternational.com').rstrip('/')
+SITE_FEED_TITLE = os.environ.get('SITE_FEED_TITLE', 'Miswa International Blog')
+FEED_MAX_ITEMS = int(os.environ.get('FEED_MAX_ITEMS', '50'))
+# Other workers' writes only reach this process's documents once they are this old (0 = never)
+SITE_FEEDS_MAX_AGE_SECONDS = float(os.environ.get('SITE_FEEDS_MAX_AGE_SECONDS', '300'))
+SITEMAP_MAX_URLS = 50000  # per sitemap file (sitemaps.org limit); beyond that /sitemap.xml becomes an index
+SITEMAP_CHUNK_URLS = 1000  # URLs per precomputed chunk; sitemaps with several chunks are streamed
+SITEMAP_STATIC_PATHS = ("/", "/about", "/brands", "/contact", "/pay")
+# Listing pages whose lastmod follows the newest document of a kind
+SITEMAP_LISTING_PATHS = {"blogs": "/blog", "careers": "/careers", "catalogs": "/catalogs"}
+SITE_FEED_QUERIES = {
+    "blogs": ({"published": True}, {"_id": 0, "slug": 1, "title": 1, "excerpt": 1, "author": 1, "created_at": 1, "updated_at": 1}),
+    "careers": ({"active": True}, {"_id": 0, "created_at": 1, "updated_at": 1}),
+    "catalogs": ({}, {"_id": 0, "created_at": 1, "updated_at": 1}),
+    "link_pages": ({}, {"_id": 0, "brand_slug": 1, "created_at": 1, "updated_at": 1}),
+}
+FEED_MEDIA_TYPES = {"sitemap": "application/xml", "rss": "application/rss+xml", "atom": "application/atom+xml"}
+
+metrics.describe("site_feed_builds_total", "counter", "Rebuilds of the precomputed sitemap and feed documents")
+metrics.describe("site_feed_requests_total", "counter", "Sitemap and feed requests by response status")
+
+def _as_utc(value) -> Optional[datetime]:
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value)
+        except ValueError:
+            return None
+    if not isinstance(value, datetime):
+        return None
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+def _doc_modified(doc: dict) -> Optional[datetime]:
+    return _as_utc(doc.get("updated_at")) or _as_utc(doc.get("created_at"))
+
+def _sitemap_url(path: str, lastmod: Optional[datetime]) -> bytes:
+    entry = f"<url><loc>{html.escape(SITE_URL + path)}</loc>"
+    if lastmod is not None:
+        entry += f"<lastmod>{lastmod.strftime('%Y-%m-%dT%H:%M:%SZ')}</lastmod>"
+    return (entry + "</url>\n").encode()
+
+class FeedDocument:
+    """Precomputed response body, kept as chunks so large sitemaps can be streamed, with its validators"""
+
+    def __init__(self, chunks: List[bytes], media_type: str, last_modified: datetime):
+        self.chunks = chunks
+        self.media_type = media_type
+        self.size = sum(len(chunk) for chunk in chunks)
+        digest = hashlib.blake2b(digest_size=16)
+        for chunk in chunks:
+            digest.update(chunk)
+        self.etag = f'"{digest.hexdigest()}"'
+        self.last_modified = last_modified.astimezone(timezone.utc).replace(microsecond=0)
+
+class SiteFeeds:
+    """sitemap.xml, RSS and Atom documents, rebuilt on the first request after an admin write.
+
+    Only the kinds marked dirty are re-read from Mongo; each kind's sitemap <url> entries are cached
+    as encoded bytes, so a rebuild re-renders the changed kind and then just joins byte strings.
+    """
+
+    def __init__(self):
+        self.entries: Dict[str, List[bytes]] = {kind: [] for kind in SITE_FEED_QUERIES}
+        self.newest: Dict[str, Optional[datetime]] = {kind: None for kind in SITE_FEED_QUERIES}
+        self.blogs: List[dict] = []
+        self.documents: Dict[str, FeedDocument] = {}
+        self.dirty = set(SITE_FEED_QUERIES)
+        self.built_at = 0.0
+        self.started = datetime.now(timezone.utc)
+        self._lock = asyncio.Lock()
+
+    def invalidate(self, kind: str):
+        self.dirty.add(kind)
+
+    def _stale(self) -> bool:
+        if self.dirty:
+            return True
+        return SITE_FEEDS_MAX_AGE_SECONDS > 0 and time.monotonic() - self.built_at > SITE_FEEDS_MAX_AGE_SECONDS
+
+    async def document(self, name: str) -> Optional[FeedDocument]:
+        if self._stale():
+            async with self._lock:
+                if self._stale():
+                    if not self.dirty:
+                        self.dirty.update(SITE_FEED_QUERIES)
+                    await self._refresh()
+        return self.documents.get(name)
+
+    async def _refresh(self):
+        # An invalidation that lands while a kind is being read marks it dirty again, so loop until clean
+        while self.dirty:
+            kinds = set(self.dirty)
+            self.dirty.clear()
+            loaded = await asyncio.gather(*(
+                db[kind].find(*SITE_FEED_QUERIES[kind]).to_list(None) for kind in kinds
+            ))
+            changed = dict(zip(kinds, loaded))
+            self.documents = await asyncio.to_thread(self._render, changed)
+            metrics.inc("site_feed_builds_total")
+        self.built_at = time.monotonic()
+
+    def _render(self, changed: Dict[str, List[dict]]) -> Dict[str, FeedDocument]:
+        for kind, docs in changed.items():
+            modified = [m for m in map(_doc_modified, docs) if m is not None]
+            self.newest[kind] = max(modified, default=None)
+            if kind == "blogs":
+                docs.sort(key=lambda doc: _as_utc(doc.get("created_at")) or self.started, reverse=True)
+                self.blogs = docs
+                self.entries[kind] = [_sitemap_url(f"/blog/{quote(doc['slug'])}", _doc_modified(doc)) for doc in docs if doc.get("slug")]
+            elif kind == "link_pages":
+                self.entries[kind] = [_sitemap_url(f"/{quote(doc['brand_slug'])}", _doc_modified(doc)) for doc in docs if doc.get("brand_slug")]
+
+        # Sitemap pages are always re-rendered; dropping the old ones retires pages the sitemap no longer needs
+        documents = {name: doc for name, doc in self.documents.items() if not name.startswith("sitemap")}
+        documents.update(self._render_sitemaps())
+        if "blogs" in changed or "rss.xml" not in documents:
+            documents["rss.xml"] = self._render_rss()
+            documents["atom.xml"] = self._render_atom()
+        return documents
+
+    def _render_sitemaps(self) -> Dict[str, FeedDocument]:
+        urls = [_sitemap_url(path, None) for path in SITEMAP_STATIC_PATHS]
+        urls += [_sitemap_url(path, self.newest[kind]) for kind, path in SITEMAP_LISTING_PATHS.items()]
+        urls += self.entries["blogs"] + self.entries["link_pages"]
+        last_modified = max((m for m in self.newest.values() if m is not None), default=self.started)
+
+        def urlset(page: List[bytes]) -> FeedDocument:
+            chunks = [b"".join(page[i:i + SITEMAP_CHUNK_URLS]) for i in range(0, len(page), SITEMAP_CHUNK_URLS)]
+            chunks.insert(0, b'<?xml version="1.0" encoding="UTF-8"?>\n<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n')
+            chunks.append(b"</urlset>\n")
+            return FeedDocument(chunks, FEED_MEDIA_TYPES["sitemap"], last_modified)
+
+        if len(urls) <= SITEMAP_MAX_URLS:
+            return {"sitemap.xml": urlset(urls)}
+        documents = {}
+        index = b'<?xml version="1.0" encoding="UTF-8"?>\n<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+        for n, start in enumerate(range(0, len(urls), SITEMAP_MAX_URLS), start=1):
+            documents[f"sitemap-{n}.xml"] = urlset(urls[start:start + SITEMAP_MAX_URLS])
+            index += f"<sitemap><loc>{html.escape(SITE_URL)}/sitemap-{n}.xml</loc></sitemap>\n".encode()
+        documents["sitemap.xml"] = FeedDocument([index + b"</sitemapindex>\n"], FEED_MEDIA_TYPES["sitemap"], last_modified)
+        return documents
+
+    def _feed_items(self):
+        for doc in self.blogs[:FEED_MAX_ITEMS]:
+            link = html.escape(f"{SITE_URL}/blog/{quote(doc['slug'])}")
+            published = _as_utc(doc.get("created_at")) or self.started
+            yield doc, link, published, _doc_modified(doc) or published
+
+    def _render_rss(self) -> FeedDocument:
+        last_modified = self.newest["blogs"] or self.started
+        parts = [
+            '<?xml version="1.0" encoding="UTF-8"?>\n<rss version="2.0" xmlns:atom="http://www.w3.org/2005/Atom"><channel>',
+            f"<title>{html.escape(SITE_FEED_TITLE)}</title><link>{html.escape(SITE_URL)}/blog</link>",
+            f"<description>{html.escape(SITE_FEED_TITLE)}</description>",
+            f'<atom:link href="{html.escape(SITE_URL)}/rss.xml" rel="self" type="application/rss+xml"/>',
+            f"<lastBuildDate>{format_datetime(last_modified, usegmt=True)}</lastBuildDate>\n",
+        ]
+        for doc, link, published, _ in self._feed_items():
+            parts.append(
+                f"<item><title>{html.escape(doc.get('title') or '')}</title><link>{link}</link>"
+                f'<guid isPermaLink="true">{link}</guid><pubDate>{format_datetime(published, usegmt=True)}</pubDate>'
+                f"<description>{html.escape(doc.get('excerpt') or '')}</description></item>\n"
+            )
+        parts.append("</channel></rss>\n")
+        return FeedDocument(["".join(parts).encode()], FEED_MEDIA_TYPES["rss"], last_modified)
+
+    def _render_atom(self) -> FeedDocument:
+        last_modified = self.newest["blogs"] or self.started
+        site = html.escape(SITE_URL)
+        parts = [
+            '<?xml version="1.0" encoding="UTF-8"?>\n<feed xmlns="http://www.w3.org/2005/Atom">',
+            f"<id>{site}/blog</id><title>{html.escape(SITE_FEED_TITLE)}</title>",
+            f"<updated>{last_modified.isoformat()}</updated>",
+            f'<link href="{site}/atom.xml" rel="self"/><link href="{site}/blog"/>\n',
+        ]
+        for doc, link, published, updated in self._feed_items():
+            parts.append(
+                f"<entry><id>{link}</id><title>{html.escape(doc.get('title') or '')}</title>"
+                f'<link href="{link}"/><published>{published.isoformat()}</published><updated>{updated.isoformat()}</updated>'
+                f"<author><name>{html.escape(doc.get('author') or SITE_FEED_TITLE)}</name></author>"
+                f"<summary>{html.escape(doc.get('excerpt') or '')}</summary></entry>\n"
+            )
+        parts.append("</feed>\n")
+        return FeedDocument(["".join(parts).encode()], FEED_MEDIA_TYPES["atom"], last_modified)
+
+site_feeds = SiteFeeds()
+
+def invalidate_site_feeds(kind: str):
+    site_feeds.invalidate(kind)
+
+def _not_modified(request: Request, document: FeedDocument) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return document.etag in if_none_match
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since:
+        try:
+            return parsedate_to_datetime(if_modified_since) >= document.last_modified
+        except (TypeError, ValueError):
+            return False
+    return False
+
+async def feed_response(request: Request, name: str) -> Response:
+    document = await site_feeds.document(name)
+    if document is None:
+        raise HTTPException(status_code=404, detail="Not found")
+    headers = {
+        "ETag": document.etag,
+        "Last-Modified": format_datetime(document.last_modified, usegmt=True),
+        "Cache-Control": "public, no-cache",
+    }
+    if _not_modified(request, document):
+        metrics.inc("site_feed_requests_total", status="304")
+        return Response(status_code=304, headers=headers)
+    metrics.inc("site_feed_requests_total", status="200")
+    if len(document.chunks) > 2:
+        headers["Content-Length"] = str(document.size)
+        return StreamingResponse(iter(document.chunks), media_type=document.media_type, headers=headers)
+    return Response(content=b"".join(document.chunks), media_type=document.media_type, headers=headers)
+
+@app.get("/sitemap.xml", include_in_schema=False)
+async def get_sitemap(request: Request):
+    return await feed_response(request, "sitemap.xml")
+
+@app.get("/sitemap-{page:int}.xml", include_in_schema=False)
+async def get_sitemap_page(page: int, request: Request):
+    return await feed_response(request, f"sitemap-{page}.xml")
+
+@app.get("/rss.xml", include_in_schema=False)
+async def get_rss_feed(request: Request):
+    return await feed_response(request, "rss.xml")
+
+@app.get("/atom.xml", include_in_schema=False)
+async def get_atom_feed(request: Request):
+    return await feed_response(request, "atom.xml")
 
 # ==================== MYLITTLETALES PRODUCTS ====================
 
+MYLITTLETALES_REFRESH_SCHEDULE = os.environ.get('MYLITTLETALES_REFRESH_SCHEDULE', 'every 6h')
+
+async def refresh_mylittletales_products() -> dict:
+    """Fetch products from mylittletales.com and store them for the products endpoint"""
+    async with aiohttp.ClientSession() as session:
+        async with session.get('https://mylittletales.com', timeout=10) as response:
+            if response.status != 200:
+                raise RuntimeError(f"mylittletales.com returned {response.status}")
+            html = await response.text()
+    soup = BeautifulSoup(html, 'html.parser')
+
+    # This is a placeholder - actual scraping logic depends on the website structure
+    products = []
+    await db.external_content.replace_one(
+        {"_id": "mylittletales_products"},
+        {"products": products, "fetched_at": datetime.now(timezone.utc).isoformat()},
+        upsert=True
+    )
+    return {"products": len(products)}
+
+if MYLITTLETALES_REFRESH_SCHEDULE:
+    scheduler.add(
+        "refresh_mylittletales_products", refresh_mylittletales_products, MYLITTLETALES_REFRESH_SCHEDULE,
+        timeout_seconds=60, jitter_seconds=60, description="Fetch the mylittletales.com product list",
+    )
+
 @api_router.get("/mylittletales/products")
 async def get_mylittletales_products():
-    """Fetch products from mylittletales.com"""
-    try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get('https://mylittletales.com', timeout=10) as response:
-                if response.status == 200:
-                    html = await response.text()
-                    soup = BeautifulSoup(html, 'html.parser')
-                    
-                    # This is a placeholder - actual scraping logic depends on the website structure
-                    products = []
-                    # Add basic product structure
-                    return {
-                        "success": True,
-                        "products": products,
-                        "message": "Products fetched successfully"
-                    }
-                else:
-                    return {"success": False, "message": "Could not fetch products"}
-    except Exception as e:
-        logger.error(f"Error fetching mylittletales products: {e}")
-        return {"success": False, "message": str(e)}
+    """Products from mylittletales.com, as last fetched by the refresh job"""
+    stored = await db.external_content.find_one({"_id": "mylittletales_products"}, {"_id": 0})
+    if not stored:
+        return {"success": False, "products": [], "message": "Products have not been fetched yet"}
+    return {
+        "success": True,
+        "products": stored["products"],
+        "fetched_at": stored["fetched_at"],
+        "message": "Products fetched successfully"
+    }
 
 # ==================== INITIALIZE DEFAULT DATA ====================
 
-@app.on_event("startup")
 async def initialize_data():
     """Initialize database with default brand data if empty"""
     brands_count = await db.brands.count_documents({})
@@ -1183,14 +3371,54 @@ async def initialize_data():
         logger.warning("⚠️  Default admin credentials: username='admin', password='admin123'")
         logger.warning("⚠️  Change these credentials immediately in production!")
 
+scheduler.add(
+    "initialize_data", initialize_data, timeout_seconds=120, before_serving=True,
+    description="Seed default brands, link pages and admin user into an empty database",
+)
+
+@app.on_event("startup")
+async def start_scheduler():
+    """Run startup jobs (seeding waits for completion) and start the periodic job loops"""
+    await scheduler.start()
+
+@app.on_event("shutdown")
+async def stop_scheduler():
+    await scheduler.stop()
+
+@app.on_event("startup")
+async def publish_link_page_snapshots():
+    """Publish snapshots for all link pages so the public route never needs Mongo"""
+    link_pages = await db.link_pages.find({}, {"_id": 0}).to_list(1000)
+    for page in link_pages:
+        await publish_link_page_snapshot(page)
+    logger.info(f"Published {len(link_pages)} link page snapshots")
+
+class ShardedStaticFiles(StaticFiles):
+    """StaticFiles that resolves flat URLs (/assets/<name>) to the file's hash-prefix shard directory"""
+
+    def lookup_path(self, path: str):
+        parent, name = os.path.split(path)
+        if UPLOAD_SHARD_DEPTH and name and not name.startswith("."):
+            full_path, stat_result = super().lookup_path(os.path.join(parent, *upload_shard(name), name))
+            if stat_result is not None:
+                return full_path, stat_result
+        # Not migrated yet (or not an upload): the path as requested
+        return super().lookup_path(path)
+
 # Include API routes (ensure this line comes AFTER all @api_router.* route definitions)
 # Serve uploaded files statically from configured uploads base
 if UPLOADS_BASE.exists():
-    app.mount("/uploads", StaticFiles(directory=str(UPLOADS_BASE)), name="uploads")
+    app.mount("/uploads", ShardedStaticFiles(directory=str(UPLOADS_BASE)), name="uploads")
 
 # Serve general assets statically from configured assets dir
 if ASSETS_DIR.exists():
-    app.mount("/assets", StaticFiles(directory=str(ASSETS_DIR)), name="assets")
+    app.mount("/assets", ShardedStaticFiles(directory=str(ASSETS_DIR)), name="assets")
+
+# Serve pre-rendered page snapshots (e.g. /snapshots/link-pages/mylittletales.html)
+app.mount("/snapshots", StaticFiles(directory=str(SNAPSHOTS_DIR)), name="snapshots")
+
+# Serve first-page previews of catalog PDFs (named by the PDF's content hash)
+app.mount("/catalog-previews", StaticFiles(directory=str(CATALOG_PREVIEW_DIR)), name="catalog-previews")
 
 # CORS configuration - supports comma-separated origins
 cors_origins_env = os.environ.get('CORS_ORIGINS', '*')
@@ -1218,7 +3446,497 @@ else:
     logger.warning("⚠️  For production, set CORS_ORIGINS environment variable to specific origins for better security")
     logger.warning("⚠️  Example: CORS_ORIGINS=https://miswainternational.com,https://www.miswainternational.com")
 
+# ==================== RESPONSE COMPRESSION ====================
+
+# Compress responses negotiated via Accept-Encoding (brotli preferred, gzip fallback).
+COMPRESSION_ENABLED = os.environ.get('COMPRESSION_ENABLED', 'true').lower() == 'true'
+COMPRESSION_MIN_SIZE = int(os.environ.get('COMPRESSION_MIN_SIZE', '1024'))
+# Compressed bodies of public GET responses are cached by content hash, so repeated
+# identical responses (blog lists, link pages) are compressed once and reused
+COMPRESSION_CACHE_MB = int(os.environ.get('COMPRESSION_CACHE_MB', '32'))
+COMPRESSIBLE_CONTENT_TYPES = (
+    "application/json", "text/", "application/javascript", "application/xml", "application/rss+xml",
+    "application/atom+xml", "image/svg+xml",
+)
+BROTLI_QUALITY = 5  # per-request compression of streamed/uncached bodies
+BROTLI_CACHED_QUALITY = 9  # bodies that are compressed once and reused can afford a higher quality
+GZIP_LEVEL = 6
+
+metrics.describe("http_compressed_responses_total", "counter", "Responses compressed by content encoding")
+metrics.describe("http_compression_cache_total", "counter", "Compressed body cache lookups by result")
+
+def negotiate_encoding(accept_encoding: str) -> Optional[str]:
+    """Pick br or gzip from an Accept-Encoding header, honouring q=0"""
+    accepted = {}
+    for part in accept_encoding.split(","):
+        coding, _, params = part.strip().partition(";")
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        accepted[coding.strip().lower()] = q
+    if brotli is not None and accepted.get("br", 0) > 0:
+        return "br"
+    if accepted.get("gzip", 0) > 0:
+        return "gzip"
+    return None
+
+def compress_body(encoding: str, body: bytes, cached: bool = False) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=BROTLI_CACHED_QUALITY if cached else BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+
+class StreamCompressor:
+    def __init__(self, encoding: str):
+        if encoding == "br":
+            self._compressor = brotli.Compressor(quality=BROTLI_QUALITY)
+            self._process, self._finish = self._compressor.process, self._compressor.finish
+        else:
+            self._compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+            self._process, self._finish = self._compressor.compress, self._compressor.flush
+
+    def process(self, data: bytes) -> bytes:
+        return self._process(data)
+
+    def finish(self) -> bytes:
+        return self._finish()
+
+class CompressionMiddleware:
+    """ASGI middleware compressing 200 responses above a size threshold with an allowlisted content type"""
+
+    def __init__(self, app, minimum_size: int = 1024, cache: Optional[BytesLRUCache] = None):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.cache = cache
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        request_headers = Headers(scope=scope)
+        encoding = negotiate_encoding(request_headers.get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        # Only anonymous GETs are shared between clients, so only those are cached
+        cacheable = self.cache is not None and scope["method"] == "GET" and "authorization" not in request_headers
+
+        start_message = None
+        passthrough = False
+        compressor: Optional[StreamCompressor] = None
+
+        async def send_wrapper(message):
+            nonlocal start_message, passthrough, compressor
+            message_type = message["type"]
+            if message_type == "http.response.start":
+                start_message = message
+                return
+            if passthrough or message_type != "http.response.body":
+                if start_message is not None:
+                    await send(start_message)
+                    start_message = None
+                passthrough = True
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            if compressor is not None:
+                data = compressor.process(body)
+                if not more_body:
+                    data += compressor.finish()
+                await send({"type": "http.response.body", "body": data, "more_body": more_body})
+                return
+
+            headers = MutableHeaders(raw=list(start_message["headers"]))
+            content_type = headers.get("content-type", "")
+            if (
+                start_message["status"] != 200
+                or "content-encoding" in headers
+                or not content_type.startswith(COMPRESSIBLE_CONTENT_TYPES)
+                or (not more_body and len(body) < self.minimum_size)
+            ):
+                passthrough = True
+                await send(start_message)
+                start_message = None
+                await send(message)
+                return
+
+            headers["Content-Encoding"] = encoding
+            headers.add_vary_header("Accept-Encoding")
+            if more_body:
+                # Streaming response: compress chunk by chunk
+                del headers["Content-Length"]
+                compressor = StreamCompressor(encoding)
+                data = compressor.process(body)
+            else:
+                data = self._compress_whole(encoding, body, cacheable and "no-store" not in headers.get("cache-control", ""))
+                headers["Content-Length"] = str(len(data))
+            metrics.inc("http_compressed_responses_total", encoding=encoding)
+            await send({**start_message, "headers": headers.raw})
+            start_message = None
+            await send({"type": "http.response.body", "body": data, "more_body": more_body})
+
+        await self.app(scope, receive, send_wrapper)
+
+    def _compress_whole(self, encoding: str, body: bytes, cacheable: bool) -> bytes:
+        if not cacheable:
+            return compress_body(encoding, body)
+        key = (encoding, hashlib.blake2b(body, digest_size=16).digest())
+        compressed = self.cache.get(key)
+        if compressed is None:
+            metrics.inc("http_compression_cache_total", result="miss")
+            compressed = compress_body(encoding, body, cached=True)
+            self.cache.put(key, compressed)
+        else:
+            metrics.inc("http_compression_cache_total", result="hit")
+        return compressed
+
+if COMPRESSION_ENABLED:
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=COMPRESSION_MIN_SIZE,
+        cache=BytesLRUCache(COMPRESSION_CACHE_MB * 1024 * 1024) if COMPRESSION_CACHE_MB > 0 else None,
+    )
+
+# ==================== ADMISSION CONTROL ====================
+
+# Requests are sorted into route classes, each with its own concurrency budget, bounded FIFO wait
+# queue and queue deadline. When a class is saturated its requests are shed with 503 + Retry-After,
+# so bcrypt logins, exports, directory scans and uploads can't starve the public site (and vice versa).
+# Limits are per worker process.
+ADMISSION_CONTROL_ENABLED = os.environ.get('ADMISSION_CONTROL_ENABLED', 'true').lower() == 'true'
+ADMISSION_EXEMPT_PATHS = ("/metrics", "/docs", "/openapi.json")
+ADMISSION_CLASS_DEFAULTS = {
+    # class: (concurrency, queue size, queue deadline in seconds)
+    "public": (200, 400, 2.0),
+    "admin": (20, 50, 5.0),
+    "heavy": (4, 16, 10.0),
+    "upload": (8, 16, 10.0),
+}
+ADMISSION_QUEUE_WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# (class, methods, path pattern) checked in order; unmatched requests are "admin" when they carry
+# credentials or change state, otherwise "public"
+ADMISSION_ROUTE_RULES = [
+    ("heavy", {"POST"}, re.compile(r"^/api/admin/(login|2fa/verify|change-password)$")),
+    ("heavy", {"GET"}, re.compile(r"^/api/(inquiries/export|files|mylittletales/products)$")),
+    ("heavy", {"GET"}, re.compile(r"^/api/admin/profiles/[^/]+$")),
+    ("heavy", {"GET", "POST"}, re.compile(r"^/api/admin/(import|imports|archive|snapshot)(/|$)")),
+    ("heavy", {"POST"}, re.compile(r"^/api/([a-z-]+/bulk-[a-z-]+|admin/blogs/render-backfill)$")),
+    ("upload", {"POST"}, re.compile(r"^/api/(assets/upload|upi-payment-info/upload-[a-z-]+|inquiries)$")),
+]
+
+metrics.describe("admission_queue_wait_seconds", "histogram", "Time admitted requests waited for a slot by route class")
+metrics.describe("admission_shed_total", "counter", "Requests rejected with 503 by route class and reason")
+metrics.describe("admission_in_flight", "gauge", "Requests holding an admission slot by route class")
+metrics.describe("admission_queue_depth", "gauge", "Requests waiting for an admission slot by route class")
+
+def admission_class_limits(name: str) -> Tuple[int, int, float]:
+    concurrency, queue_size, deadline = ADMISSION_CLASS_DEFAULTS[name]
+    prefix = f"ADMISSION_{name.upper()}"
+    return (
+        max(1, int(os.environ.get(f"{prefix}_CONCURRENCY", concurrency))),
+        max(0, int(os.environ.get(f"{prefix}_QUEUE", queue_size))),
+        max(0.0, float(os.environ.get(f"{prefix}_DEADLINE_SECONDS", deadline))),
+    )
+
+def classify_request(scope) -> str:
+    method, path = scope["method"], scope["path"]
+    for route_class, methods, pattern in ADMISSION_ROUTE_RULES:
+        if method in methods and pattern.match(path):
+            return route_class
+    if method not in ("GET", "HEAD", "OPTIONS"):
+        return "admin"
+    for key, _ in scope["headers"]:
+        if key == b"authorization":
+            return "admin"
+    return "public"
+
+class RouteClassLimiter:
+    """Concurrency limit with a bounded FIFO wait queue and a per-request queue deadline"""
+
+    def __init__(self, name: str, concurrency: int, queue_size: int, deadline: float):
+        self.name = name
+        self.concurrency = concurrency
+        self.queue_size = queue_size
+        self.deadline = deadline
+        self.active = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+
+    @property
+    def retry_after(self) -> int:
+        return max(1, math.ceil(self.deadline))
+
+    async def acquire(self) -> Optional[str]:
+        """Take a slot, returning None when admitted or the shed reason otherwise"""
+        if self.active < self.concurrency and not self._waiters:
+            self.active += 1
+            return None
+        if len(self._waiters) >= self.queue_size:
+            return "queue_full"
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        self._publish()
+        try:
+            await asyncio.wait_for(waiter, self.deadline)
+            return None
+        except asyncio.TimeoutError:
+            return "deadline"
+        except asyncio.CancelledError:
+            # A slot handed over while we were being cancelled must be passed on
+            if waiter.done() and not waiter.cancelled():
+                self.release()
+            raise
+        finally:
+            if not waiter.done() or waiter.cancelled():
+                try:
+                    self._waiters.remove(waiter)
+                except ValueError:
+                    pass
+            self._publish()
+
+    def release(self):
+        # Hand the slot straight to the oldest live waiter so a burst of new arrivals can't jump the queue
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                self._publish()
+                return
+        self.active -= 1
+        self._publish()
+
+    def _publish(self):
+        metrics.set("admission_in_flight", self.active, route_class=self.name)
+        metrics.set("admission_queue_depth", len(self._waiters), route_class=self.name)
+
+class AdmissionControlMiddleware:
+    """ASGI middleware applying per-route-class concurrency limits and shedding excess load with 503"""
+
+    def __init__(self, app, limiters: Dict[str, RouteClassLimiter], exempt_paths: Tuple[str, ...] = ()):
+        self.app = app
+        self.limiters = limiters
+        self.exempt_paths = exempt_paths
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] in self.exempt_paths:
+            await self.app(scope, receive, send)
+            return
+        route_class = classify_request(scope)
+        limiter = self.limiters[route_class]
+        start = time.perf_counter()
+        reason = await limiter.acquire()
+        if reason is not None:
+            metrics.inc("admission_shed_total", route_class=route_class, reason=reason)
+            scope["admission_shed"] = route_class
+            response = ORJSONResponse(
+                status_code=503,
+                content={"detail": "Server is busy, please retry shortly"},
+                headers={"Retry-After": str(limiter.retry_after)},
+            )
+            await response(scope, receive, send)
+            return
+        metrics.observe("admission_queue_wait_seconds", time.perf_counter() - start, ADMISSION_QUEUE_WAIT_BUCKETS, route_class=route_class)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            limiter.release()
+
+if ADMISSION_CONTROL_ENABLED:
+    app.add_middleware(
+        AdmissionControlMiddleware,
+        limiters={name: RouteClassLimiter(name, *admission_class_limits(name)) for name in ADMISSION_CLASS_DEFAULTS},
+        exempt_paths=ADMISSION_EXEMPT_PATHS,
+    )
+
+# ==================== METRICS MIDDLEWARE ====================
+
+class MetricsMiddleware:
+    """ASGI middleware recording request counts, latency and response size per route template"""
+
+    def __init__(self, app, registry: MetricsRegistry, exclude_prefixes: Tuple[str, ...] = (), server_timing: bool = False):
+        self.app = app
+        self.registry = registry
+        self.exclude_prefixes = exclude_prefixes
+        self.server_timing = server_timing
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"].startswith(self.exclude_prefixes):
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status_code = 500
+        response_size = 0
+        stats = RequestStats(scope)
+        start = time.perf_counter()
+
+        async def send_wrapper(message):
+            nonlocal status_code, response_size
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                if self.server_timing:
+                    elapsed_ms = (time.perf_counter() - start) * 1000
+                    timing = f'db;dur={stats.db_time_ms:.1f};desc="{stats.db_calls} calls", app;dur={elapsed_ms:.1f}'
+                    message = {**message, "headers": [*message.get("headers", []), (b"server-timing", timing.encode())]}
+            elif message["type"] == "http.response.body":
+                response_size += len(message.get("body", b""))
+            await send(message)
+
+        self.registry.inc("http_requests_in_progress", method=method)
+        token = request_stats_var.set(stats)
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            request_stats_var.reset(token)
+            duration = time.perf_counter() - start
+            self.registry.inc("http_requests_in_progress", -1, method=method)
+            route = self._route_label(scope)
+            self.registry.inc("http_requests_total", method=method, route=route, status=str(status_code))
+            self.registry.observe("http_request_duration_seconds", duration, LATENCY_BUCKETS, method=method, route=route)
+            self.registry.observe("http_response_size_bytes", response_size, RESPONSE_SIZE_BUCKETS, method=method, route=route)
+            self.registry.observe("http_request_db_calls", stats.db_calls, DB_CALL_BUCKETS, method=method, route=route)
+            self.registry.observe("http_request_db_time_seconds", stats.db_time_ms / 1000, LATENCY_BUCKETS, method=method, route=route)
+
+    @staticmethod
+    def _route_label(scope) -> str:
+        # FastAPI stores the matched route on the scope; use its template to keep label cardinality bounded
+        route = scope.get("route")
+        if route is not None and hasattr(route, "path"):
+            return route.path
+        if "admission_shed" in scope:
+            # Shed before routing; label by route class instead of lumping into <unmatched>
+            return f"<shed:{scope['admission_shed']}>"
+        for prefix in STATIC_MOUNT_PREFIXES:
+            if scope["path"].startswith(prefix + "/"):
+                return f"{prefix}/{{path}}"
+        return "<unmatched>"
+
+if METRICS_ENABLED:
+    app.add_middleware(
+        MetricsMiddleware,
+        registry=metrics,
+        exclude_prefixes=STATIC_MOUNT_PREFIXES if METRICS_EXCLUDE_STATIC else (),
+        server_timing=SERVER_TIMING_ENABLED,
+    )
+
+    @app.get("/metrics", include_in_schema=False)
+    async def get_metrics(request: Request):
+        """Expose collected metrics in Prometheus text format"""
+        if METRICS_TOKEN and request.headers.get("authorization") != f"Bearer {METRICS_TOKEN}":
+            raise HTTPException(status_code=401, detail="Invalid metrics token")
+        return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
+# ==================== REQUEST PROFILING ====================
+
+# Admins can profile a single request by sending "X-Profile: 1" (or ?__profile=1) with their bearer token.
+# PROFILE_SAMPLE_RATE additionally profiles a random fraction of all requests in the background.
+PROFILING_ENABLED = os.environ.get('PROFILING_ENABLED', 'true').lower() == 'true' and Profiler is not None
+PROFILE_SAMPLE_RATE = float(os.environ.get('PROFILE_SAMPLE_RATE', '0'))
+PROFILE_INTERVAL = float(os.environ.get('PROFILE_INTERVAL', '0.001'))
+PROFILE_MAX_STORED = int(os.environ.get('PROFILE_MAX_STORED', '50'))
+PROFILES_DIR = Path(os.environ.get("PROFILES_DIR", str(DATA_DIR / "profiles")))
+
+metrics.describe("profiled_requests_total", "counter", "Requests run under the sampling profiler by trigger")
+
+async def get_admin_from_token(token: str) -> Optional[dict]:
+    """Resolve a bearer token to an admin user without raising (used outside the dependency system)"""
+    try:
+        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+    except JWTError:
+        return None
+    username = payload.get("sub")
+    if not username or payload.get("stage") == "pending_otp":
+        return None
+    return await db.admin_users.find_one({"username": username}, {"_id": 0})
+
+def _save_profile(profile_id: str, session, meta: dict):
+    PROFILES_DIR.mkdir(parents=True, exist_ok=True)
+    session.save(str(PROFILES_DIR / f"{profile_id}.pyisession"))
+    (PROFILES_DIR / f"{profile_id}.meta.json").write_text(json.dumps(meta))
+    # Keep only the most recent PROFILE_MAX_STORED profiles
+    stored = sorted(PROFILES_DIR.glob("*.meta.json"), key=lambda p: p.stat().st_mtime, reverse=True)
+    for old in stored[PROFILE_MAX_STORED:]:
+        old_id = old.name[:-len(".meta.json")]
+        old.unlink(missing_ok=True)
+        (PROFILES_DIR / f"{old_id}.pyisession").unlink(missing_ok=True)
+
+class ProfilingMiddleware:
+    """Runs admin-requested or randomly sampled requests under pyinstrument and stores the session"""
+
+    def __init__(self, app, sample_rate: float = 0.0, interval: float = 0.001):
+        self.app = app
+        self.sample_rate = sample_rate
+        self.interval = interval
+        # pyinstrument allows a single active profiler per thread, so profile one request at a time
+        self._active = False
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or self._active:
+            await self.app(scope, receive, send)
+            return
+
+        trigger = None
+        admin_token = None
+        for key, value in scope["headers"]:
+            if key == b"x-profile" and value not in (b"", b"0"):
+                trigger = "admin"
+            elif key == b"authorization" and value[:7].lower() == b"bearer ":
+                admin_token = value[7:].decode("latin-1")
+        if trigger is None and b"__profile=1" in scope.get("query_string", b""):
+            trigger = "admin"
+        if trigger == "admin":
+            admin = await get_admin_from_token(admin_token) if admin_token else None
+            if admin is None:
+                trigger = None
+        if trigger is None and self.sample_rate > 0 and random.random() < self.sample_rate:
+            trigger = "sampled"
+        if trigger is None:
+            await self.app(scope, receive, send)
+            return
+
+        profile_id = uuid.uuid4().hex
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start" and trigger == "admin":
+                message = {**message, "headers": [*message.get("headers", []), (b"x-profile-id", profile_id.encode())]}
+            await send(message)
+
+        self._active = True
+        profiler = Profiler(interval=self.interval, async_mode="enabled")
+        started_at = datetime.now(timezone.utc)
+        profiler.start()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            session = profiler.stop()
+            self._active = False
+            route = scope.get("route")
+            meta = {
+                "id": profile_id,
+                "trigger": trigger,
+                "method": scope["method"],
+                "path": scope["path"],
+                "route": route.path if route is not None and hasattr(route, "path") else None,
+                "duration_ms": round(session.duration * 1000, 2),
+                "created_at": started_at.isoformat(),
+            }
+            metrics.inc("profiled_requests_total", trigger=trigger)
+            try:
+                await asyncio.to_thread(_save_profile, profile_id, session, meta)
+            except Exception as e:
+                logger.error(f"Failed to store profile {profile_id}: {e}")
+
+if PROFILING_ENABLED:
+    app.add_middleware(ProfilingMiddleware, sample_rate=PROFILE_SAMPLE_RATE, interval=PROFILE_INTERVAL)
+
 # Configure CORS middleware
+# Registered last so it is the outermost middleware: responses produced by the middleware above
+# (e.g. admission-control 503s) still carry Access-Control-Allow-Origin
 # Note: When allow_credentials=True, you cannot use allow_origins=['*']
 # This is a security restriction in the CORS specification
 app.add_middleware(
@@ -1229,10 +3947,58 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+class ProfileSummary(BaseModel):
+    id: str
+    trigger: str
+    method: str
+    path: str
+    route: Optional[str] = None
+    duration_ms: float
+    created_at: datetime
+
+@api_router.get("/admin/profiles", response_model=List[ProfileSummary])
+async def list_profiles(current_admin: dict = Depends(get_current_admin)):
+    """List stored request profiles, newest first"""
+    def _load():
+        if not PROFILES_DIR.exists():
+            return []
+        return [json.loads(p.read_text()) for p in PROFILES_DIR.glob("*.meta.json")]
+    profiles = await asyncio.to_thread(_load)
+    profiles.sort(key=lambda p: p["created_at"], reverse=True)
+    return profiles
+
+@api_router.get("/admin/profiles/{profile_id}")
+async def download_profile(profile_id: str, format: str = "speedscope", current_admin: dict = Depends(get_current_admin)):
+    """Download a stored profile as speedscope JSON (flame graph), HTML or plain text"""
+    if Profiler is None:
+        raise HTTPException(status_code=503, detail="Profiling is not available (pyinstrument not installed)")
+    renderers = {
+        "speedscope": (SpeedscopeRenderer, "application/json", "speedscope.json"),
+        "html": (HTMLRenderer, "text/html", "html"),
+        "text": (ConsoleRenderer, "text/plain", "txt"),
+    }
+    if format not in renderers:
+        raise HTTPException(status_code=400, detail=f"Invalid format. Allowed formats: {', '.join(renderers)}")
+    session_path = PROFILES_DIR / f"{Path(profile_id).name}.pyisession"
+    if not session_path.exists():
+        raise HTTPException(status_code=404, detail="Profile not found")
+    renderer_cls, media_type, ext = renderers[format]
+    content = await asyncio.to_thread(lambda: renderer_cls().render(ProfilerSession.load(str(session_path))))
+    return PlainTextResponse(
+        content,
+        media_type=media_type,
+        headers={"Content-Disposition": f"attachment; filename=profile-{profile_id}.{ext}"}
+    )
+
 @app.on_event("shutdown")
 async def shutdown_db_client():
     client.close()
 
+@app.on_event("shutdown")
+async def shutdown_process_pool():
+    if _process_pool is not None:
+        _process_pool.shutdown(wait=False, cancel_futures=True)
+
 # ==================== GENERIC ASSET UPLOAD ====================
 @api_router.post("/assets/upload")
 async def upload_asset(
@@ -1258,7 +4024,7 @@ async def upload_asset(
     file_id = str(uuid.uuid4())
     safe_prefix = "asset_"
     filename = f"{safe_prefix}{file_id}{file_ext}"
-    file_path = ASSETS_DIR / filename
+    file_path = upload_path(ASSETS_DIR, filename, create=True)
 
     # Save file
     with open(file_path, "wb") as buffer:
@@ -1281,7 +4047,7 @@ def _scan_dir_for_files(base_path: Path, url_prefix: str, category: str) -> List
     items: List[UploadedFileItem] = []
     if not base_path.exists():
         return items
-    for entry in base_path.iterdir():
+    for entry in iter_upload_files(base_path):
         if entry.is_file():
             try:
                 stat = entry.stat()
@@ -1311,6 +4077,96 @@ async def list_uploaded_files(current_admin: dict = Depends(get_current_admin)):
     results.sort(key=lambda x: x.modified_at, reverse=True)
     return results
 
+# Unused upload sweep: only names the upload handlers generate (optional prefix + uuid4 + extension) are
+# candidates, and only once they are older than the grace period and no stored document mentions them.
+UPLOAD_SWEEP_SCHEDULE = os.environ.get('UPLOAD_SWEEP_SCHEDULE', '30 3 * * *')
+UPLOAD_SWEEP_GRACE_HOURS = float(os.environ.get('UPLOAD_SWEEP_GRACE_HOURS', '24'))
+_GENERATED_UPLOAD_RE = re.compile(r"(?:asset_|logo_|qr_)?[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\.[A-Za-z0-9]+")
+UPLOAD_REFERENCE_COLLECTIONS = (
+    "brands", "catalogs", "blogs", "careers", "link_pages", "company_info", "upi_payment_info",
+    "social_media_info", "inquiries",
+)
+
+def _unused_upload_candidates(cutoff: float) -> List[Path]:
+    candidates = []
+    for directory in SHARDED_UPLOAD_DIRS:
+        for entry in iter_upload_files(directory):
+            if _GENERATED_UPLOAD_RE.fullmatch(entry.name) and entry.is_file() and entry.stat().st_mtime < cutoff:
+                candidates.append(entry)
+    return candidates
+
+def _delete_upload_files(paths: List[Path]) -> Tuple[int, int]:
+    deleted = freed = 0
+    for path in paths:
+        try:
+            size = path.stat().st_size
+            path.unlink()
+            deleted, freed = deleted + 1, freed + size
+        except OSError as e:
+            logger.error(f"Failed deleting unused upload {path}: {e}")
+    return deleted, freed
+
+async def sweep_unused_uploads() -> dict:
+    """Delete generated upload files that are past the grace period and referenced by no document"""
+    # Candidates are listed before references are read, so anything referenced meanwhile is kept
+    candidates = await asyncio.to_thread(_unused_upload_candidates, time.time() - UPLOAD_SWEEP_GRACE_HOURS * 3600)
+    if not candidates:
+        return {"deleted": 0, "bytes": 0}
+    referenced = set()
+    for name in UPLOAD_REFERENCE_COLLECTIONS:
+        async for doc in db[name].find({}, {"_id": 0}):
+            referenced.update(_GENERATED_UPLOAD_RE.findall(str(doc)))
+    unused = [path for path in candidates if path.name not in referenced]
+    deleted, freed = await asyncio.to_thread(_delete_upload_files, unused)
+    if deleted:
+        logger.info(f"Swept {deleted} unused uploads ({freed} bytes)")
+    return {"deleted": deleted, "bytes": freed}
+
+def _migrate_upload_dir(directory: Path) -> Tuple[int, int]:
+    moved = conflicts = 0
+    for path in list(iter_upload_files(directory)):
+        target = upload_path(directory, path.name)
+        if path == target:
+            continue
+        if target.exists():
+            # Same name in two places should not happen with generated names; leave both for a human
+            logger.warning(f"Not moving {path}: {target} already exists")
+            conflicts += 1
+            continue
+        target.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(path, target)
+        moved += 1
+    # Drop shard directories emptied by a change of UPLOAD_SHARD_DEPTH
+    for root, dirs, files in os.walk(directory, topdown=False):
+        if Path(root) != directory and is_upload_shard_dir(directory, Path(root)) and not dirs and not files:
+            try:
+                os.rmdir(root)
+            except OSError:
+                pass
+    return moved, conflicts
+
+async def migrate_upload_layout() -> dict:
+    """Move uploads that are not where the current UPLOAD_SHARD_DEPTH expects them (e.g. the old flat layout)"""
+    totals = {"moved": 0, "conflicts": 0}
+    for directory in SHARDED_UPLOAD_DIRS:
+        moved, conflicts = await asyncio.to_thread(_migrate_upload_dir, directory)
+        totals["moved"] += moved
+        totals["conflicts"] += conflicts
+    if totals["moved"]:
+        logger.info(f"Moved {totals['moved']} uploads into the sharded layout")
+    return totals
+
+scheduler.add(
+    "migrate_upload_layout", migrate_upload_layout, timeout_seconds=3600,
+    description="Move uploaded files into their hash-prefix shard directories",
+)
+
+if UPLOAD_SWEEP_SCHEDULE:
+    scheduler.add(
+        "sweep_unused_uploads", sweep_unused_uploads, UPLOAD_SWEEP_SCHEDULE, timeout_seconds=600,
+        jitter_seconds=300, description="Delete uploaded files no document references",
+    )
+
 class DeleteFileRequest(BaseModel):
     category: str  # assets | uploads/upi | uploads/cv
     filename: str
@@ -1325,7 +4181,10 @@ async def delete_uploaded_file(req: DeleteFileRequest, current_admin: dict = Dep
         raise HTTPException(status_code=400, detail="Invalid category")
 
     base_dir = ASSETS_DIR if category == "assets" else (UPI_UPLOADS_DIR if category == "uploads/upi" else UPLOADS_DIR)
-    file_path = base_dir / filename
+    try:
+        file_path = find_upload(base_dir, filename)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid filename")
     if not file_path.exists():
         raise HTTPException(status_code=404, detail="File not found")
     try:
@@ -1336,5 +4195,1294 @@ async def delete_uploaded_file(req: DeleteFileRequest, current_admin: dict = Dep
         logger.error(f"Failed deleting file {file_path}: {e}")
         raise HTTPException(status_code=500, detail="Failed to delete file")
 
+# ==================== BULK ADMIN OPERATIONS ====================
+
+# Multi-item admin actions: one existence lookup and one bulk_write per collection, with a result per
+# requested item. Files (inquiry CVs, uploads) are unlinked in a background batch after the response.
+BULK_MAX_ITEMS = int(os.environ.get('BULK_MAX_ITEMS', '1000'))
+
+class BulkIdsRequest(BaseModel):
+    ids: List[str] = Field(..., min_length=1, max_length=BULK_MAX_ITEMS)
+
+class BulkPublishRequest(BulkIdsRequest):
+    published: bool
+
+class BulkActivateRequest(BulkIdsRequest):
+    active: bool
+
+class CatalogBulkUpdateItem(BaseModel):
+    id: str
+    version: Optional[int] = None  # Same check as If-Match on PUT /catalogs/{id}
+    title: Optional[str] = None
+    description: Optional[str] = None
+    category: Optional[str] = None
+    pdf_url: Optional[str] = None
+    image_url: Optional[str] = None
+
+class CatalogBulkUpdateRequest(BaseModel):
+    items: List[CatalogBulkUpdateItem] = Field(..., min_length=1, max_length=BULK_MAX_ITEMS)
+
+class BulkDeleteFilesRequest(BaseModel):
+    files: List[DeleteFileRequest] = Field(..., min_length=1, max_length=BULK_MAX_ITEMS)
+
+class BulkItemResult(BaseModel):
+    id: str
+    status: str  # ok | not_found | conflict | invalid | error
+    detail: Optional[str] = None
+
+class BulkResult(BaseModel):
+    requested: int
+    succeeded: int
+    results: List[BulkItemResult]
+
+def _bulk_result(results: List[BulkItemResult]) -> BulkResult:
+    return BulkResult(
+        requested=len(results),
+        succeeded=sum(1 for r in results if r.status == "ok"),
+        results=results
+    )
+
+def _unlink_files(paths: List[Path]):
+    """Background batch delete; missing files are ignored"""
+    removed = 0
+    for path in paths:
+        try:
+            path.unlink()
+            removed += 1
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.error(f"Failed deleting file {path}: {e}")
+    if paths:
+        logger.info(f"Bulk deleted {removed}/{len(paths)} files")
+
+def _unlink_uploads(directory: Path, filenames: List[str]):
+    """Background batch delete of uploads by name, wherever in the shard layout they are stored"""
+    paths = []
+    for name in filenames:
+        try:
+            paths.append(find_upload(directory, name))
+        except ValueError:
+            logger.warning(f"Skipping invalid upload filename {name!r}")
+    _unlink_files(paths)
+
+async def _bulk_by_id(collection, ids: List[str], make_operation, fields: Tuple[str, ...] = ()) -> Tuple[Dict[str, BulkItemResult], Dict[str, dict]]:
+    """Look up ids once, run make_operation(doc) for each existing one in a single bulk_write"""
+    ids = list(dict.fromkeys(ids))
+    projection = {"_id": 0, "id": 1, **{field: 1 for field in fields}}
+    found = {doc["id"]: doc for doc in await collection.find({"id": {"$in": ids}}, projection).to_list(None)}
+    results = {i: BulkItemResult(id=i, status="ok" if i in found else "not_found") for i in ids}
+    written = [i for i in ids if i in found]
+    if written:
+        try:
+            await collection.bulk_write([make_operation(found[i]) for i in written], ordered=False)
+        except BulkWriteError as e:
+            for error in e.details.get("writeErrors", []):
+                item_id = written[error["index"]]
+                results[item_id] = BulkItemResult(id=item_id, status="error", detail=error.get("errmsg"))
+                found.pop(item_id, None)
+    return results, found
+
+@api_router.post("/inquiries/bulk-delete", response_model=BulkResult)
+async def bulk_delete_inquiries(req: BulkIdsRequest, background_tasks: BackgroundTasks, current_admin: dict = Depends(get_current_admin)):
+    results, deleted = await _bulk_by_id(
+        db.inquiries, req.ids, lambda doc: DeleteOne({"id": doc["id"]}), fields=("cv_filename",)
+    )
+    background_tasks.add_task(
+        _unlink_uploads, UPLOADS_DIR, [doc["cv_filename"] for doc in deleted.values() if doc.get("cv_filename")]
+    )
+    return _bulk_result(list(results.values()))
+
+@api_router.post("/careers/bulk-delete", response_model=BulkResult)
+async def bulk_delete_careers(req: BulkIdsRequest, current_admin: dict = Depends(get_current_admin)):
+    results, deleted = await _bulk_by_id(db.careers, req.ids, lambda doc: DeleteOne({"id": doc["id"]}))
+    for career_id in deleted:
+        search_index.remove("careers", career_id)
+    invalidate_site_feeds("careers")
+    return _bulk_result(list(results.values()))
+
+@api_router.post("/careers/bulk-activate", response_model=BulkResult)
+async def bulk_activate_careers(req: BulkActivateRequest, current_admin: dict = Depends(get_current_admin)):
+    update = {"$set": {"active": req.active}, "$inc": {"version": 1}}
+    results, updated = await _bulk_by_id(db.careers, req.ids, lambda doc: UpdateOne({"id": doc["id"]}, update))
+    await reindex_search("careers", {"id": {"$in": list(updated)}})
+    invalidate_site_feeds("careers")
+    return _bulk_result(list(results.values()))
+
+@api_router.post("/blogs/bulk-publish", response_model=BulkResult)
+async def bulk_publish_blogs(req: BulkPublishRequest, current_admin: dict = Depends(get_current_admin)):
+    update = {
+        "$set": {"published": req.published, "updated_at": datetime.now(timezone.utc).isoformat()},
+        "$inc": {"version": 1}
+    }
+    results, updated = await _bulk_by_id(db.blogs, req.ids, lambda doc: UpdateOne({"id": doc["id"]}, update))
+    await reindex_search("blogs", {"id": {"$in": list(updated)}})
+    invalidate_site_feeds("blogs")
+    return _bulk_result(list(results.values()))
+
+@api_router.post("/catalogs/bulk-update", response_model=BulkResult)
+async def bulk_update_catalogs(req: CatalogBulkUpdateRequest, current_admin: dict = Depends(get_current_admin)):
+    items = {item.id: item for item in req.items}
+    results: Dict[str, BulkItemResult] = {}
+
+    def make_operation(doc: dict):
+        item = items[doc["id"]]
+        update_filter = {"id": item.id}
+        if item.version is not None:
+            update_filter["version"] = {"$in": [0, None]} if item.version == 0 else item.version
+        fields = item.model_dump(exclude={"id", "version"}, exclude_none=True)
+        return UpdateOne(update_filter, {"$set": fields, "$inc": {"version": 1}})
+
+    # Items whose version is already stale are reported without being sent
+    current = {
+        doc["id"]: doc.get("version", 0)
+        for doc in await db.catalogs.find({"id": {"$in": list(items)}}, {"_id": 0, "id": 1, "version": 1}).to_list(None)
+    }
+    sendable = []
+    for item in items.values():
+        if item.id in current and item.version is not None and item.version != current[item.id]:
+            results[item.id] = BulkItemResult(id=item.id, status="conflict", detail=f"Current version is {current[item.id]}")
+        elif not item.model_dump(exclude={"id", "version"}, exclude_none=True):
+            results[item.id] = BulkItemResult(id=item.id, status="invalid", detail="No fields to update")
+        else:
+            sendable.append(item.id)
+    if sendable:
+        written, _ = await _bulk_by_id(db.catalogs, sendable, make_operation)
+        results.update(written)
+        # A versioned update that lost a race in between matches nothing; detect it from the new versions
+        versioned = [i for i in sendable if written[i].status == "ok" and items[i].version is not None]
+        if versioned:
+            after = {
+                doc["id"]: doc.get("version", 0)
+                for doc in await db.catalogs.find({"id": {"$in": versioned}}, {"_id": 0, "id": 1, "version": 1}).to_list(None)
+            }
+            for i in versioned:
+                if after.get(i) != items[i].version + 1:
+                    results[i] = BulkItemResult(id=i, status="conflict", detail=f"Current version is {after.get(i)}")
+        await reindex_search("catalogs", {"id": {"$in": [i for i in sendable if results[i].status == "ok"]}})
+        invalidate_site_feeds("catalogs")
+        process_catalog_pdfs_soon()
+    return _bulk_result([results[item_id] for item_id in items])
+
+@api_router.post("/files/bulk-delete", response_model=BulkResult)
+async def bulk_delete_files(req: BulkDeleteFilesRequest, background_tasks: BackgroundTasks, current_admin: dict = Depends(get_current_admin)):
+    base_dirs = {"assets": ASSETS_DIR, "uploads/upi": UPI_UPLOADS_DIR, "uploads/cv": UPLOADS_DIR}
+    results: Dict[str, BulkItemResult] = {}
+    paths = []
+    for item in req.files:
+        key = f"{item.category}/{item.filename}"
+        base_dir = base_dirs.get(item.category)
+        try:
+            file_path = find_upload(base_dir, item.filename) if base_dir is not None else None
+        except ValueError:
+            file_path = None
+        if file_path is None:
+            results[key] = BulkItemResult(id=key, status="invalid", detail="Invalid category or filename")
+            continue
+        if not file_path.is_file():
+            results[key] = BulkItemResult(id=key, status="not_found")
+            continue
+        results[key] = BulkItemResult(id=key, status="ok")
+        paths.append(file_path)
+    background_tasks.add_task(_unlink_files, paths)
+    return _bulk_result(list(results.values()))
+
+# ==================== INQUIRY ARCHIVE ====================
+
+# Inquiries older than INQUIRY_ARCHIVE_AFTER_DAYS move to cold storage: per batch and month, a gzipped NDJSON
+# part (one inquiry per line) and a tar of its CVs side by side under INQUIRY_ARCHIVE_DIR/YYYY/MM/. Parts are
+# written and renamed into place before the batch is deleted from Mongo, so a crash can at worst archive an
+# inquiry twice; search and restore use the newest copy. Restored inquiries stay hot for
+# INQUIRY_ARCHIVE_RESTORE_DAYS before they are eligible again.
+INQUIRY_ARCHIVE_DIR = Path(os.environ.get("INQUIRY_ARCHIVE_DIR", str(DATA_DIR / "archive" / "inquiries")))
+INQUIRY_ARCHIVE_AFTER_DAYS = int(os.environ.get('INQUIRY_ARCHIVE_AFTER_DAYS', '365'))
+INQUIRY_ARCHIVE_RESTORE_DAYS = int(os.environ.get('INQUIRY_ARCHIVE_RESTORE_DAYS', '30'))
+INQUIRY_ARCHIVE_SCHEDULE = os.environ.get('INQUIRY_ARCHIVE_SCHEDULE', '0 4 * * *')
+INQUIRY_ARCHIVE_BATCH_SIZE = int(os.environ.get('INQUIRY_ARCHIVE_BATCH_SIZE', '500'))
+INQUIRY_ARCHIVE_SEARCH_FIELDS = ("name", "email", "phone", "company", "message")
+INQUIRY_ARCHIVE_DIR.mkdir(parents=True, exist_ok=True)
+
+class ArchivedInquiry(Inquiry):
+    part: str  # archive part (relative to INQUIRY_ARCHIVE_DIR) holding this inquiry
+    cv_archived: bool = False
+
+class ArchiveSearchResults(BaseModel):
+    results: List[ArchivedInquiry]
+    scanned_parts: int
+    truncated: bool
+
+class ArchiveRestoreRequest(BulkIdsRequest):
+    part: Optional[str] = None  # from search results; without it every part is scanned
+
+def _archive_partition(doc: dict) -> str:
+    created = _as_utc(doc.get("created_at"))
+    return created.strftime("%Y/%m") if created else "undated"
+
+def _cv_archive_path(part: Path) -> Path:
+    return part.with_name(part.name[:-len(".ndjson.gz")] + "-cvs.tar")
+
+def _fsync_file(path: Path):
+    with open(path, "rb") as f:
+        os.fsync(f.fileno())
+
+def _write_archive_part(partition: str, run_id: str, docs: List[dict]) -> int:
+    """Write one NDJSON part plus its CV tar; returns how many CVs were packed"""
+    directory = INQUIRY_ARCHIVE_DIR / partition
+    directory.mkdir(parents=True, exist_ok=True)
+    stem = f"inquiries-{partition.replace('/', '-')}-{run_id}-{uuid.uuid4().hex[:8]}"
+    part, cv_tar = directory / f"{stem}.ndjson.gz", directory / f"{stem}-cvs.tar"
+    part_tmp, cv_tmp = directory / f".{part.name}.tmp", directory / f".{cv_tar.name}.tmp"
+    packed = 0
+    # CVs are already-compressed PDF/DOCX files, so they go in a plain tar
+    with tarfile.open(cv_tmp, "w") as tar:
+        for doc in docs:
+            name = doc.get("cv_filename")
+            try:
+                path = find_upload(UPLOADS_DIR, name) if name else None
+            except ValueError:
+                path = None
+            doc["cv_archived"] = bool(path and path.is_file())
+            if doc["cv_archived"]:
+                tar.add(path, arcname=name)
+                packed += 1
+    with gzip.open(part_tmp, "wb", compresslevel=6) as f:
+        for doc in docs:
+            f.write(orjson.dumps(doc) + b"\n")
+    if packed:
+        _fsync_file(cv_tmp)
+        os.replace(cv_tmp, cv_tar)
+    else:
+        cv_tmp.unlink()
+    _fsync_file(part_tmp)
+    os.replace(part_tmp, part)
+    return packed
+
+async def archive_old_inquiries() -> dict:
+    """Move inquiries past the archive age to cold storage, one batch at a time"""
+    now = datetime.now(timezone.utc)
+    query = {
+        "created_at": {"$lt": (now - timedelta(days=INQUIRY_ARCHIVE_AFTER_DAYS)).isoformat()},
+        "$or": [
+            {"restored_at": None},
+            {"restored_at": {"$lt": (now - timedelta(days=INQUIRY_ARCHIVE_RESTORE_DAYS)).isoformat()}},
+        ],
+    }
+    run_id = now.strftime("%Y%m%dT%H%M%S")
+    totals = {"archived": 0, "cvs": 0, "parts": 0}
+    while True:
+        batch = await db.inquiries.find(query, {"_id": 0}).sort("created_at", 1).limit(INQUIRY_ARCHIVE_BATCH_SIZE).to_list(None)
+        if not batch:
+            break
+        partitions = defaultdict(list)
+        for doc in batch:
+            partitions[_archive_partition(doc)].append(doc)
+        for partition, docs in partitions.items():
+            totals["cvs"] += await asyncio.to_thread(_write_archive_part, partition, run_id, docs)
+            totals["parts"] += 1
+        await db.inquiries.delete_many({"id": {"$in": [doc["id"] for doc in batch]}})
+        await asyncio.to_thread(
+            _unlink_uploads, UPLOADS_DIR, [doc["cv_filename"] for doc in batch if doc.get("cv_archived")]
+        )
+        totals["archived"] += len(batch)
+        if len(batch) < INQUIRY_ARCHIVE_BATCH_SIZE:
+            break
+    if totals["archived"]:
+        logger.info(f"Archived {totals['archived']} inquiries ({totals['cvs']} CVs) into {totals['parts']} parts")
+    return totals
+
+if INQUIRY_ARCHIVE_SCHEDULE and INQUIRY_ARCHIVE_AFTER_DAYS > 0:
+    scheduler.add(
+        "archive_inquiries", archive_old_inquiries, INQUIRY_ARCHIVE_SCHEDULE, timeout_seconds=3600,
+        jitter_seconds=300, description=f"Move inquiries older than {INQUIRY_ARCHIVE_AFTER_DAYS} days to the archive",
+    )
+
+@app.on_event("startup")
+async def ensure_inquiry_indexes():
+    # Listing, export and archival all walk inquiries by creation time
+    await db.inquiries.create_index("created_at")
+
+def _archive_parts(date_from: Optional[str] = None, date_to: Optional[str] = None) -> List[Path]:
+    """Archive parts, newest month and run first, limited to months overlapping [date_from, date_to]"""
+    parts = []
+    for part in INQUIRY_ARCHIVE_DIR.glob("*/*/*.ndjson.gz"):
+        month = "-".join(part.relative_to(INQUIRY_ARCHIVE_DIR).parts[:2])
+        if (date_from and month < date_from[:7]) or (date_to and month > date_to[:7]):
+            continue
+        parts.append(part)
+    parts.extend(INQUIRY_ARCHIVE_DIR.glob("undated/*.ndjson.gz"))
+    return sorted(parts, reverse=True)
+
+def _resolve_archive_part(part: str) -> Path:
+    path = (INQUIRY_ARCHIVE_DIR / part).resolve()
+    if INQUIRY_ARCHIVE_DIR.resolve() not in path.parents or not path.name.endswith(".ndjson.gz") or not path.is_file():
+        raise HTTPException(status_code=404, detail="Archive part not found")
+    return path
+
+def _read_archive_part(part: Path):
+    with gzip.open(part, "rb") as f:
+        for line in f:
+            if line.strip():
+                yield orjson.loads(line)
+
+def _search_archive(q: Optional[str], email: Optional[str], inquiry_type: Optional[str],
+                    date_from: Optional[str], date_to: Optional[str], limit: int) -> ArchiveSearchResults:
+    needle = q.lower() if q else None
+    email = email.lower() if email else None
+    results, seen, scanned = [], set(), 0
+    for part in _archive_parts(date_from, date_to):
+        scanned += 1
+        relative = str(part.relative_to(INQUIRY_ARCHIVE_DIR))
+        for doc in _read_archive_part(part):
+            created = str(doc.get("created_at") or "")
+            if doc.get("id") in seen:
+                continue
+            if email and (doc.get("email") or "").lower() != email:
+                continue
+            if inquiry_type and doc.get("inquiry_type") != inquiry_type:
+                continue
+            if (date_from and created < date_from) or (date_to and created[:len(date_to)] > date_to):
+                continue
+            if needle and not any(needle in str(doc.get(field) or "").lower() for field in INQUIRY_ARCHIVE_SEARCH_FIELDS):
+                continue
+            seen.add(doc.get("id"))
+            if len(results) == limit:
+                return ArchiveSearchResults(results=results, scanned_parts=scanned, truncated=True)
+            results.append(ArchivedInquiry(**doc, part=relative))
+    return ArchiveSearchResults(results=results, scanned_parts=scanned, truncated=False)
+
+@api_router.get("/admin/archive/inquiries", response_model=ArchiveSearchResults)
+async def search_inquiry_archive(
+    q: Optional[str] = None,
+    email: Optional[str] = None,
+    inquiry_type: Optional[str] = None,
+    date_from: Optional[str] = None,
+    date_to: Optional[str] = None,
+    limit: int = 50,
+    current_admin: dict = Depends(get_current_admin)
+):
+    """Scan archived inquiries (newest first); dates are ISO prefixes such as 2024-03 or 2024-03-15"""
+    return await asyncio.to_thread(_search_archive, q, email, inquiry_type, date_from, date_to, max(1, min(limit, 500)))
+
+def _load_archived_inquiries(ids: set, parts: List[Path]) -> Tuple[Dict[str, dict], int]:
+    """Newest archived copy of each id, and the number of CVs written back to UPLOADS_DIR"""
+    found: Dict[str, Tuple[Path, dict]] = {}
+    for part in parts:
+        for doc in _read_archive_part(part):
+            if doc.get("id") in ids and doc["id"] not in found:
+                found[doc["id"]] = (part, doc)
+        if len(found) == len(ids):
+            break
+    cvs_by_part = defaultdict(list)
+    for part, doc in found.values():
+        if doc.get("cv_archived"):
+            cvs_by_part[part].append(doc["cv_filename"])
+    restored_cvs = 0
+    for part, names in cvs_by_part.items():
+        with tarfile.open(_cv_archive_path(part)) as tar:
+            for name in names:
+                try:
+                    member = tar.getmember(name)
+                except KeyError:
+                    continue
+                try:
+                    target_path = upload_path(UPLOADS_DIR, name, create=True)
+                except ValueError:
+                    continue
+                source = tar.extractfile(member) if member.isfile() else None
+                if source is None:
+                    continue
+                with source, open(target_path, "wb") as target:
+                    shutil.copyfileobj(source, target)
+                restored_cvs += 1
+    return {inquiry_id: doc for inquiry_id, (_, doc) in found.items()}, restored_cvs
+
+@api_router.post("/admin/archive/inquiries/restore", response_model=BulkResult)
+async def restore_archived_inquiries(req: ArchiveRestoreRequest, current_admin: dict = Depends(get_current_admin)):
+    """Copy archived inquiries (and their CVs) back into the inquiries collection"""
+    parts = [_resolve_archive_part(req.part)] if req.part else _archive_parts()
+    ids = list(dict.fromkeys(req.ids))
+    found, restored_cvs = await asyncio.to_thread(_load_archived_inquiries, set(ids), parts)
+    restored_at = datetime.now(timezone.utc).isoformat()
+    operations = []
+    for doc in found.values():
+        doc.pop("cv_archived", None)
+        doc["restored_at"] = restored_at
+        operations.append(ReplaceOne({"id": doc["id"]}, doc, upsert=True))
+    if operations:
+        await db.inquiries.bulk_write(operations, ordered=False)
+        logger.info(f"Restored {len(operations)} archived inquiries ({restored_cvs} CVs)")
+    return _bulk_result([
+        BulkItemResult(id=i, status="ok") if i in found else BulkItemResult(id=i, status="not_found", detail="Not in archive")
+        for i in ids
+    ])
+
+# ==================== CONTENT IMPORT ====================
+
+# Bulk import of blogs, careers or catalogs from a CSV (with header row) or NDJSON request body, e.g.
+#   curl -X POST --data-binary @posts.csv -H "Content-Type: text/csv" .../api/admin/import/blogs
+# The body is parsed as it arrives and written in batches, so memory stays bounded by the batch size.
+# Blogs are matched on slug, careers and catalogs on an optional id column; matches are updated in
+# place and everything else is inserted with insert_many.
+IMPORT_BATCH_SIZE = int(os.environ.get('IMPORT_BATCH_SIZE', '500'))
+IMPORT_MAX_REPORTED_ERRORS = int(os.environ.get('IMPORT_MAX_REPORTED_ERRORS', '1000'))
+IMPORT_HISTORY_SIZE = 20
+
+metrics.describe("content_import_rows_total", "counter", "Rows processed by content imports by kind and result")
+
+class ImportRowError(BaseModel):
+    row: int
+    errors: List[str]
+
+class ImportProgress(BaseModel):
+    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    kind: str
+    format: str
+    status: str = "running"  # running | completed | failed
+    processed: int = 0
+    inserted: int = 0
+    updated: int = 0
+    failed: int = 0
+    errors: List[ImportRowError] = Field(default_factory=list)
+    detail: Optional[str] = None
+    started_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    finished_at: Optional[datetime] = None
+
+    def add_error(self, row: int, errors: List[str]):
+        self.failed += 1
+        if len(self.errors) < IMPORT_MAX_REPORTED_ERRORS:
+            self.errors.append(ImportRowError(row=row, errors=errors))
+
+def _import_blog(item: BlogCreate) -> dict:
+    doc = Blog(**item.model_dump()).model_dump()
+    doc['created_at'] = doc['created_at'].isoformat()
+    doc['updated_at'] = doc['updated_at'].isoformat()
+    return doc
+
+def _import_career(item: CareerCreate) -> dict:
+    career_dict = item.model_dump()
+    if isinstance(career_dict.get('requirements'), list):
+        career_dict['requirements'] = '\n'.join(career_dict['requirements'])
+    doc = Career(**career_dict).model_dump()
+    doc['created_at'] = doc['created_at'].isoformat()
+    return doc
+
+def _import_catalog(item: CatalogCreate) -> dict:
+    doc = Catalog(**item.model_dump(), pdf_status="pending" if item.pdf_url else None).model_dump()
+    doc['created_at'] = doc['created_at'].isoformat()
+    return doc
+
+# kind -> (collection name, input model, document builder, match key)
+IMPORT_KINDS = {
+    "blogs": ("blogs", BlogCreate, _import_blog, "slug"),
+    "careers": ("careers", CareerCreate, _import_career, "id"),
+    "catalogs": ("catalogs", CatalogCreate, _import_catalog, "id"),
+}
+
+import_history: "OrderedDict[str, ImportProgress]" = OrderedDict()
+
+class _CsvRecordParser:
+    """Turns lines into (row number, dict) records; quoted fields may span lines"""
+
+    def __init__(self):
+        self.header: Optional[List[str]] = None
+        self.buffer: List[str] = []
+        self.quotes = 0
+        self.row = 0
+
+    def feed(self, line: str):
+        self.buffer.append(line.rstrip("\r"))
+        self.quotes += line.count('"')
+        if self.quotes % 2:
+            return None  # Inside a quoted field that continues on the next line
+        text = "\n".join(self.buffer)
+        self.buffer, self.quotes = [], 0
+        if not text.strip():
+            return None
+        values = next(csv.reader([text]))
+        if self.header is None:
+            self.header = [name.strip() for name in values]
+            return None
+        self.row += 1
+        return self.row, dict(zip(self.header, values))
+
+    def finish(self):
+        if self.buffer:
+            self.quotes = 0  # Unterminated quote at end of input; parse what is there
+            return self.feed("")
+        return None
+
+class _NdjsonRecordParser:
+    def __init__(self):
+        self.row = 0
+
+    def feed(self, line: str):
+        if not line.strip():
+            return None
+        self.row += 1
+        try:
+            record = orjson.loads(line)
+        except orjson.JSONDecodeError as e:
+            return self.row, ValueError(f"Invalid JSON: {e}")
+        if not isinstance(record, dict):
+            return self.row, ValueError("Each line must be a JSON object")
+        return self.row, record
+
+    def finish(self):
+        return None
+
+async def _iter_import_records(stream, parser):
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    pending = ""
+    async for chunk in stream:
+        pending += decoder.decode(chunk)
+        *lines, pending = pending.split("\n")
+        for line in lines:
+            record = parser.feed(line)
+            if record is not None:
+                yield record
+    pending += decoder.decode(b"", final=True)
+    for record in (parser.feed(pending) if pending else None, parser.finish()):
+        if record is not None:
+            yield record
+
+def _clean_import_row(record: dict) -> dict:
+    # Empty CSV cells mean "use the default", not an empty string
+    return {k: v for k, v in record.items() if k and v is not None and v != ""}
+
+async def _write_import_batch(kind: str, batch: Dict[str, Tuple[int, dict, BaseModel]], new_rows: List[Tuple[int, dict]], progress: ImportProgress):
+    """Insert new documents and update existing ones (by match key) for one batch"""
+    collection_name, input_model, build_document, key = IMPORT_KINDS[kind]
+    collection = db[collection_name]
+    if kind == "blogs":
+        docs = [doc for _, doc in new_rows] + [doc for _, doc, _ in batch.values()]
+        await asyncio.to_thread(lambda: [doc.update(render_blog_content(doc["content"])) for doc in docs])
+    existing = set()
+    if batch:
+        existing = {
+            doc[key] for doc in await collection.find({key: {"$in": list(batch)}}, {"_id": 0, key: 1}).to_list(None)
+        }
+    inserts = [doc for _, doc in new_rows]
+    updates = []
+    for match, (row, doc, item) in batch.items():
+        if match in existing:
+            fields = item.model_dump(exclude_unset=True)
+            if kind == "careers" and isinstance(fields.get('requirements'), list):
+                fields['requirements'] = '\n'.join(fields['requirements'])
+            if kind == "blogs":
+                fields['updated_at'] = doc['updated_at']
+                fields.update({field: doc[field] for field in BLOG_RENDERED_FIELDS})
+            updates.append(UpdateOne({key: match}, {"$set": fields, "$inc": {"version": 1}}))
+        else:
+            doc[key] = match
+            inserts.append(doc)
+    if inserts:
+        await collection.insert_many(inserts, ordered=False)
+        progress.inserted += len(inserts)
+        for doc in inserts:
+            search_index.upsert(kind, doc)
+        invalidate_site_feeds(kind)
+    if updates:
+        await collection.bulk_write(updates, ordered=False)
+        progress.updated += len(updates)
+        await reindex_search(kind, {key: {"$in": [match for match in batch if match in existing]}})
+        invalidate_site_feeds(kind)
+    if kind == "catalogs" and (inserts or updates):
+        process_catalog_pdfs_soon()
+
+@api_router.post("/admin/import/{kind}", response_model=ImportProgress)
+async def import_content(kind: str, request: Request, format: Optional[str] = None, current_admin: dict = Depends(get_current_admin)):
+    """Stream a CSV or NDJSON body of BlogCreate/CareerCreate/CatalogCreate rows into the collection"""
+    if kind not in IMPORT_KINDS:
+        raise HTTPException(status_code=404, detail="Unknown import type")
+    if format is None:
+        content_type = request.headers.get("content-type", "")
+        format = "ndjson" if "ndjson" in content_type or "jsonl" in content_type else "csv"
+    if format not in ("csv", "ndjson"):
+        raise HTTPException(status_code=400, detail="format must be csv or ndjson")
+
+    _, input_model, build_document, key = IMPORT_KINDS[kind]
+    progress = ImportProgress(kind=kind, format=format)
+    import_history[progress.id] = progress
+    while len(import_history) > IMPORT_HISTORY_SIZE:
+        import_history.popitem(last=False)
+
+    parser = _CsvRecordParser() if format == "csv" else _NdjsonRecordParser()
+    # Rows with a match key, deduplicated so the last occurrence in a batch wins, and rows without one
+    keyed: Dict[str, Tuple[int, dict, BaseModel]] = {}
+    new_rows: List[Tuple[int, dict]] = []
+    try:
+        async for row, record in _iter_import_records(request.stream(), parser):
+            progress.processed += 1
+            if isinstance(record, Exception):
+                progress.add_error(row, [str(record)])
+                continue
+            record = _clean_import_row(record)
+            match = record.pop(key, None) if key == "id" else record.get(key)
+            try:
+                item = input_model(**record)
+            except ValidationError as e:
+                progress.add_error(row, [f"{'.'.join(str(p) for p in err['loc'])}: {err['msg']}" for err in e.errors()])
+                continue
+            doc = build_document(item)
+            if match:
+                keyed[str(match)] = (row, doc, item)
+            else:
+                new_rows.append((row, doc))
+            if len(keyed) + len(new_rows) >= IMPORT_BATCH_SIZE:
+                await _write_import_batch(kind, keyed, new_rows, progress)
+                keyed, new_rows = {}, []
+                logger.info(f"Import {progress.id} ({kind}): {progress.processed} rows processed")
+        if keyed or new_rows:
+            await _write_import_batch(kind, keyed, new_rows, progress)
+        progress.status = "completed"
+    except Exception as e:
+        logger.error(f"Import {progress.id} ({kind}) failed after {progress.processed} rows: {e}")
+        progress.status = "failed"
+        progress.detail = str(e)
+    finally:
+        progress.finished_at = datetime.now(timezone.utc)
+        metrics.inc("content_import_rows_total", progress.inserted, kind=kind, result="inserted")
+        metrics.inc("content_import_rows_total", progress.updated, kind=kind, result="updated")
+        metrics.inc("content_import_rows_total", progress.failed, kind=kind, result="failed")
+    logger.info(
+        f"Import {progress.id} ({kind}) {progress.status}: {progress.inserted} inserted, "
+        f"{progress.updated} updated, {progress.failed} failed"
+    )
+    return progress
+
+@api_router.get("/admin/imports", response_model=List[ImportProgress])
+async def list_imports(current_admin: dict = Depends(get_current_admin)):
+    """Recent and running imports, newest first"""
+    return list(reversed(import_history.values()))
+
+@api_router.get("/admin/imports/{import_id}", response_model=ImportProgress)
+async def get_import(import_id: str, current_admin: dict = Depends(get_current_admin)):
+    progress = import_history.get(import_id)
+    if progress is None:
+        raise HTTPException(status_code=404, detail="Import not found")
+    return progress
+
+# ==================== SITE SNAPSHOT ====================
+
+# A snapshot is one .tar.gz holding snapshot.json (format and collection list), every content collection as
+# BSON parts of SNAPSHOT_BATCH_SIZE documents (collections/<name>/00001.bson, types preserved exactly) and the
+# upload files the documents reference (files/<category>/<name>, independent of the shard layout). Export and
+# import run the tar stream in a worker thread fetching from / writing to Mongo in batches, so memory stays
+# bounded by a batch plus a few buffered chunks. Import upserts by each collection's key while the site keeps
+# serving; with prune=true documents missing from the snapshot are deleted, making the target an exact clone.
+SNAPSHOT_FORMAT_VERSION = 1
+SNAPSHOT_BATCH_SIZE = int(os.environ.get('SNAPSHOT_BATCH_SIZE', '1000'))
+SNAPSHOT_GZIP_LEVEL = int(os.environ.get('SNAPSHOT_GZIP_LEVEL', '6'))
+SNAPSHOT_CHUNK_BYTES = 256 * 1024
+SNAPSHOT_QUEUE_CHUNKS = 16
+# collection -> upsert key
+SNAPSHOT_COLLECTIONS = {
+    "brands": "id", "catalogs": "id", "blogs": "id", "careers": "id", "inquiries": "id",
+    "company_info": "id", "link_pages": "brand_slug", "upi_payment_info": "id",
+    "social_media_info": "id", "admin_users": "username",
+}
+SNAPSHOT_FILE_DIRS = {
+    "assets": ASSETS_DIR, "uploads/upi": UPI_UPLOADS_DIR, "uploads/cv": UPLOADS_DIR,
+    "catalog-previews": CATALOG_PREVIEW_DIR,
+}
+_SNAPSHOT_FILE_REF_RE = re.compile(r"/(assets|uploads/upi|uploads/cv|catalog-previews)/([A-Za-z0-9][A-Za-z0-9._-]*)")
+
+class SnapshotImportResult(BaseModel):
+    collections: Dict[str, int] = {}  # documents upserted per collection
+    pruned: Dict[str, int] = {}
+    files: int = 0
+    skipped: int = 0  # documents without their key and unrecognised archive members
+    duration_seconds: float = 0.0
+
+class _SnapshotAborted(Exception):
+    pass
+
+class _SnapshotSink(io.RawIOBase):
+    """Write end of an export: gzips the tar stream and hands chunks to the response through a bounded queue"""
+
+    def __init__(self, chunks: queue.Queue, cancelled: threading.Event):
+        self._chunks = chunks
+        self._cancelled = cancelled
+        self._compressor = zlib.compressobj(SNAPSHOT_GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+        self._pending = bytearray()
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._pending += self._compressor.compress(data)
+        if len(self._pending) >= SNAPSHOT_CHUNK_BYTES:
+            self._put(bytes(self._pending))
+            self._pending.clear()
+        return len(data)
+
+    def finish(self):
+        self._put(bytes(self._pending) + self._compressor.flush())
+
+    def _put(self, chunk: bytes):
+        # Blocks while the client is slower than the export, unless the download was abandoned
+        while not self._cancelled.is_set():
+            try:
+                self._chunks.put(chunk, timeout=0.5)
+                return
+            except queue.Full:
+                continue
+        raise _SnapshotAborted()
+
+class _SnapshotBodyReader(io.RawIOBase):
+    """Read end of an import: pulls request body chunks from the event loop on demand"""
+
+    def __init__(self, next_chunk):
+        self._next_chunk = next_chunk
+        self._buffer = b""
+        self._eof = False
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, target) -> int:
+        while not self._buffer and not self._eof:
+            chunk = self._next_chunk()
+            if chunk is None:
+                self._eof = True
+            else:
+                self._buffer = chunk
+        size = min(len(target), len(self._buffer))
+        target[:size] = self._buffer[:size]
+        self._buffer = self._buffer[size:]
+        return size
+
+def _snapshot_file_path(category: str, filename: str, create: bool = False) -> Path:
+    directory = SNAPSHOT_FILE_DIRS[category]
+    if directory in SHARDED_UPLOAD_DIRS:
+        return upload_path(directory, filename, create=True) if create else find_upload(directory, filename)
+    if not filename or Path(filename).name != filename or filename.startswith("."):
+        raise ValueError(f"Invalid filename: {filename!r}")
+    return directory / filename
+
+def _snapshot_file_refs(collection: str, docs: List[dict]) -> set:
+    refs = set(_SNAPSHOT_FILE_REF_RE.findall(str(docs)))
+    if collection == "inquiries":
+        # CVs are referenced by bare filename
+        refs.update(("uploads/cv", doc["cv_filename"]) for doc in docs if doc.get("cv_filename"))
+    return refs
+
+def _add_tar_bytes(tar: tarfile.TarFile, name: str, data: bytes):
+    info = tarfile.TarInfo(name)
+    info.size = len(data)
+    info.mtime = int(time.time())
+    tar.addfile(info, io.BytesIO(data))
+
+async def _open_snapshot_cursor(name: str):
+    return db[name].find({}, {"_id": 0}).batch_size(SNAPSHOT_BATCH_SIZE)
+
+async def _next_snapshot_batch(cursor) -> List[dict]:
+    return await cursor.to_list(SNAPSHOT_BATCH_SIZE)
+
+def _write_snapshot(sink: _SnapshotSink, loop: asyncio.AbstractEventLoop, include_files: bool) -> dict:
+    """Stream the tar into sink (runs in a worker thread; Mongo reads are run on the event loop)"""
+    call = lambda coro: asyncio.run_coroutine_threadsafe(coro, loop).result()
+    counts = {"documents": {}, "files": 0}
+    with tarfile.open(fileobj=sink, mode="w|", format=tarfile.PAX_FORMAT) as tar:
+        header = {
+            "format_version": SNAPSHOT_FORMAT_VERSION, "created_at": datetime.now(timezone.utc).isoformat(),
+            "source": INSTANCE_ID, "collections": list(SNAPSHOT_COLLECTIONS), "include_files": include_files,
+        }
+        _add_tar_bytes(tar, "snapshot.json", orjson.dumps(header))
+        refs = set()
+        for name in SNAPSHOT_COLLECTIONS:
+            cursor = call(_open_snapshot_cursor(name))
+            part = total = 0
+            while True:
+                docs = call(_next_snapshot_batch(cursor))
+                if not docs:
+                    break
+                part += 1
+                total += len(docs)
+                _add_tar_bytes(tar, f"collections/{name}/{part:05d}.bson", b"".join(bson.encode(doc) for doc in docs))
+                if include_files:
+                    refs.update(_snapshot_file_refs(name, docs))
+            counts["documents"][name] = total
+        for category, filename in sorted(refs):
+            try:
+                path = _snapshot_file_path(category, filename)
+            except ValueError:
+                continue
+            if path.is_file():
+                # Streams the file in blocks rather than reading it whole
+                tar.add(str(path), arcname=f"files/{category}/{filename}", recursive=False)
+                counts["files"] += 1
+    sink.finish()
+    return counts
+
+@api_router.get("/admin/snapshot")
+async def export_snapshot(include_files: bool = True, current_admin: dict = Depends(get_current_admin)):
+    """Stream every content collection and the referenced upload files as one .tar.gz"""
+    loop = asyncio.get_running_loop()
+    chunks: queue.Queue = queue.Queue(maxsize=SNAPSHOT_QUEUE_CHUNKS)
+    cancelled = threading.Event()
+    started = time.perf_counter()
+
+    def produce():
+        try:
+            return _write_snapshot(_SnapshotSink(chunks, cancelled), loop, include_files)
+        finally:
+            # End of stream marker; make room for it if the consumer has gone away
+            while True:
+                try:
+                    chunks.put_nowait(None)
+                    break
+                except queue.Full:
+                    chunks.get_nowait()
+
+    worker = asyncio.ensure_future(asyncio.to_thread(produce))
+    # An abandoned download ends the worker with _SnapshotAborted, which nobody awaits
+    worker.add_done_callback(lambda future: future.cancelled() or future.exception())
+
+    async def body():
+        try:
+            while (chunk := await asyncio.to_thread(chunks.get)) is not None:
+                yield chunk
+            counts = await worker
+            logger.info(
+                f"Snapshot exported in {time.perf_counter() - started:.1f}s: "
+                f"{sum(counts['documents'].values())} documents, {counts['files']} files"
+            )
+        except Exception as e:
+            # The response has started, so the truncated archive is all the client can be given
+            logger.error(f"Snapshot export failed: {e}")
+            raise
+        finally:
+            cancelled.set()
+
+    filename = f"snapshot-{datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%SZ')}.tar.gz"
+    return StreamingResponse(
+        body(),
+        media_type="application/gzip",
+        headers={"Content-Disposition": f"attachment; filename={filename}", "Cache-Control": "no-store"}
+    )
+
+async def _upsert_snapshot_docs(name: str, docs: List[dict], result: SnapshotImportResult, seen: Dict[str, set]):
+    key = SNAPSHOT_COLLECTIONS[name]
+    operations = []
+    for doc in docs:
+        doc.pop("_id", None)
+        if doc.get(key) is None:
+            result.skipped += 1
+            continue
+        seen[name].add(doc[key])
+        operations.append(ReplaceOne({key: doc[key]}, doc, upsert=True))
+    if operations:
+        await db[name].bulk_write(operations, ordered=False)
+    result.collections[name] = result.collections.get(name, 0) + len(operations)
+
+def _write_snapshot_file(source, path: Path):
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    with source, open(tmp_path, "wb") as target:
+        shutil.copyfileobj(source, target)
+    os.replace(tmp_path, path)
+
+def _read_snapshot(reader: _SnapshotBodyReader, loop: asyncio.AbstractEventLoop, result: SnapshotImportResult,
+                   seen: Dict[str, set]) -> dict:
+    """Apply a snapshot stream member by member (runs in a worker thread); returns its header"""
+    call = lambda coro: asyncio.run_coroutine_threadsafe(coro, loop).result()
+    header = None
+    with tarfile.open(fileobj=reader, mode="r|gz") as tar:
+        for member in tar:
+            parts = member.name.split("/")
+            if member.name == "snapshot.json":
+                header = orjson.loads(tar.extractfile(member).read())
+                if header.get("format_version", 0) > SNAPSHOT_FORMAT_VERSION:
+                    raise ValueError(f"Snapshot format {header.get('format_version')} is newer than this server supports")
+            elif header is None:
+                raise ValueError("Not a site snapshot (snapshot.json must come first)")
+            elif member.isfile() and len(parts) == 3 and parts[0] == "collections" and parts[1] in SNAPSHOT_COLLECTIONS:
+                docs = bson.decode_all(tar.extractfile(member).read())
+                call(_upsert_snapshot_docs(parts[1], docs, result, seen))
+            elif member.isfile() and parts[0] == "files" and "/".join(parts[1:-1]) in SNAPSHOT_FILE_DIRS:
+                try:
+                    path = _snapshot_file_path("/".join(parts[1:-1]), parts[-1], create=True)
+                except ValueError:
+                    result.skipped += 1
+                    continue
+                _write_snapshot_file(tar.extractfile(member), path)
+                result.files += 1
+            else:
+                result.skipped += 1
+    if header is None:
+        raise ValueError("Not a site snapshot (snapshot.json is missing)")
+    return header
+
+async def _prune_snapshot_collections(names: List[str], seen: Dict[str, set], result: SnapshotImportResult):
+    for name in names:
+        key = SNAPSHOT_COLLECTIONS[name]
+        stale = {key: {"$nin": list(seen[name])}}
+        if name == "link_pages":
+            for page in await db.link_pages.find(stale, {"_id": 0, "brand_slug": 1}).to_list(None):
+                await remove_link_page_snapshot(page["brand_slug"])
+        deleted = await db[name].delete_many(stale)
+        result.pruned[name] = deleted.deleted_count
+
+@api_router.post("/admin/snapshot/import", response_model=SnapshotImportResult)
+async def import_snapshot(request: Request, prune: bool = False, current_admin: dict = Depends(get_current_admin)):
+    """Restore a snapshot streamed as the raw request body, upserting documents batch by batch"""
+    loop = asyncio.get_running_loop()
+    stream = request.stream().__aiter__()
+
+    async def next_chunk() -> Optional[bytes]:
+        try:
+            return await stream.__anext__()
+        except StopAsyncIteration:
+            return None
+
+    reader = _SnapshotBodyReader(lambda: asyncio.run_coroutine_threadsafe(next_chunk(), loop).result())
+    result = SnapshotImportResult()
+    seen: Dict[str, set] = defaultdict(set)
+    started = time.perf_counter()
+    try:
+        header = await asyncio.to_thread(_read_snapshot, reader, loop, result, seen)
+        if prune:
+            # Only collections the snapshot was taken from; a partial or failed import never prunes
+            await _prune_snapshot_collections([name for name in header.get("collections", []) if name in SNAPSHOT_COLLECTIONS], seen, result)
+    except (tarfile.TarError, bson.errors.BSONError, ValueError, EOFError, zlib.error) as e:
+        logger.error(f"Snapshot import failed after {sum(result.collections.values())} documents: {e}")
+        raise HTTPException(status_code=400, detail=f"Invalid snapshot: {e}")
+    finally:
+        # Rebuild derived state from whatever was written, including by an import that failed part way
+        invalidate_site_bootstrap()
+        for kind in ("blogs", "careers", "catalogs", "link_pages"):
+            invalidate_site_feeds(kind)
+        await publish_link_page_snapshots()
+        await rebuild_search_index()
+        process_catalog_pdfs_soon()
+
+    result.duration_seconds = round(time.perf_counter() - started, 3)
+    logger.info(
+        f"Snapshot from {header.get('source')} ({header.get('created_at')}) imported in {result.duration_seconds}s: "
+        f"{sum(result.collections.values())} documents, {result.files} files, {sum(result.pruned.values())} pruned"
+    )
+    return result
+
+# ==================== SEARCH ====================
+
+# Public full-text search over blogs, careers and catalogs, served from an in-process inverted index.
+# The index is built at startup and kept current by the write handlers in this process; a periodic
+# rebuild picks up writes made by other worker processes. Ranking is BM25 with per-field weights, the
+# last query word also matches as a prefix, and snippets are highlighted with <mark>.
+SEARCH_INDEX_REFRESH_SECONDS = float(os.environ.get('SEARCH_INDEX_REFRESH_SECONDS', '300'))
+SEARCH_SNIPPET_CHARS = 160
+SEARCH_MIN_PREFIX_CHARS = 3
+SEARCH_MAX_PREFIX_EXPANSIONS = 20
+SEARCH_BM25_K1 = 1.2
+SEARCH_BM25_B = 0.75
+
+# kind -> ((field, weight), ...); snippet fields are the non-title ones in order
+SEARCH_FIELDS = {
+    "blogs": (("title", 3.0), ("excerpt", 2.0), ("content", 1.0)),
+    "careers": (("title", 3.0), ("description", 1.0), ("requirements", 1.0)),
+    "catalogs": (("title", 3.0), ("category", 2.0), ("description", 1.0), ("pdf_text", 0.5)),
+}
+# Documents hidden from the public site are indexed but not returned
+SEARCH_VISIBILITY_FIELDS = {"blogs": "published", "careers": "active"}
+SEARCH_STOPWORDS = frozenset(
+    "a an and are as at be by for from in is it of on or that the this to was with".split()
+)
+_SEARCH_TOKEN_RE = re.compile(r"\w+")
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+
+metrics.describe("search_query_seconds", "histogram", "Search index query latency")
+
+def search_tokenize(text: str) -> List[str]:
+    return [t for t in _SEARCH_TOKEN_RE.findall(text.lower()) if t not in SEARCH_STOPWORDS]
+
+def _plain_text(value) -> str:
+    if isinstance(value, list):
+        value = " ".join(str(v) for v in value)
+    return " ".join(html.unescape(_HTML_TAG_RE.sub(" ", str(value or ""))).split())
+
+def _highlight(text: str, pattern: re.Pattern) -> str:
+    out, last = [], 0
+    for match in pattern.finditer(text):
+        out.append(html.escape(text[last:match.start()]))
+        out.append(f"<mark>{html.escape(match.group(0))}</mark>")
+        last = match.end()
+    out.append(html.escape(text[last:]))
+    return "".join(out)
+
+def _snippet(text: str, pattern: re.Pattern) -> Optional[str]:
+    match = pattern.search(text)
+    if match is None:
+        return None
+    start = max(0, match.start() - SEARCH_SNIPPET_CHARS // 3)
+    if start:
+        space = text.find(" ", start)
+        start = space + 1 if 0 <= space < match.start() else start
+    end = min(len(text), start + SEARCH_SNIPPET_CHARS)
+    if end < len(text):
+        space = text.rfind(" ", match.end(), end)
+        end = space if space > 0 else end
+    return ("…" if start else "") + _highlight(text[start:end], pattern) + ("…" if end < len(text) else "")
+
+class SearchIndex:
+    def __init__(self):
+        self.docs: Dict[Tuple[str, str], dict] = {}
+        self.postings: Dict[str, Dict[Tuple[str, str], float]] = {}
+        self.vocabulary: List[str] = []  # Sorted, for prefix expansion
+        self.total_length = 0
+        # Per-document BM25 length normalisation, k1 * (1 - b + b * length / average length)
+        self.norms: Dict[Tuple[str, str], float] = {}
+        # While a replacement index is being built, writes are also recorded here to replay onto it
+        self.journal: Optional[list] = None
+
+    @classmethod
+    def build(cls, docs_by_kind: Dict[str, List[dict]]) -> "SearchIndex":
+        index = cls()
+        for kind, docs in docs_by_kind.items():
+            for doc in docs:
+                index._add(kind, doc)
+        index.vocabulary = sorted(index.postings)
+        index._renormalize()
+        return index
+
+    def _norm(self, length: int) -> float:
+        average_length = max(self.total_length / max(len(self.docs), 1), 1)
+        return SEARCH_BM25_K1 * (1 - SEARCH_BM25_B + SEARCH_BM25_B * length / average_length)
+
+    def _renormalize(self):
+        self.norms = {key: self._norm(entry["length"]) for key, entry in self.docs.items()}
+
+    def _add(self, kind: str, doc: dict) -> List[str]:
+        key = (kind, doc["id"])
+        weights: Dict[str, float] = defaultdict(float)
+        texts = {}
+        length = 0
+        for field, weight in SEARCH_FIELDS[kind]:
+            texts[field] = _plain_text(doc.get(field))
+            for term in search_tokenize(texts[field]):
+                weights[term] += weight
+                length += 1
+        new_terms = []
+        for term, weight in weights.items():
+            posting = self.postings.get(term)
+            if posting is None:
+                posting = self.postings[term] = {}
+                new_terms.append(term)
+            posting[key] = weight
+        visibility_field = SEARCH_VISIBILITY_FIELDS.get(kind)
+        self.docs[key] = {
+            "kind": kind,
+            "id": doc["id"],
+            "slug": doc.get("slug"),
+            "visible": bool(doc.get(visibility_field, True)) if visibility_field else True,
+            "texts": texts,
+            "terms": list(weights),
+            "length": length,
+        }
+        self.total_length += length
+        # Incremental adds use the current average; the periodic rebuild renormalises everything
+        self.norms[key] = self._norm(length)
+        return new_terms
+
+    def upsert(self, kind: str, doc: dict):
+        if self.journal is not None:
+            self.journal.append((kind, doc, None))
+        self._remove(kind, doc["id"])
+        for term in self._add(kind, doc):
+            bisect.insort(self.vocabulary, term)
+
+    def remove(self, kind: str, doc_id: str):
+        if self.journal is not None:
+            self.journal.append((kind, None, doc_id))
+        self._remove(kind, doc_id)
+
+    def _remove(self, kind: str, doc_id: str):
+        key = (kind, doc_id)
+        entry = self.docs.pop(key, None)
+        if entry is None:
+            return
+        self.norms.pop(key, None)
+        self.total_length -= entry["length"]
+        for term in entry["terms"]:
+            posting = self.postings[term]
+            posting.pop(key, None)
+            if not posting:
+                del self.postings[term]
+                position = bisect.bisect_left(self.vocabulary, term)
+                if position < len(self.vocabulary) and self.vocabulary[position] == term:
+                    del self.vocabulary[position]
+
+    def _expand(self, term: str) -> List[str]:
+        if len(term) < SEARCH_MIN_PREFIX_CHARS:
+            return [term]
+        position = bisect.bisect_left(self.vocabulary, term)
+        expansions = []
+        while position < len(self.vocabulary) and len(expansions) < SEARCH_MAX_PREFIX_EXPANSIONS:
+            candidate = self.vocabulary[position]
+            if not candidate.startswith(term):
+                break
+            expansions.append(candidate)
+            position += 1
+        return expansions
+
+    def search(self, query: str, kinds: Tuple[str, ...], top_n: int) -> Tuple[int, List[Tuple[float, Tuple[str, str]]], List[str]]:
+        """Return (total, best top_n (score, key) pairs, query terms) over visible documents matching every term"""
+        terms = list(dict.fromkeys(search_tokenize(query)))
+        if not terms or not self.docs:
+            return 0, [], terms
+        doc_count = len(self.docs)
+        prefix_last = not query[-1:].isspace()
+        # Per query term: [(posting, weight)] over the term itself or, for the last one, its completions
+        groups = []
+        for i, term in enumerate(terms):
+            candidates = self._expand(term) if prefix_last and i == len(terms) - 1 else [term]
+            group = []
+            for candidate in candidates:
+                posting = self.postings.get(candidate)
+                if posting:
+                    idf = math.log(1 + (doc_count - len(posting) + 0.5) / (len(posting) + 0.5))
+                    # Completions of a partially typed word rank below exact matches
+                    group.append((posting, idf * (1.0 if candidate == term else 0.5)))
+            if not group:
+                return 0, [], terms
+            groups.append(group)
+        # Start from the rarest term and only probe surviving candidates for the rest
+        groups.sort(key=lambda group: sum(len(posting) for posting, _ in group))
+        norms = self.norms
+        k1 = SEARCH_BM25_K1 + 1
+        scores: Dict[Tuple[str, str], float] = {}
+        for posting, weight in groups[0]:
+            for key, tf in posting.items():
+                if key[0] in kinds:
+                    score = weight * tf * k1 / (tf + norms[key])
+                    if score > scores.get(key, 0):
+                        scores[key] = score
+        for group in groups[1:]:
+            next_scores = {}
+            for key, total in scores.items():
+                best = 0.0
+                for posting, weight in group:
+                    tf = posting.get(key)
+                    if tf:
+                        score = weight * tf * k1 / (tf + norms[key])
+                        if score > best:
+                            best = score
+                if best:
+                    next_scores[key] = total + best
+            scores = next_scores
+            if not scores:
+                return 0, [], terms
+        docs = self.docs
+        visible = [(score, key) for key, score in scores.items() if docs[key]["visible"]]
+        return len(visible), heapq.nlargest(top_n, visible, key=lambda item: item[0]), terms
+
+    def hit(self, key: Tuple[str, str], score: float, pattern: re.Pattern) -> dict:
+        entry = self.docs[key]
+        kind = entry["kind"]
+        snippet = None
+        for field, _ in SEARCH_FIELDS[kind][1:]:
+            snippet = _snippet(entry["texts"][field], pattern)
+            if snippet:
+                break
+        if snippet is None:
+            first_field = SEARCH_FIELDS[kind][1][0]
+            snippet = html.escape(entry["texts"][first_field][:SEARCH_SNIPPET_CHARS])
+        return {
+            "kind": kind,
+            "id": entry["id"],
+            "slug": entry["slug"],
+            "title": entry["texts"]["title"],
+            "title_html": _highlight(entry["texts"]["title"], pattern),
+            "snippet_html": snippet,
+            "score": round(score, 4),
+        }
+
+search_index = SearchIndex()
+
+async def _load_search_documents() -> Dict[str, List[dict]]:
+    projections = {kind: {"_id": 0, "id": 1, "slug": 1, **{f: 1 for f, _ in fields}, **({SEARCH_VISIBILITY_FIELDS[kind]: 1} if kind in SEARCH_VISIBILITY_FIELDS else {})} for kind, fields in SEARCH_FIELDS.items()}
+    loaded = await asyncio.gather(*(db[kind].find({}, projections[kind]).to_list(None) for kind in SEARCH_FIELDS))
+    return dict(zip(SEARCH_FIELDS, loaded))
+
+async def rebuild_search_index():
+    global search_index
+    current = search_index
+    current.journal = []
+    try:
+        docs_by_kind = await _load_search_documents()
+        rebuilt = await asyncio.to_thread(SearchIndex.build, docs_by_kind)
+    finally:
+        journal, current.journal = current.journal, None
+    # Replay writes that raced with the load, then swap (no await in between)
+    for kind, doc, doc_id in journal:
+        if doc is not None:
+            rebuilt.upsert(kind, doc)
+        else:
+            rebuilt.remove(kind, doc_id)
+    search_index = rebuilt
+    logger.info(f"Search index built: {len(search_index.docs)} documents, {len(search_index.postings)} terms")
+
+async def reindex_search(kind: str, query: dict):
+    """Refresh index entries for the documents matching query (after bulk writes)"""
+    for doc in await db[kind].find(query, {"_id": 0}).to_list(None):
+        search_index.upsert(kind, doc)
+
+_search_refresh_task: Optional[asyncio.Task] = None
+
+async def _refresh_search_index_periodically():
+    while True:
+        await asyncio.sleep(SEARCH_INDEX_REFRESH_SECONDS)
+        try:
+            await rebuild_search_index()
+        except Exception as e:
+            logger.error(f"Search index refresh failed: {e}")
+
+@app.on_event("startup")
+async def start_search_index():
+    global _search_refresh_task
+    try:
+        await rebuild_search_index()
+    except Exception as e:
+        logger.error(f"Search index build failed: {e}")
+    if SEARCH_INDEX_REFRESH_SECONDS > 0:
+        _search_refresh_task = asyncio.create_task(_refresh_search_index_periodically())
+
+@app.on_event("shutdown")
+async def stop_search_index():
+    if _search_refresh_task is not None:
+        _search_refresh_task.cancel()
+
+class SearchHit(BaseModel):
+    kind: str  # blogs | careers | catalogs
+    id: str
+    slug: Optional[str] = None
+    title: str
+    title_html: str
+    snippet_html: str
+    score: float
+
+class SearchResults(BaseModel):
+    query: str
+    total: int
+    page: int
+    limit: int
+    results: List[SearchHit]
+
+@api_router.get("/search", response_model=SearchResults)
+async def search(q: str, types: Optional[str] = None, page: int = 1, limit: int = 10):
+    """Ranked full-text search; title_html and snippet_html are escaped with matches wrapped in <mark>"""
+    page = max(page, 1)
+    limit = min(max(limit, 1), 50)
+    kinds = tuple(SEARCH_FIELDS) if not types else tuple(t for t in types.split(",") if t in SEARCH_FIELDS)
+    start = time.perf_counter()
+    index = search_index
+    offset = (page - 1) * limit
+    total, ranked, terms = index.search(q[:200], kinds, offset + limit)
+    page_hits = []
+    if ranked[offset:]:
+        pattern = re.compile(r"\b(?:" + "|".join(re.escape(t) for t in terms) + r")\w*", re.IGNORECASE)
+        page_hits = [index.hit(key, score, pattern) for score, key in ranked[offset:]]
+    metrics.observe("search_query_seconds", time.perf_counter() - start, LATENCY_BUCKETS)
+    return TrustedJSONResponse({"query": q, "total": total, "page": page, "limit": limit, "results": page_hits})
+
 # Include API routes (ensure routes defined above are registered)
 app.include_router(api_router)
\ No newline at end of file
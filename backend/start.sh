@@ -44,5 +44,7 @@ PORT=${PORT:-8000}
 echo "🚀 Starting backend server on http://localhost:${PORT}"
 echo "📚 API docs available at http://localhost:${PORT}/docs"
 echo ""
-"$VENV_PY" -m uvicorn server:app --reload --host 0.0.0.0 --port $PORT
+# Trust X-Forwarded-For only from these proxy addresses (client IPs drive the inquiry rate limits)
+FORWARDED_ALLOW_IPS=${FORWARDED_ALLOW_IPS:-127.0.0.1}
+"$VENV_PY" -m uvicorn server:app --reload --host 0.0.0.0 --port $PORT --proxy-headers --forwarded-allow-ips "$FORWARDED_ALLOW_IPS"
 
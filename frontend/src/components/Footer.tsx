@@ -15,7 +15,7 @@ import {
   Share2,
   LucideIcon,
 } from 'lucide-react';
-import { getSocialMediaInfo, type SocialMediaLink } from '../utils/api';
+import { loadSiteBootstrap, type SocialMediaLink } from '../utils/api';
 
 // Icon mapping for dynamic icon rendering
 const iconMap: Record<string, LucideIcon> = {
@@ -38,8 +38,8 @@ const Footer: React.FC = () => {
   useEffect(() => {
     const fetchSocialLinks = async () => {
       try {
-        const response = await getSocialMediaInfo();
-        setSocialLinks(response.data.links || []);
+        const bootstrap = await loadSiteBootstrap();
+        setSocialLinks(bootstrap.social_media_info.links || []);
       } catch (error) {
         console.error('Failed to fetch social media links:', error);
         // Fallback to empty array on error
@@ -3,7 +3,7 @@ import { motion } from 'framer-motion';
 import { Target, Eye, Award } from 'lucide-react';
 import Navbar from '../components/Navbar';
 import Footer from '../components/Footer';
-import { getCompanyInfo, type CompanyInfo } from '../utils/api';
+import { loadSiteBootstrap, type CompanyInfo } from '../utils/api';
 
 const About: React.FC = () => {
   const [companyInfo, setCompanyInfo] = useState<CompanyInfo | null>(null);
@@ -14,8 +14,8 @@ const About: React.FC = () => {
 
   const fetchCompanyInfo = async () => {
     try {
-      const response = await getCompanyInfo();
-      setCompanyInfo(response.data);
+      const bootstrap = await loadSiteBootstrap();
+      setCompanyInfo(bootstrap.company_info);
     } catch (error) {
       console.error('Error fetching company info:', error);
     }
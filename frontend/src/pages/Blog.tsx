@@ -88,7 +88,7 @@ const Blog: React.FC = () => {
                           </span>
                           <span className="flex items-center space-x-1">
                             <Clock className="w-4 h-4" />
-                            <span>5 min read</span>
+                            <span>{blog.reading_time_minutes || 1} min read</span>
                           </span>
                         </div>
                         <h3 className="text-xl font-bold text-gray-900 mb-2 group-hover:text-coral-600 transition-colors">
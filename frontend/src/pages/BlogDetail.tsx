@@ -92,7 +92,7 @@ const BlogDetail: React.FC = () => {
               </span>
               <span className="flex items-center space-x-2">
                 <Clock className="w-4 h-4" />
-                <span>5 min read</span>
+                <span>{blog.reading_time_minutes || 1} min read</span>
               </span>
             </div>
 
@@ -104,10 +104,24 @@ const BlogDetail: React.FC = () => {
               {blog.excerpt}
             </p>
 
+            {blog.toc?.length > 1 && (
+              <nav className="mb-8 p-5 bg-gray-50 rounded-xl border border-gray-100" data-testid="blog-toc">
+                <p className="font-semibold text-gray-900 mb-2">Contents</p>
+                <ul className="space-y-1 text-sm">
+                  {blog.toc.map((entry: { id: string; text: string; level: number }) => (
+                    <li key={entry.id} style={{ paddingLeft: `${(entry.level - 2) * 1}rem` }}>
+                      <a href={`#${entry.id}`} className="text-coral-600 hover:underline">{entry.text}</a>
+                    </li>
+                  ))}
+                </ul>
+              </nav>
+            )}
+
+            {/* content_html is sanitized server-side; older posts fall back to the raw content */}
             <div
               data-testid="blog-content"
               className="prose prose-lg max-w-none"
-              dangerouslySetInnerHTML={{ __html: blog.content }}
+              dangerouslySetInnerHTML={{ __html: blog.content_html ?? blog.content }}
             />
           </motion.div>
         </div>
@@ -3,7 +3,7 @@ import { motion } from 'framer-motion';
 import { ExternalLink } from 'lucide-react';
 import Navbar from '../components/Navbar';
 import Footer from '../components/Footer';
-import { getBrands } from '../utils/api';
+import { loadSiteBootstrap } from '../utils/api';
 
 const Brands: React.FC = () => {
   const [brands, setBrands] = useState<any[]>([]);
@@ -15,8 +15,8 @@ const Brands: React.FC = () => {
 
   const fetchBrands = async () => {
     try {
-      const response = await getBrands();
-      setBrands(response.data);
+      const bootstrap = await loadSiteBootstrap();
+      setBrands(bootstrap.brands);
     } catch (error) {
       console.error('Error fetching brands:', error);
     } finally {
@@ -92,11 +92,12 @@ const Catalogs: React.FC = () => {
                   className="group bg-white rounded-2xl shadow-lg hover:shadow-2xl transition-all overflow-hidden"
                 >
                   <div className="aspect-[4/3] bg-gradient-to-br from-coral-50 to-orange-50 flex items-center justify-center">
-                    {catalog.image_url ? (
+                    {catalog.image_url || catalog.pdf_preview_url ? (
                       <img
-                        src={catalog.image_url}
+                        src={catalog.image_url || catalog.pdf_preview_url}
                         alt={catalog.title}
-                        className="w-full h-full object-cover"
+                        loading="lazy"
+                        className={`w-full h-full ${catalog.image_url ? 'object-cover' : 'object-contain'}`}
                       />
                     ) : (
                       <FileText className="w-20 h-20 text-coral-300" />
@@ -117,7 +118,7 @@ const Catalogs: React.FC = () => {
                         className="inline-flex items-center space-x-2 text-coral-500 font-medium hover:text-coral-600 transition-colors"
                       >
                         <Download className="w-5 h-5" />
-                        <span>Download PDF</span>
+                        <span>Download PDF{catalog.pdf_page_count ? ` (${catalog.pdf_page_count} pages)` : ''}</span>
                       </a>
                     )}
                   </div>
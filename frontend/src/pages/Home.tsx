@@ -4,7 +4,7 @@ import { motion } from 'framer-motion';
 import { ArrowRight, Sparkles, Globe, Heart } from 'lucide-react';
 import Navbar from '../components/Navbar';
 import Footer from '../components/Footer';
-import { getBrands, type Brand } from '../utils/api';
+import { loadSiteBootstrap, type Brand } from '../utils/api';
 
 const Home: React.FC = () => {
   const [brands, setBrands] = useState<Brand[]>([]);
@@ -28,7 +28,7 @@ const Home: React.FC = () => {
     try {
       setLoading(true);
       console.log('🔄 Fetching brands from API...');
-      const response = await getBrands();
+      const response = { data: (await loadSiteBootstrap()).brands };
       console.log('✅ API Response received:', response);
       console.log('📦 Response data:', response.data);
       console.log('📦 Response data type:', typeof response.data);
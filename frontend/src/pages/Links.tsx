@@ -2,7 +2,7 @@ import React, { useState, useEffect } from 'react';
 import { Link } from 'react-router-dom';
 import { motion } from 'framer-motion';
 import { ArrowRight, Sparkles } from 'lucide-react';
-import { getLinkPages, type LinkPage } from '../utils/api';
+import { loadSiteBootstrap, type LinkPage } from '../utils/api';
 
 const Links: React.FC = () => {
   const [linkPages, setLinkPages] = useState<LinkPage[]>([]);
@@ -14,8 +14,8 @@ const Links: React.FC = () => {
 
   const fetchLinkPages = async () => {
     try {
-      const response = await getLinkPages();
-      setLinkPages(response.data);
+      const bootstrap = await loadSiteBootstrap();
+      setLinkPages(bootstrap.link_pages);
     } catch (error) {
       console.error('Failed to fetch link pages:', error);
     } finally {
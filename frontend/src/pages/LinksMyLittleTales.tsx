@@ -1,4 +1,4 @@
-import React, { useState, useEffect, useMemo, useCallback, lazy, Suspense } from 'react';
+import React, { useState, useEffect, useMemo, useCallback } from 'react';
 import { motion } from 'framer-motion';
 import { 
   Globe, 
@@ -10,10 +10,7 @@ import {
   QrCode
 } from 'lucide-react';
 import { Link, useParams } from 'react-router-dom';
-import { getLinkPageBySlug, type LinkPage } from '../utils/api';
-
-// Lazy load QR code component for better performance
-const QRCodeSVG = lazy(() => import('qrcode.react').then(m => ({ default: m.QRCodeSVG })));
+import { getLinkPageBySlug, getLinkPageQrCodeUrl, trackLinkPageEvent, type LinkPage } from '../utils/api';
 
 const LinksMyLittleTales: React.FC = () => {
   const { brandSlug } = useParams<{ brandSlug: string }>();
@@ -25,6 +22,7 @@ const LinksMyLittleTales: React.FC = () => {
       const slug = brandSlug || 'mylittletales';
       const response = await getLinkPageBySlug(slug);
       setLinkPage(response.data);
+      trackLinkPageEvent(slug, 'visit');
     } catch (error) {
       console.error('Failed to fetch link page:', error);
     } finally {
@@ -42,6 +40,7 @@ const LinksMyLittleTales: React.FC = () => {
     if (!linkPage) return [];
     return [
       linkPage.website_url && {
+        key: 'website',
         name: 'Website',
         url: linkPage.website_url,
         text: linkPage.website_text || 'Visit',
@@ -50,6 +49,7 @@ const LinksMyLittleTales: React.FC = () => {
         hoverColor: 'hover:from-blue-600 hover:to-blue-700',
       },
       linkPage.instagram_url && {
+        key: 'instagram',
         name: 'Instagram',
         url: linkPage.instagram_url,
         text: linkPage.instagram_text || 'Visit',
@@ -58,6 +58,7 @@ const LinksMyLittleTales: React.FC = () => {
         hoverColor: 'hover:from-purple-600 hover:via-pink-600 hover:to-orange-600',
       },
       linkPage.facebook_url && {
+        key: 'facebook',
         name: 'Facebook',
         url: linkPage.facebook_url,
         text: linkPage.facebook_text || 'Visit',
@@ -66,6 +67,7 @@ const LinksMyLittleTales: React.FC = () => {
         hoverColor: 'hover:from-blue-700 hover:to-blue-800',
       },
       linkPage.whatsapp_url && {
+        key: 'whatsapp',
         name: 'WhatsApp',
         url: linkPage.whatsapp_url,
         text: linkPage.whatsapp_text || 'Visit',
@@ -74,6 +76,7 @@ const LinksMyLittleTales: React.FC = () => {
         hoverColor: 'hover:from-green-600 hover:to-green-700',
       },
       linkPage.google_review_url && {
+        key: 'google_review',
         name: 'Google Review',
         url: linkPage.google_review_url,
         text: linkPage.google_review_text || 'Visit',
@@ -82,6 +85,7 @@ const LinksMyLittleTales: React.FC = () => {
         hoverColor: 'hover:from-yellow-600 hover:to-yellow-700',
       },
     ].filter(Boolean) as Array<{
+      key: string;
       name: string;
       url: string;
       text: string;
@@ -195,6 +199,7 @@ const LinksMyLittleTales: React.FC = () => {
                 href={link.url}
                 target="_blank"
                 rel="noopener noreferrer"
+                onClick={() => trackLinkPageEvent(linkPage.brand_slug, link.key)}
                 initial={{ opacity: 0 }}
                 animate={{ opacity: 1 }}
                 transition={{ delay: Math.min(index * 0.05, 0.3), duration: 0.3 }}
@@ -242,16 +247,15 @@ const LinksMyLittleTales: React.FC = () => {
               {qrCodes.map((qr, index) => (
                 <div key={index} className="text-center">
                   <div className="bg-white p-4 rounded-2xl border-2 border-gray-200 mb-3 flex items-center justify-center min-h-[148px]">
-                    <Suspense fallback={<div className="w-[120px] h-[120px] bg-gray-100 animate-pulse rounded" />}>
-                      <QRCodeSVG
-                        value={qr.url}
-                        size={120}
-                        level="M"
-                        includeMargin={false}
-                        bgColor="#FFFFFF"
-                        fgColor="#000000"
-                      />
-                    </Suspense>
+                    {/* Rendered and cached server-side */}
+                    <img
+                      src={getLinkPageQrCodeUrl(linkPage.brand_slug, index)}
+                      alt={`${qr.title} QR code`}
+                      width={120}
+                      height={120}
+                      loading="lazy"
+                      className="w-[120px] h-[120px] bg-gray-100 rounded"
+                    />
                   </div>
                   <h3 className="font-semibold text-gray-900 mb-1">
                     {qr.title}
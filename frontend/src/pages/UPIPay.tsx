@@ -1,6 +1,6 @@
 import React, { useState, useEffect } from 'react';
 import { Copy, Loader2 } from 'lucide-react';
-import { getUPIPaymentInfo, UPIPaymentInfo } from '../utils/api';
+import { loadSiteBootstrap, UPIPaymentInfo } from '../utils/api';
 import { motion } from 'framer-motion';
 import { useToast } from '../hooks/use-toast';
 
@@ -71,8 +71,8 @@ const UPIPay: React.FC = () => {
 
   const fetchUPIInfo = async () => {
     try {
-      const response = await getUPIPaymentInfo();
-      setUpiInfo(response.data);
+      const bootstrap = await loadSiteBootstrap();
+      setUpiInfo(bootstrap.upi_payment_info);
     } catch (error) {
       console.error('Failed to fetch UPI payment info:', error);
     } finally {
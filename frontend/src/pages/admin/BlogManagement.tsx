@@ -6,7 +6,7 @@ import { Textarea } from '../../components/ui/textarea';
 import { Label } from '../../components/ui/label';
 import { Dialog, DialogContent, DialogHeader, DialogTitle } from '../../components/ui/dialog';
 import { Table, TableBody, TableCell, TableHead, TableHeader, TableRow } from '../../components/ui/table';
-import { getBlogs, createBlog, updateBlog, deleteBlog } from '../../utils/api';
+import { getBlogs, createBlog, updateBlog, deleteBlog, isConflictError } from '../../utils/api';
 import { toast } from 'sonner';
 import { format } from 'date-fns';
 
@@ -49,7 +49,7 @@ const BlogManagement: React.FC = () => {
     try {
       const dataToSend = { ...formData, slug: formData.slug || generateSlug(formData.title) };
       if (editingBlog) {
-        await updateBlog(editingBlog.id, dataToSend);
+        await updateBlog(editingBlog.id, dataToSend, editingBlog.version);
         toast.success('Blog updated successfully');
       } else {
         await createBlog(dataToSend);
@@ -60,6 +60,12 @@ const BlogManagement: React.FC = () => {
       setFormData({ title: '', slug: '', excerpt: '', content: '', image_url: '', author: 'Miswa International', published: true });
       fetchBlogs();
     } catch (error) {
+      if (isConflictError(error)) {
+        toast.error('This item was changed by someone else. The latest version has been loaded.');
+        setShowDialog(false);
+        fetchBlogs();
+        return;
+      }
       toast.error('Failed to save blog');
     }
   };
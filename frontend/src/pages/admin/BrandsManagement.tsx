@@ -6,7 +6,7 @@ import { Textarea } from '../../components/ui/textarea';
 import { Label } from '../../components/ui/label';
 import { Dialog, DialogContent, DialogHeader, DialogTitle } from '../../components/ui/dialog';
 import { Table, TableBody, TableCell, TableHead, TableHeader, TableRow } from '../../components/ui/table';
-import { getBrands, createBrand, updateBrand, deleteBrand } from '../../utils/api';
+import { getBrands, createBrand, updateBrand, deleteBrand, isConflictError } from '../../utils/api';
 import { toast } from 'sonner';
 
 const BrandsManagement: React.FC = () => {
@@ -42,7 +42,7 @@ const BrandsManagement: React.FC = () => {
     e.preventDefault();
     try {
       if (editingBrand) {
-        await updateBrand(editingBrand.id, formData);
+        await updateBrand(editingBrand.id, formData, editingBrand.version);
         toast.success('Brand updated successfully');
       } else {
         await createBrand(formData);
@@ -53,6 +53,12 @@ const BrandsManagement: React.FC = () => {
       setFormData({ name: '', tagline: '', description: '', website: '', logo_url: '', image_url: '' });
       fetchBrands();
     } catch (error) {
+      if (isConflictError(error)) {
+        toast.error('This item was changed by someone else. The latest version has been loaded.');
+        setShowDialog(false);
+        fetchBrands();
+        return;
+      }
       toast.error('Failed to save brand');
     }
   };
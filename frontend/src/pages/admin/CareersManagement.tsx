@@ -6,7 +6,7 @@ import { Textarea } from '../../components/ui/textarea';
 import { Label } from '../../components/ui/label';
 import { Dialog, DialogContent, DialogHeader, DialogTitle } from '../../components/ui/dialog';
 import { Table, TableBody, TableCell, TableHead, TableHeader, TableRow } from '../../components/ui/table';
-import { getCareers, createCareer, updateCareer, deleteCareer } from '../../utils/api';
+import { getCareers, createCareer, updateCareer, deleteCareer, isConflictError } from '../../utils/api';
 import { toast } from 'sonner';
 import RichTextEditor from '../../components/ui/rich-text-editor';
 
@@ -49,7 +49,7 @@ const CareersManagement: React.FC = () => {
         requirements: formData.requirements, // Keep as HTML string
       };
       if (editingCareer) {
-        await updateCareer(editingCareer.id, dataToSend);
+        await updateCareer(editingCareer.id, dataToSend, editingCareer.version);
         toast.success('Career updated successfully');
       } else {
         await createCareer(dataToSend);
@@ -60,6 +60,12 @@ const CareersManagement: React.FC = () => {
       setFormData({ title: '', department: '', location: '', type: 'Full-time', description: '', requirements: '', active: true });
       fetchCareers();
     } catch (error) {
+      if (isConflictError(error)) {
+        toast.error('This item was changed by someone else. The latest version has been loaded.');
+        setShowDialog(false);
+        fetchCareers();
+        return;
+      }
       toast.error('Failed to save career');
     }
   };
@@ -6,7 +6,7 @@ import { Textarea } from '../../components/ui/textarea';
 import { Label } from '../../components/ui/label';
 import { Dialog, DialogContent, DialogHeader, DialogTitle } from '../../components/ui/dialog';
 import { Table, TableBody, TableCell, TableHead, TableHeader, TableRow } from '../../components/ui/table';
-import { getCatalogs, createCatalog, updateCatalog, deleteCatalog } from '../../utils/api';
+import { getCatalogs, createCatalog, updateCatalog, deleteCatalog, isConflictError } from '../../utils/api';
 import { toast } from 'sonner';
 
 const CatalogsManagement: React.FC = () => {
@@ -41,7 +41,7 @@ const CatalogsManagement: React.FC = () => {
     e.preventDefault();
     try {
       if (editingCatalog) {
-        await updateCatalog(editingCatalog.id, formData);
+        await updateCatalog(editingCatalog.id, formData, editingCatalog.version);
         toast.success('Catalog updated successfully');
       } else {
         await createCatalog(formData);
@@ -52,6 +52,12 @@ const CatalogsManagement: React.FC = () => {
       setFormData({ title: '', description: '', category: '', pdf_url: '', image_url: '' });
       fetchCatalogs();
     } catch (error) {
+      if (isConflictError(error)) {
+        toast.error('This item was changed by someone else. The latest version has been loaded.');
+        setShowDialog(false);
+        fetchCatalogs();
+        return;
+      }
       toast.error('Failed to save catalog');
     }
   };
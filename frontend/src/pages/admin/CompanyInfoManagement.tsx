@@ -4,12 +4,13 @@ import { Button } from '../../components/ui/button';
 import { Input } from '../../components/ui/input';
 import { Textarea } from '../../components/ui/textarea';
 import { Label } from '../../components/ui/label';
-import { getCompanyInfo, updateCompanyInfo } from '../../utils/api';
+import { getCompanyInfo, updateCompanyInfo, isConflictError } from '../../utils/api';
 import { toast } from 'sonner';
 
 const CompanyInfoManagement: React.FC = () => {
   const [loading, setLoading] = useState<boolean>(true);
   const [saving, setSaving] = useState<boolean>(false);
+  const [version, setVersion] = useState<number | undefined>(undefined);
   const [formData, setFormData] = useState({
     about: '',
     mission: '',
@@ -34,6 +35,7 @@ const CompanyInfoManagement: React.FC = () => {
         email: (response.data as any).email || response.data.contactEmail || '',
         address: response.data.address || '',
       });
+      setVersion(response.data.version);
     } catch (error) {
       toast.error('Failed to fetch company info');
     } finally {
@@ -49,10 +51,15 @@ const CompanyInfoManagement: React.FC = () => {
         ...formData,
         contactPhone: formData.phone,
         contactEmail: formData.email,
-      } as any);
+      } as any, version);
       toast.success('Company information updated successfully');
       fetchCompanyInfo();
     } catch (error) {
+      if (isConflictError(error)) {
+        toast.error('This item was changed by someone else. The latest version has been loaded.');
+        fetchCompanyInfo();
+        return;
+      }
       toast.error('Failed to update company info');
     } finally {
       setSaving(false);
@@ -6,7 +6,7 @@ import { Textarea } from '../../components/ui/textarea';
 import { Label } from '../../components/ui/label';
 import { Dialog, DialogContent, DialogHeader, DialogTitle } from '../../components/ui/dialog';
 import { Table, TableBody, TableCell, TableHead, TableHeader, TableRow } from '../../components/ui/table';
-import { getLinkPages, updateLinkPage, createLinkPage, type LinkPage } from '../../utils/api';
+import { getLinkPages, updateLinkPage, createLinkPage, type LinkPage, isConflictError } from '../../utils/api';
 import { toast } from 'sonner';
 
 const LinkPagesManagement: React.FC = () => {
@@ -61,7 +61,7 @@ const LinkPagesManagement: React.FC = () => {
       if (editingPage) {
         // Update existing page - exclude brand_slug from update payload
         const { brand_slug, ...updateData } = formData;
-        await updateLinkPage(editingPage.brand_slug, updateData);
+        await updateLinkPage(editingPage.brand_slug, updateData, editingPage.version);
         toast.success('Link page updated successfully');
       } else {
         // Create new page
@@ -100,6 +100,12 @@ const LinkPagesManagement: React.FC = () => {
       });
       fetchLinkPages();
     } catch (error) {
+      if (isConflictError(error)) {
+        toast.error('This item was changed by someone else. The latest version has been loaded.');
+        setShowDialog(false);
+        fetchLinkPages();
+        return;
+      }
       toast.error(editingPage ? 'Failed to update link page' : 'Failed to create link page');
     }
   };
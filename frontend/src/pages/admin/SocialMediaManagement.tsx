@@ -3,7 +3,7 @@ import { Plus, Trash2, Save, Edit2, X } from 'lucide-react';
 import { Button } from '../../components/ui/button';
 import { Input } from '../../components/ui/input';
 import { Label } from '../../components/ui/label';
-import { getSocialMediaInfo, updateSocialMediaInfo } from '../../utils/api';
+import { getSocialMediaInfo, updateSocialMediaInfo, isConflictError } from '../../utils/api';
 import { toast } from 'sonner';
 
 interface SocialMediaLink {
@@ -16,6 +16,7 @@ const SocialMediaManagement: React.FC = () => {
   const [loading, setLoading] = useState<boolean>(true);
   const [saving, setSaving] = useState<boolean>(false);
   const [links, setLinks] = useState<SocialMediaLink[]>([]);
+  const [version, setVersion] = useState<number | undefined>(undefined);
   const [editingIndex, setEditingIndex] = useState<number | null>(null);
   const [formData, setFormData] = useState<SocialMediaLink>({
     icon: 'Facebook',
@@ -46,6 +47,7 @@ const SocialMediaManagement: React.FC = () => {
     try {
       const response = await getSocialMediaInfo();
       setLinks(response.data.links || []);
+      setVersion(response.data.version);
     } catch (error) {
       toast.error('Failed to fetch social media links');
     } finally {
@@ -98,10 +100,15 @@ const SocialMediaManagement: React.FC = () => {
     e.preventDefault();
     setSaving(true);
     try {
-      await updateSocialMediaInfo({ links });
+      await updateSocialMediaInfo({ links }, version);
       toast.success('Social media links updated successfully');
       fetchSocialMediaInfo();
     } catch (error) {
+      if (isConflictError(error)) {
+        toast.error('This item was changed by someone else. The latest version has been loaded.');
+        fetchSocialMediaInfo();
+        return;
+      }
       toast.error('Failed to update social media links');
     } finally {
       setSaving(false);
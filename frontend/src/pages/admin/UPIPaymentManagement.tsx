@@ -4,7 +4,7 @@ import { Button } from '../../components/ui/button';
 import { Input } from '../../components/ui/input';
 import { Label } from '../../components/ui/label';
 import { Card, CardContent, CardDescription, CardHeader, CardTitle } from '../../components/ui/card';
-import { getUPIPaymentInfo, updateUPIPaymentInfo, uploadUPILogo, uploadUPIQRCode, UPIPaymentInfo } from '../../utils/api';
+import { getUPIPaymentInfo, updateUPIPaymentInfo, uploadUPILogo, uploadUPIQRCode, isConflictError, UPIPaymentInfo } from '../../utils/api';
 import { toast } from 'sonner';
 
 const UPIPaymentManagement: React.FC = () => {
@@ -102,10 +102,15 @@ const UPIPaymentManagement: React.FC = () => {
   const handleSubmit = async (e: React.FormEvent<HTMLFormElement>) => {
     e.preventDefault();
     try {
-      await updateUPIPaymentInfo(formData);
+      await updateUPIPaymentInfo(formData, formData.version);
       toast.success('UPI payment info updated successfully');
       fetchUPIInfo();
     } catch (error) {
+      if (isConflictError(error)) {
+        toast.error('This item was changed by someone else. The latest version has been loaded.');
+        fetchUPIInfo();
+        return;
+      }
       toast.error('Failed to update UPI payment info');
     }
   };
@@ -34,6 +34,11 @@ export const api: AxiosInstance = axios.create({
   },
 });
 
+// Optimistic concurrency: send back the version an edit started from so the server can reject
+// the save with 409 if someone else changed the item in the meantime
+const ifMatch = (version?: number) => (version === undefined ? undefined : { headers: { 'If-Match': `"${version}"` } });
+export const isConflictError = (error: any): boolean => error?.response?.status === 409;
+
 // Type definitions
 export interface Brand {
   id?: string;
@@ -46,6 +51,7 @@ export interface Brand {
   image_url?: string;
   website?: string;
   created_at?: string;
+  version?: number;
 }
 
 export interface Catalog {
@@ -55,6 +61,10 @@ export interface Catalog {
   fileUrl?: string;
   brandId?: string;
   createdAt?: string;
+  version?: number;
+  pdf_status?: 'pending' | 'ready' | 'failed' | null;
+  pdf_preview_url?: string | null;
+  pdf_page_count?: number | null;
 }
 
 export interface Blog {
@@ -69,6 +79,11 @@ export interface Blog {
   featuredImage?: string;
   createdAt?: string;
   updatedAt?: string;
+  version?: number;
+  content_html?: string;
+  toc?: { id: string; text: string; level: number }[];
+  word_count?: number;
+  reading_time_minutes?: number;
 }
 
 export interface Career {
@@ -82,6 +97,7 @@ export interface Career {
   isActive?: boolean;
   active?: boolean; // Some endpoints use 'active' instead of 'isActive'
   createdAt?: string;
+  version?: number;
 }
 
 export interface Inquiry {
@@ -108,31 +124,40 @@ export interface CompanyInfo {
   contactEmail?: string;
   contactPhone?: string;
   address?: string;
+  version?: number;
 }
 
 // Brands
 export const getBrands = (): Promise<AxiosResponse<Brand[]>> => api.get('/brands');
 export const createBrand = (data: Brand): Promise<AxiosResponse<Brand>> => api.post('/brands', data);
-export const updateBrand = (id: string, data: Partial<Brand>): Promise<AxiosResponse<Brand>> => api.put(`/brands/${id}`, data);
+export const updateBrand = (id: string, data: Partial<Brand>, version?: number): Promise<AxiosResponse<Brand>> => api.put(`/brands/${id}`, data, ifMatch(version));
 export const deleteBrand = (id: string): Promise<AxiosResponse<void>> => api.delete(`/brands/${id}`);
 
 // Catalogs
-export const getCatalogs = (): Promise<AxiosResponse<Catalog[]>> => api.get('/catalogs');
+export const getCatalogs = (): Promise<AxiosResponse<Catalog[]>> => api.get('/catalogs').then(response => {
+  // Generated PDF previews are served by the backend; convert relative URLs to absolute URLs
+  response.data.forEach((catalog: Catalog) => {
+    if (catalog.pdf_preview_url && catalog.pdf_preview_url.startsWith('/')) {
+      catalog.pdf_preview_url = `${BACKEND_URL}${catalog.pdf_preview_url}`;
+    }
+  });
+  return response;
+});
 export const createCatalog = (data: Partial<Catalog>): Promise<AxiosResponse<Catalog>> => api.post('/catalogs', data);
-export const updateCatalog = (id: string, data: Partial<Catalog>): Promise<AxiosResponse<Catalog>> => api.put(`/catalogs/${id}`, data);
+export const updateCatalog = (id: string, data: Partial<Catalog>, version?: number): Promise<AxiosResponse<Catalog>> => api.put(`/catalogs/${id}`, data, ifMatch(version));
 export const deleteCatalog = (id: string): Promise<AxiosResponse<void>> => api.delete(`/catalogs/${id}`);
 
 // Blogs
 export const getBlogs = (publishedOnly: boolean = true): Promise<AxiosResponse<Blog[]>> => api.get(`/blogs?published_only=${publishedOnly}`);
 export const getBlogBySlug = (slug: string): Promise<AxiosResponse<Blog>> => api.get(`/blogs/${slug}`);
 export const createBlog = (data: Partial<Blog>): Promise<AxiosResponse<Blog>> => api.post('/blogs', data);
-export const updateBlog = (id: string, data: Partial<Blog>): Promise<AxiosResponse<Blog>> => api.put(`/blogs/${id}`, data);
+export const updateBlog = (id: string, data: Partial<Blog>, version?: number): Promise<AxiosResponse<Blog>> => api.put(`/blogs/${id}`, data, ifMatch(version));
 export const deleteBlog = (id: string): Promise<AxiosResponse<void>> => api.delete(`/blogs/${id}`);
 
 // Careers
 export const getCareers = (activeOnly: boolean = true): Promise<AxiosResponse<Career[]>> => api.get(`/careers?active_only=${activeOnly}`);
 export const createCareer = (data: Partial<Career>): Promise<AxiosResponse<Career>> => api.post('/careers', data);
-export const updateCareer = (id: string, data: Partial<Career>): Promise<AxiosResponse<Career>> => api.put(`/careers/${id}`, data);
+export const updateCareer = (id: string, data: Partial<Career>, version?: number): Promise<AxiosResponse<Career>> => api.put(`/careers/${id}`, data, ifMatch(version));
 export const deleteCareer = (id: string): Promise<AxiosResponse<void>> => api.delete(`/careers/${id}`);
 
 // Inquiries
@@ -160,7 +185,7 @@ export const downloadCV = (inquiryId: string): string => `${API}/inquiries/${inq
 
 // Company Info
 export const getCompanyInfo = (): Promise<AxiosResponse<CompanyInfo>> => api.get('/company-info');
-export const updateCompanyInfo = (data: Partial<CompanyInfo>): Promise<AxiosResponse<CompanyInfo>> => api.put('/company-info', data);
+export const updateCompanyInfo = (data: Partial<CompanyInfo>, version?: number): Promise<AxiosResponse<CompanyInfo>> => api.put('/company-info', data, ifMatch(version));
 
 // MyLittleTales Products
 export const getMyLittleTalesProducts = (): Promise<AxiosResponse<any[]>> => api.get('/mylittletales/products');
@@ -195,13 +220,26 @@ export interface LinkPage {
   background_image_url?: string;
   created_at?: string;
   updated_at?: string;
+  version?: number;
 }
 
 export const getLinkPages = (): Promise<AxiosResponse<LinkPage[]>> => api.get('/link-pages');
 export const getLinkPageBySlug = (brandSlug: string): Promise<AxiosResponse<LinkPage>> => api.get(`/link-pages/${brandSlug}`);
 export const createLinkPage = (data: Partial<LinkPage>): Promise<AxiosResponse<LinkPage>> => api.post('/link-pages', data);
-export const updateLinkPage = (brandSlug: string, data: Partial<LinkPage>): Promise<AxiosResponse<LinkPage>> => api.put(`/link-pages/${brandSlug}`, data);
+export const updateLinkPage = (brandSlug: string, data: Partial<LinkPage>, version?: number): Promise<AxiosResponse<LinkPage>> => api.put(`/link-pages/${brandSlug}`, data, ifMatch(version));
 export const deleteLinkPage = (brandSlug: string): Promise<AxiosResponse<void>> => api.delete(`/link-pages/${brandSlug}`);
+// Fire-and-forget visit/click tracking; never blocks navigation
+export const trackLinkPageEvent = (brandSlug: string, link: string): void => {
+  const url = `${API}/link-pages/${brandSlug}/track?link=${encodeURIComponent(link)}`;
+  try {
+    if (typeof navigator !== 'undefined' && navigator.sendBeacon && navigator.sendBeacon(url)) return;
+    fetch(url, { method: 'POST', keepalive: true }).catch(() => {});
+  } catch {
+    // Analytics must never break the page
+  }
+};
+export const getLinkPageQrCodeUrl = (brandSlug: string, index: number, size: number = 256, format: 'png' | 'svg' = 'svg'): string =>
+  `${API}/link-pages/${brandSlug}/qr/${index}?size=${size}&format=${format}`;
 
 // UPI Payment Info
 export interface UPIPaymentInfo {
@@ -213,10 +251,11 @@ export interface UPIPaymentInfo {
   qr_code_url: string;
   logo_url?: string;
   updated_at?: string;
+  version?: number;
 }
 
 export const getUPIPaymentInfo = (): Promise<AxiosResponse<UPIPaymentInfo>> => api.get('/upi-payment-info');
-export const updateUPIPaymentInfo = (data: Partial<UPIPaymentInfo>): Promise<AxiosResponse<UPIPaymentInfo>> => api.put('/upi-payment-info', data);
+export const updateUPIPaymentInfo = (data: Partial<UPIPaymentInfo>, version?: number): Promise<AxiosResponse<UPIPaymentInfo>> => api.put('/upi-payment-info', data, ifMatch(version));
 export const uploadUPILogo = (file: File): Promise<AxiosResponse<{ url: string; filename: string }>> => {
   const formData = new FormData();
   formData.append('file', file);
@@ -276,6 +315,161 @@ export const listUploadedFiles = (): Promise<AxiosResponse<UploadedFileItem[]>>
 export const deleteUploadedFile = (category: UploadedFileItem['category'], filename: string): Promise<AxiosResponse<{ success: boolean }>> =>
   api.delete('/files', { data: { category, filename } });
 
+// Bulk admin operations
+export interface BulkItemResult {
+  id: string;
+  status: 'ok' | 'not_found' | 'conflict' | 'invalid' | 'error';
+  detail?: string | null;
+}
+
+export interface BulkResult {
+  requested: number;
+  succeeded: number;
+  results: BulkItemResult[];
+}
+
+export interface CatalogBulkUpdateItem {
+  id: string;
+  version?: number;
+  title?: string;
+  description?: string;
+  category?: string;
+  pdf_url?: string;
+  image_url?: string;
+}
+
+export const bulkDeleteInquiries = (ids: string[]): Promise<AxiosResponse<BulkResult>> => api.post('/inquiries/bulk-delete', { ids });
+export const bulkDeleteCareers = (ids: string[]): Promise<AxiosResponse<BulkResult>> => api.post('/careers/bulk-delete', { ids });
+export const bulkSetCareersActive = (ids: string[], active: boolean): Promise<AxiosResponse<BulkResult>> =>
+  api.post('/careers/bulk-activate', { ids, active });
+export const bulkSetBlogsPublished = (ids: string[], published: boolean): Promise<AxiosResponse<BulkResult>> =>
+  api.post('/blogs/bulk-publish', { ids, published });
+export const bulkUpdateCatalogs = (items: CatalogBulkUpdateItem[]): Promise<AxiosResponse<BulkResult>> =>
+  api.post('/catalogs/bulk-update', { items });
+export const bulkDeleteUploadedFiles = (
+  files: Array<{ category: UploadedFileItem['category']; filename: string }>
+): Promise<AxiosResponse<BulkResult>> => api.post('/files/bulk-delete', { files });
+
+// Inquiry archive (inquiries older than the archive age, with their CVs)
+export interface ArchivedInquiry extends Inquiry {
+  part: string;
+  cv_archived: boolean;
+}
+
+export interface ArchiveSearchResults {
+  results: ArchivedInquiry[];
+  scanned_parts: number;
+  truncated: boolean;
+}
+
+export const searchInquiryArchive = (params: {
+  q?: string;
+  email?: string;
+  inquiry_type?: string;
+  date_from?: string; // ISO prefix, e.g. 2024-03 or 2024-03-15
+  date_to?: string;
+  limit?: number;
+}): Promise<AxiosResponse<ArchiveSearchResults>> => api.get('/admin/archive/inquiries', { params });
+export const restoreArchivedInquiries = (ids: string[], part?: string): Promise<AxiosResponse<BulkResult>> =>
+  api.post('/admin/archive/inquiries/restore', { ids, part });
+
+// Content import (CSV with a header row, or NDJSON); the file is sent as the raw request body
+export interface ImportProgress {
+  id: string;
+  kind: 'blogs' | 'careers' | 'catalogs';
+  format: 'csv' | 'ndjson';
+  status: 'running' | 'completed' | 'failed';
+  processed: number;
+  inserted: number;
+  updated: number;
+  failed: number;
+  errors: Array<{ row: number; errors: string[] }>;
+  detail?: string | null;
+  started_at: string;
+  finished_at?: string | null;
+}
+
+export const importContent = (kind: ImportProgress['kind'], file: File): Promise<AxiosResponse<ImportProgress>> => {
+  const isNdjson = /\.(ndjson|jsonl)$/i.test(file.name);
+  return api.post(`/admin/import/${kind}`, file, {
+    headers: { 'Content-Type': isNdjson ? 'application/x-ndjson' : 'text/csv' },
+  });
+};
+export const listImports = (): Promise<AxiosResponse<ImportProgress[]>> => api.get('/admin/imports');
+
+// Full-site snapshot (.tar.gz of every content collection plus the upload files they reference)
+export interface SnapshotImportResult {
+  collections: Record<string, number>;
+  pruned: Record<string, number>;
+  files: number;
+  skipped: number;
+  duration_seconds: number;
+}
+
+export const exportSiteSnapshot = (includeFiles = true): Promise<AxiosResponse<Blob>> =>
+  api.get('/admin/snapshot', { params: { include_files: includeFiles }, responseType: 'blob' });
+// prune deletes documents that are not in the snapshot, making this site an exact copy of the source
+export const importSiteSnapshot = (file: File, prune = false): Promise<AxiosResponse<SnapshotImportResult>> =>
+  api.post('/admin/snapshot/import', file, { params: { prune }, headers: { 'Content-Type': 'application/gzip' } });
+
+// Search
+export interface SearchHit {
+  kind: 'blogs' | 'careers' | 'catalogs';
+  id: string;
+  slug?: string | null;
+  title: string;
+  title_html: string; // escaped, matches wrapped in <mark>
+  snippet_html: string; // escaped, matches wrapped in <mark>
+  score: number;
+}
+
+export interface SearchResults {
+  query: string;
+  total: number;
+  page: number;
+  limit: number;
+  results: SearchHit[];
+}
+
+export const searchSite = (
+  q: string,
+  options: { types?: SearchHit['kind'][]; page?: number; limit?: number } = {}
+): Promise<AxiosResponse<SearchResults>> =>
+  api.get('/search', { params: { q, types: options.types?.join(','), page: options.page, limit: options.limit } });
+
+// Background jobs
+export interface JobRun {
+  id: string;
+  job: string;
+  instance: string;
+  started_at: string;
+  finished_at: string;
+  duration_seconds: number;
+  status: 'ok' | 'failed' | 'timeout';
+  error?: string | null;
+  result?: Record<string, unknown> | null;
+}
+
+export interface JobStatus {
+  name: string;
+  description: string;
+  schedule: string; // 'every 6h', a cron expression, or 'startup'
+  timeout_seconds: number;
+  jitter_seconds: number;
+  next_run_at?: string | null;
+  running_on?: string | null;
+  last_run?: JobRun | null;
+  failures: number;
+  avg_duration_seconds?: number | null;
+  max_duration_seconds?: number | null;
+  recent_runs: JobRun[];
+}
+
+export const getJobStatus = (history?: number): Promise<AxiosResponse<JobStatus[]>> =>
+  api.get('/admin/jobs', { params: { history } });
+export const runJob = (name: string): Promise<AxiosResponse<{ message: string }>> =>
+  api.post(`/admin/jobs/${encodeURIComponent(name)}/run`);
+
 // Social Media Info
 export interface SocialMediaLink {
   icon: string;
@@ -287,10 +481,36 @@ export interface SocialMediaInfo {
   id?: string;
   links: SocialMediaLink[];
   updated_at?: string;
+  version?: number;
 }
 
 export const getSocialMediaInfo = (): Promise<AxiosResponse<SocialMediaInfo>> => api.get('/social-media-info');
-export const updateSocialMediaInfo = (data: Partial<SocialMediaInfo>): Promise<AxiosResponse<SocialMediaInfo>> => api.put('/social-media-info', data);
+export const updateSocialMediaInfo = (data: Partial<SocialMediaInfo>, version?: number): Promise<AxiosResponse<SocialMediaInfo>> => api.put('/social-media-info', data, ifMatch(version));
+
+// Site Bootstrap
+export interface SiteBootstrap {
+  brands: Brand[];
+  company_info: CompanyInfo;
+  social_media_info: SocialMediaInfo;
+  upi_payment_info: UPIPaymentInfo;
+  link_pages: LinkPage[];
+}
+
+export const getSiteBootstrap = (): Promise<AxiosResponse<SiteBootstrap>> => api.get('/site-bootstrap');
+
+// Public pages share one bootstrap request per page load instead of fetching each resource separately
+let siteBootstrapRequest: Promise<SiteBootstrap> | null = null;
+export const loadSiteBootstrap = (): Promise<SiteBootstrap> => {
+  if (!siteBootstrapRequest) {
+    siteBootstrapRequest = getSiteBootstrap()
+      .then((response) => response.data)
+      .catch((error) => {
+        siteBootstrapRequest = null;
+        throw error;
+      });
+  }
+  return siteBootstrapRequest;
+};
 
 // Authentication
 export interface LoginRequest {